@@ -0,0 +1,124 @@
+# allocation_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Microbenchmark for the size, allocation rate and attribute access time of
+`Notification` and `Observer`.
+
+Compares the slotted classes against the previous dictionary-backed
+implementations, reproduced below as `DictNotification` and
+`DictObserver`.
+
+Run with::
+
+    python benchmarks/allocation_benchmark.py
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from puremvc.interfaces import INotification
+from puremvc.patterns.observer import Notification, Observer
+
+COUNT = 100_000
+ITERATIONS = 1_000_000
+
+
+class DictNotification:
+    """The `Notification` layout before `__slots__`."""
+
+    def __init__(self, name: str, body: Any = None, type: Optional[str] = None) -> None:
+        self._name = name
+        self._body = body
+        self._type = type
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def body(self) -> Any:
+        return self._body
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._type
+
+
+class DictObserver:
+    """The `Observer` fields, stored in an instance dictionary."""
+
+    def __init__(self, notify_method: Optional[Callable[[INotification], None]] = None,
+                 notify_context: object = None) -> None:
+        self._weak = False
+        self._notify_method = notify_method
+        self._notify_method_ref = None
+        self._notify_context = notify_context
+        self._notify_context_ref = None
+        self._notify_type = None
+        self._predicate = None
+        self._rejections = 0
+        self._priority = 0
+        self._max_calls = None
+        self._remaining = None
+        self._remaining_lock = None
+
+
+def size_of(instance: object) -> int:
+    """
+    Return the shallow size of an instance, including its attribute dictionary.
+
+    Reading `__dict__` materializes the dictionary on Python 3.11 and later,
+    which otherwise keeps attribute values inline until it is requested, so
+    the traced allocation is the more faithful figure there.
+    """
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def traced_bytes(factory: Callable[[], object]) -> float:
+    """Return the mean traced memory allocated per live instance."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / COUNT
+
+
+def allocation_ns(factory: Callable[[], object]) -> float:
+    """Return the mean time to allocate and release one instance in nanoseconds."""
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        factory()
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def access_ns(note: Any) -> float:
+    """Return the mean time to read `name`, `body` and `type` in nanoseconds."""
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        note.name, note.body, note.type
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def report(label: str, factory: Callable[[], object]) -> None:
+    print(f"{label:18} getsizeof {size_of(factory()):4d} B   "
+          f"tracemalloc {traced_bytes(factory):6.1f} B   allocation {allocation_ns(factory):6.1f} ns")
+
+
+if __name__ == "__main__":
+    report("DictNotification", lambda: DictNotification("note", 1, "type"))
+    report("Notification", lambda: Notification("note", 1, "type"))
+    report("DictObserver", lambda: DictObserver(print, None))
+    report("Observer", lambda: Observer(print, None))
+    print(f"{'DictNotification':18} name/body/type access {access_ns(DictNotification('note', 1, 'type')):6.1f} ns")
+    print(f"{'Notification':18} name/body/type access {access_ns(Notification('note', 1, 'type')):6.1f} ns")
@@ -0,0 +1,78 @@
+# bootstrap_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Microbenchmark for bootstrapping a core.
+
+Registers `COUNT` commands, `COUNT` proxies and `COUNT` mediators, with two
+interests each, through a new `Facade`, one registration at a time and
+then with the bulk `register_commands`, `register_proxies` and
+`register_mediators`.
+
+Run with::
+
+    python benchmarks/bootstrap_benchmark.py
+"""
+
+import time
+from typing import Callable, List
+
+from puremvc.interfaces import IFacade, INotification
+from puremvc.patterns.command import SimpleCommand
+from puremvc.patterns.facade import Facade
+from puremvc.patterns.mediator import Mediator
+from puremvc.patterns.proxy import Proxy
+
+COUNT = 500
+REPEAT = 20
+
+
+class BenchCommand(SimpleCommand):
+    def execute(self, notification: INotification) -> None:
+        pass
+
+
+class BenchMediator(Mediator):
+    def __init__(self, index: int) -> None:
+        super().__init__(f"BenchMediator{index}")
+        self.index = index
+
+    def list_notification_interests(self) -> List[str]:
+        return [f"benchmark.view.{self.index}", "benchmark.view.shared"]
+
+
+def one_by_one(facade: IFacade) -> None:
+    for i in range(COUNT):
+        facade.register_command(f"benchmark.command.{i}", BenchCommand)
+    for i in range(COUNT):
+        facade.register_proxy(Proxy(f"BenchProxy{i}"))
+    for i in range(COUNT):
+        facade.register_mediator(BenchMediator(i))
+
+
+def bulk(facade: IFacade) -> None:
+    facade.register_commands({f"benchmark.command.{i}": BenchCommand for i in range(COUNT)})
+    facade.register_proxies(Proxy(f"BenchProxy{i}") for i in range(COUNT))
+    facade.register_mediators(BenchMediator(i) for i in range(COUNT))
+
+
+def measure(bootstrap: Callable[[IFacade], None]) -> float:
+    """Return the best time to bootstrap a new core, in milliseconds."""
+    best = float("inf")
+    for i in range(REPEAT):
+        key = f"BootstrapBenchmark{i}"
+        facade = Facade.get_instance(key, lambda k: Facade(k))
+        start = time.perf_counter_ns()
+        bootstrap(facade)
+        best = min(best, (time.perf_counter_ns() - start) / 1_000_000)
+        Facade.remove_core(key)
+    return best
+
+
+if __name__ == "__main__":
+    print(f"{COUNT} commands, proxies and mediators")
+    print(f"one by one  {measure(one_by_one):7.2f} ms")
+    print(f"bulk        {measure(bulk):7.2f} ms")
@@ -0,0 +1,59 @@
+# command_reuse_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Microbenchmark for reused command instances.
+
+Dispatches a notification handled by a stateless `SimpleCommand`, with a
+new instance per notification and with an instance reused through each
+of the `Controller` reuse modes, and reports commands per second.
+
+Run with::
+
+    python benchmarks/command_reuse_benchmark.py
+"""
+
+import time
+from typing import Optional
+
+from puremvc.core import Controller, View
+from puremvc.interfaces import INotification
+from puremvc.patterns.command import SimpleCommand
+from puremvc.patterns.observer import Notification
+
+ITERATIONS = 200_000
+REPEAT = 5
+
+
+class BenchCommand(SimpleCommand):
+    def execute(self, notification: INotification) -> None:
+        pass
+
+
+def measure(key: str, reuse: Optional[str]) -> float:
+    """Return the best rate of commands executed per second, over `REPEAT` runs."""
+    controller = Controller.get_instance(key, lambda k: Controller(k))
+    view = View.get_instance(key, lambda k: View(k))
+    controller.register_command("benchmark.reuse", BenchCommand, reuse)
+    note = Notification("benchmark.reuse")
+    notify = view.notify_observers
+    best = 0.0
+    for _ in range(REPEAT):
+        start = time.perf_counter_ns()
+        for _ in range(ITERATIONS):
+            notify(note)
+        best = max(best, ITERATIONS / (time.perf_counter_ns() - start) * 1_000_000_000)
+    View.remove_view(key)
+    Controller.remove_controller(key)
+    return best
+
+
+if __name__ == "__main__":
+    fresh = measure("CommandReuseBenchmark1", None)
+    print(f"fresh      {fresh:12,.0f} commands/s")
+    for index, reuse in enumerate([Controller.REUSE_SINGLETON, Controller.REUSE_THREAD], 2):
+        rate = measure(f"CommandReuseBenchmark{index}", reuse)
+        print(f"{reuse:10} {rate:12,.0f} commands/s   x{rate / fresh:.2f}")
@@ -0,0 +1,117 @@
+# dispatch_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Microbenchmark for `View.notify_observers`.
+
+Compares the compiled per-name route against the previous dispatch path,
+which copied the observer list under the observer map lock, called
+`Observer.notify_observer` for each entry and, for commands, resolved the
+factory a second time in `Controller.execute_command`.
+
+Run with::
+
+    python benchmarks/dispatch_benchmark.py
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+from puremvc.core import Controller, View
+from puremvc.interfaces import INotification, IObserver
+from puremvc.patterns.command import SimpleCommand
+from puremvc.patterns.mediator import Mediator
+from puremvc.patterns.observer import Notification, Observer
+
+NOTE = "benchmark.dispatch.note"
+ITERATIONS = 200_000
+
+
+def stack_depth() -> int:
+    """Return the number of frames on the caller's stack."""
+    frame, depth = sys._getframe(1), 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class Probe:
+    """Records the stack depth at which each handler is reached."""
+    depth: Dict[str, int] = dict()
+
+
+class BenchCommand(SimpleCommand):
+    def execute(self, notification: INotification) -> None:
+        if notification.body:
+            Probe.depth["command"] = stack_depth()
+
+
+class BenchMediator(Mediator):
+    NAME = "BenchMediator"
+
+    def list_notification_interests(self) -> List[str]:
+        return [NOTE]
+
+    def handle_notification(self, notification: INotification) -> None:
+        if notification.body:
+            Probe.depth["mediator"] = stack_depth()
+
+
+def legacy_dispatch(lock: threading.Lock, observer_map: Dict[str, List[IObserver]],
+                    notification: INotification) -> None:
+    """The dispatch loop `View.notify_observers` used before compiled routes."""
+    with lock:
+        observers = list(observer_map.get(notification.name) or [])
+    for observer in observers:
+        observer.notify_observer(notification)
+
+
+def measure(dispatch: Callable[[INotification], None]) -> float:
+    """Return the mean cost of one dispatch in nanoseconds."""
+    note = Notification(NOTE)
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        dispatch(note)
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def depth(dispatch: Callable[[INotification], None], extra: int) -> str:
+    """Return the number of frames between the dispatch call and each handler."""
+    Probe.depth.clear()
+    base = stack_depth() + extra
+    dispatch(Notification(NOTE, True))
+    return ", ".join(f"{name} {frames - base - 1}" for name, frames in sorted(Probe.depth.items()))
+
+
+def run(key: str, with_mediator: bool) -> None:
+    controller = Controller.get_instance(key, lambda k: Controller(k))
+    view = View.get_instance(key, lambda k: View(k))
+    controller.register_command(NOTE, lambda: BenchCommand())
+
+    legacy_lock = threading.Lock()
+    legacy_map: Dict[str, List[IObserver]] = {NOTE: [Observer(controller.execute_command, controller)]}
+    if with_mediator:
+        mediator = BenchMediator()
+        view.register_mediator(mediator)
+        legacy_map[NOTE].append(Observer(mediator.handle_notification, mediator))
+
+    label = "mediator + command" if with_mediator else "command only"
+    for name, dispatch in (("before", lambda n: legacy_dispatch(legacy_lock, legacy_map, n)),
+                           ("after", view.notify_observers)):
+        # the legacy lambda adds one frame of its own, discount it
+        frames = depth(dispatch, 1 if name == "before" else 0)
+        print(f"{label:20} {name:7} {measure(dispatch):8.1f} ns/dispatch   depth: {frames}")
+
+    View.remove_view(key)
+    Controller.remove_controller(key)
+
+
+if __name__ == "__main__":
+    run("DispatchBenchmark1", with_mediator=False)
+    run("DispatchBenchmark2", with_mediator=True)
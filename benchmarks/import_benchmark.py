@@ -0,0 +1,72 @@
+# import_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Benchmark and guard for the import cost of each public entry point.
+
+Imports each entry point in a fresh interpreter with `python -X importtime`,
+and reports the number of `puremvc` modules loaded and the time spent
+importing them. Exits with a non-zero status if an entry point loads more
+modules than its budget in `BUDGET`, so it can run as a CI step.
+
+Run with::
+
+    python benchmarks/import_benchmark.py
+"""
+
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPEAT = 5
+
+"""BUDGET (Dict[str, int]): Maximum number of puremvc modules loaded by each entry point"""
+BUDGET: Dict[str, int] = {
+    "puremvc.interfaces:INotification": 3,
+    "puremvc.patterns.observer:Notification": 5,
+    "puremvc.patterns.observer:Observer": 6,
+    "puremvc.patterns.proxy:Proxy": 10,
+    "puremvc.patterns.mediator:Mediator": 10,
+    "puremvc.patterns.command:SimpleCommand": 9,
+    "puremvc.patterns.command:MacroCommand": 10,
+    "puremvc.core:Model": 6,
+    "puremvc.core:View": 10,
+    "puremvc.core:Controller": 12,
+    "puremvc.patterns.facade:Facade": 14,
+}
+
+
+def import_time(entry_point: str) -> Tuple[List[str], int]:
+    """
+    Import an entry point in a fresh interpreter.
+
+    :param entry_point: A `module:attribute` entry point.
+    :return: The `puremvc` modules loaded, and the microseconds spent importing them.
+    """
+    module, _, attribute = entry_point.partition(":")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"from {module} import {attribute}"],
+                            capture_output=True, text=True, check=True)
+    modules, total = [], 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[2].strip().startswith("puremvc"):
+            continue
+        modules.append(fields[2].strip())
+        total += int(fields[0].split(":")[1])
+    return modules, total
+
+
+if __name__ == "__main__":
+    failures = 0
+    for entry_point, budget in BUDGET.items():
+        runs = [import_time(entry_point) for _ in range(REPEAT)]
+        modules = runs[0][0]
+        best = min(total for _, total in runs)
+        status = "ok" if len(modules) <= budget else "OVER BUDGET"
+        failures += status != "ok"
+        print(f"{entry_point:42} {len(modules):3d} modules (budget {budget:3d})   {best:6d} us   {status}")
+    sys.exit(1 if failures else 0)
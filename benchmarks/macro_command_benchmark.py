@@ -0,0 +1,80 @@
+# macro_command_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Microbenchmark for `MacroCommand` execution plans.
+
+Executes a new `MacroCommand` of `STEPS` trivial `SubCommands` per
+notification, for a large and a small macro, with the plan compiled once
+per class (`COMPILE_PLAN = True`), against the previous execution, which called
+`initialize_macro_command` and consumed the list with `pop(0)` every time.
+
+Run with::
+
+    python benchmarks/macro_command_benchmark.py
+"""
+
+import time
+from typing import Type
+
+from puremvc.interfaces import INotification
+from puremvc.patterns.command import MacroCommand, SimpleCommand
+from puremvc.patterns.observer import Notification
+
+KEY = "MacroCommandBenchmark"
+REPEAT = 5
+
+
+class BenchCommand(SimpleCommand):
+    def execute(self, notification: INotification) -> None:
+        pass
+
+
+def macro(steps: int) -> Type[MacroCommand]:
+    """Return a new MacroCommand class with `steps` SubCommands."""
+    class BenchMacroCommand(MacroCommand):
+        COMPILE_PLAN = True
+
+        def initialize_macro_command(self) -> None:
+            for _ in range(steps):
+                self.add_subcommand(BenchCommand)
+
+    return BenchMacroCommand
+
+
+def legacy(steps: int) -> Type[MacroCommand]:
+    """Return a new MacroCommand class with `steps` SubCommands, executed as before plans."""
+    class LegacyMacroCommand(macro(steps)):  # type: ignore[misc]
+        def execute(self, notification: INotification) -> None:
+            self.initialize_macro_command()
+            while self._subcommands:
+                factory = self._subcommands.pop(0)
+                command = factory()
+                command.initialize_notifier(KEY)
+                command.execute(notification)
+
+    return LegacyMacroCommand
+
+
+def measure(cls: Type[MacroCommand], iterations: int) -> float:
+    """Return the mean cost of constructing and executing the macro in microseconds, best of `REPEAT` runs."""
+    note = Notification("benchmark.macro")
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            command = cls()
+            command.initialize_notifier(KEY)
+            command.execute(note)
+        best = min(best, (time.perf_counter_ns() - start) / iterations / 1000)
+    return best
+
+
+if __name__ == "__main__":
+    for steps, iterations in [(100, 2_000), (3, 50_000)]:
+        before = measure(legacy(steps), iterations)
+        after = measure(macro(steps), iterations)
+        print(f"{steps:3d} steps   before {before:8.2f} us   after {after:8.2f} us   x{before / after:.2f}")
@@ -0,0 +1,78 @@
+# serial_lanes_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Benchmark for serial command lanes.
+
+`THREADS` threads each send `NOTIFICATIONS` notifications for one
+account, handled by a command that waits `WORK` seconds, as it would on
+I/O. Commands for an account must not overlap. Compares a global lock
+around `execute_command` with one serial lane per account, from
+`set_serial` with a key, and reports notifications per second.
+
+Run with::
+
+    python benchmarks/serial_lanes_benchmark.py
+"""
+
+import threading
+import time
+
+from puremvc.core import Controller, View
+from puremvc.interfaces import INotification
+from puremvc.patterns.command import SimpleCommand
+from puremvc.patterns.observer import Notification
+
+THREADS = 8
+NOTIFICATIONS = 50
+WORK = 0.001
+
+
+class BenchCommand(SimpleCommand):
+    def execute(self, notification: INotification) -> None:
+        time.sleep(WORK)
+
+
+class GlobalLockController(Controller):
+    """A Controller serializing every command, as applications did before lanes."""
+
+    def __init__(self, key: str) -> None:
+        self.lock = threading.Lock()
+        super().__init__(key)
+
+    def execute_command(self, notification: INotification) -> None:
+        with self.lock:
+            super().execute_command(notification)
+
+
+def measure(key: str, controller: Controller) -> float:
+    """Return the rate of notifications handled per second by `THREADS` concurrent senders."""
+    view = View.get_instance(key, lambda k: View(k))
+    controller.register_command("benchmark.account", BenchCommand)
+
+    def send(account: int) -> None:
+        note = Notification("benchmark.account", {"account": account})
+        for _ in range(NOTIFICATIONS):
+            view.notify_observers(note)
+
+    threads = [threading.Thread(target=send, args=(account,)) for account in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    View.remove_view(key)
+    Controller.remove_controller(key)
+    return THREADS * NOTIFICATIONS / elapsed
+
+
+if __name__ == "__main__":
+    before = measure("SerialLanesBenchmark1", GlobalLockController("SerialLanesBenchmark1"))
+    lanes = Controller("SerialLanesBenchmark2")
+    lanes.set_serial("benchmark.account", key=lambda note: note.body["account"])
+    after = measure("SerialLanesBenchmark2", lanes)
+    print(f"{THREADS} accounts   global lock {before:8.0f} notes/s   lanes {after:8.0f} notes/s   x{after / before:.1f}")
@@ -0,0 +1,91 @@
+# single_observer_benchmark.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+"""
+Microbenchmark for names observed by a single observer.
+
+Compares the unwrapped observer and route of a single-observer name
+against the previous layout, where every name held a one-element
+observer list and a one-element route tuple. Memory is measured for a
+core with `NAMES` command registrations, each dispatched once so that
+its route is compiled.
+
+Run with::
+
+    python benchmarks/single_observer_benchmark.py
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from puremvc.core import Controller, View
+from puremvc.interfaces import INotification
+from puremvc.patterns.command import SimpleCommand
+from puremvc.patterns.observer import Notification
+
+NAMES = 500
+ITERATIONS = 200_000
+REPEAT = 5
+
+
+class BenchCommand(SimpleCommand):
+    def execute(self, notification: INotification) -> None:
+        pass
+
+
+def traced_bytes(build: Callable[[], Any]) -> int:
+    """Return the traced memory held by the result of `build`."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def measure(view: View, note: INotification) -> float:
+    """Return the mean cost of one dispatch in nanoseconds, best of `REPEAT` runs."""
+    notify = view.notify_observers
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter_ns()
+        for _ in range(ITERATIONS):
+            notify(note)
+        best = min(best, (time.perf_counter_ns() - start) / ITERATIONS)
+    return best
+
+
+def run(key: str) -> None:
+    controller = Controller.get_instance(key, lambda k: Controller(k))
+    view = View.get_instance(key, lambda k: View(k))
+    names = [f"benchmark.single.{i}" for i in range(NAMES)]
+    for name in names:
+        controller.register_command(name, lambda: BenchCommand())
+        view.notify_observers(Notification(name))
+
+    observers: Dict[str, Any] = dict(view.observerMap)
+    routes: Dict[str, Any] = dict(view.routeMap)
+    unwrapped = traced_bytes(lambda: ({name: observers[name] for name in names},
+                                      {name: routes[name] for name in names}))
+    wrapped = traced_bytes(lambda: ({name: [observers[name]] for name in names},
+                                    {name: (routes[name],) for name in names}))
+    print(f"memory per core ({NAMES} names)  before {wrapped:7d} B   after {unwrapped:7d} B   "
+          f"saved {wrapped - unwrapped:7d} B ({(wrapped - unwrapped) / NAMES:.0f} B/name)")
+
+    note = Notification(names[0])
+    after = measure(view, note)
+    view.routeMap[names[0]] = (view.routeMap[names[0]],)
+    before = measure(view, note)
+    print(f"single observer dispatch      before {before:7.1f} ns   after {after:7.1f} ns")
+
+    View.remove_view(key)
+    Controller.remove_controller(key)
+
+
+if __name__ == "__main__":
+    run("SingleObserverBenchmark")
@@ -0,0 +1,81 @@
+# _lazy.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, List, Sequence
+
+
+class LazyModule(ModuleType):
+    """
+    A package whose exported classes are imported on first access.
+
+    Each exported class is defined in a submodule of the same name, such as
+    `puremvc.core.View`. Importing such a submodule, directly or from a
+    sibling module, binds it as an attribute of the package, which would
+    shadow the class, so those bindings are replaced with the class itself.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Import an exported class on first access.
+
+        Only called for attributes not yet present on the package.
+
+        :param name: The name of the attribute.
+        :type name: str
+        :return: The exported class.
+        :rtype: Any
+        :raises AttributeError: If the package does not export the name.
+        """
+        if name not in self.__dict__.get("__lazy_exports__", ()):
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f"{self.__name__}.{name}"), name)
+        super().__setattr__(name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Bind an attribute, replacing an exported submodule with its class.
+
+        :param name: The name of the attribute.
+        :type name: str
+        :param value: The value to bind.
+        :type value: Any
+        :return: None
+        """
+        if (isinstance(value, ModuleType) and name in self.__dict__.get("__lazy_exports__", ())
+                and value.__name__ == f"{self.__name__}.{name}" and hasattr(value, name)):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        """
+        List the attributes of the package, including exports not yet imported.
+
+        :return: The attribute names.
+        :rtype: List[str]
+        """
+        return sorted(set(super().__dir__()) | set(self.__dict__.get("__lazy_exports__", ())))
+
+
+def lazy_exports(module_name: str, names: Sequence[str]) -> None:
+    """
+    Turn a package into a `LazyModule` exporting the given classes.
+
+    Called at the end of the package's `__init__`.
+
+    :param module_name: The `__name__` of the package.
+    :type module_name: str
+    :param names: The exported classes, each defined in a submodule of the same name.
+    :type names: Sequence[str]
+    :return: None
+    """
+    module = sys.modules[module_name]
+    module.__lazy_exports__ = tuple(names)  # type: ignore[attr-defined]
+    module.__all__ = list(names)  # type: ignore[attr-defined]
+    module.__class__ = LazyModule
@@ -0,0 +1,429 @@
+# CommandQueue.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+
+from puremvc.interfaces import INotification
+
+Task = Tuple[Callable[[INotification], Any], INotification, Optional[float], Optional[Hashable]]
+
+
+if TYPE_CHECKING:
+    TaskQueueBase = queue.Queue[Optional[Task]]
+else:
+    TaskQueueBase = queue.Queue
+
+
+class TaskQueue(TaskQueueBase):
+    """
+    A FIFO queue of tasks, which the workers may also fill past its capacity.
+
+    A task may belong to a serial lane. While a task of a lane is taken and
+    not yet released, the next tasks of the lane are held back, so that
+    the lane executes one task at a time, in order, without a worker
+    waiting for it. Held tasks count towards the capacity.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        self.lanes: Dict[Hashable, Deque[Task]] = dict()
+        self.held: int = 0
+        self.stops: int = 0
+
+    def _qsize(self) -> int:
+        return len(self.queue) + self.held + self.stops
+
+    def _put(self, task: Optional[Task]) -> None:
+        if task is None:
+            self.stops += 1
+            return
+        lane = task[3]
+        if lane is not None:
+            waiting = self.lanes.get(lane)
+            if waiting is not None:
+                waiting.append(task)
+                self.held += 1
+                return
+            self.lanes[lane] = deque()
+        self.queue.append(task)
+
+    def take(self) -> Optional[Task]:
+        """
+        Remove and return the next task ready to execute, waiting for one if needed.
+
+        A stop sentinel is only returned once no task is held back.
+
+        :return: The task, or None to stop.
+        :rtype: Optional[Task]
+        """
+        with self.not_empty:
+            while not self.queue and not (self.stops and not self.held):
+                self.not_empty.wait()
+            if self.queue:
+                task: Optional[Task] = self.queue.popleft()
+            else:
+                self.stops -= 1
+                task = None
+            self.not_full.notify()
+            return task
+
+    def release(self, lane: Hashable) -> None:
+        """
+        Make the next held task of a lane ready, once its previous task has executed.
+
+        :param lane: The lane of the executed task.
+        :type lane: Hashable
+        :return: None
+        """
+        with self.mutex:
+            waiting = self.lanes[lane]
+            if not waiting:
+                del self.lanes[lane]
+                return
+            self.queue.append(waiting.popleft())
+            self.held -= 1
+            if self.held:
+                self.not_empty.notify()
+            else:
+                self.not_empty.notify_all()
+
+    def put_over(self, task: Optional[Task]) -> None:
+        """
+        Put a task at the end of the queue, even when it is full.
+
+        :param task: The task to put.
+        :type task: Optional[Task]
+        :return: None
+        """
+        with self.mutex:
+            self._put(task)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class CommandQueue:
+    """
+    A bounded queue of command executions consumed by worker threads.
+
+    Used by the `Controller` in queued mode, see `Controller.start_queue`.
+    Each task is the callable executing the commands for a notification,
+    and the notification itself.
+
+    When the queue is full, `put` applies the backpressure policy: it
+    blocks the sender until a worker frees a slot, drops the task, or
+    raises `queue.Full`. Dropped and rejected tasks are counted. A worker
+    never blocks, since it could wait for itself: a task it puts while the
+    queue is full, from a queued command sending a notification, is
+    executed at once, nested in the current task. In ordered mode, or for
+    a serial lane, the task is queued past the capacity instead, to keep
+    the order of its lane.
+
+    In ordered mode, each worker consumes its own queue, and the tasks for
+    a notification name, or for a lane given to `put`, always go to the
+    same worker, so they execute one at a time, in the order they were
+    sent. Otherwise, all workers consume a shared queue, and tasks may
+    complete in any order, except those put with `serial`: the tasks of
+    their lane execute one at a time, in the order they were put, while
+    the workers execute other tasks in the meantime.
+
+    A task may be given a timeout. A watchdog thread checks the running
+    tasks every `WATCH_INTERVAL` seconds, and reports those running past
+    their timeout. A thread cannot be stopped from outside, so the worker
+    running such a task is retired: it exits once the task returns, if
+    ever, and a new worker takes its place on the same queue, so a hung
+    command no longer ties up a worker for good. The next tasks of a
+    serial lane still wait for the task to return. In ordered mode, the
+    task is only reported: its worker keeps its queue until the task
+    returns, since a new worker would run the next tasks of the queue
+    before it completes.
+
+    See Also
+    --------
+    :class:`puremvc.core.Controller`
+    """
+
+    """BLOCK (str): Policy blocking the sender until the queue has room"""
+    BLOCK = "block"
+
+    """DROP (str): Policy dropping the task when the queue is full"""
+    DROP = "drop"
+
+    """REJECT (str): Policy raising `queue.Full` to the sender when the queue is full"""
+    REJECT = "reject"
+
+    """WATCH_INTERVAL (float): The number of seconds between two checks of the running task timeouts"""
+    WATCH_INTERVAL = 0.05
+
+    def __init__(self, name: str, workers: int, capacity: int, policy: str, ordered: bool,
+                 on_failure: Callable[[INotification, BaseException], None],
+                 on_timeout: Optional[Callable[[INotification, float], None]] = None) -> None:
+        """
+        Constructor. Starts the worker threads.
+
+        :param name: The prefix of the worker thread names.
+        :type name: str
+        :param workers: The number of worker threads.
+        :type workers: int
+        :param capacity: The maximum number of pending tasks, split between the workers in ordered mode.
+        :type capacity: int
+        :param policy: `CommandQueue.BLOCK`, `CommandQueue.DROP` or `CommandQueue.REJECT`.
+        :type policy: str
+        :param ordered: Whether the tasks for a notification name, or a lane, execute in order.
+        :type ordered: bool
+        :param on_failure: Called with the notification and the exception when a task raises.
+        :type on_failure: Callable[[INotification, BaseException], None]
+        :param on_timeout: Called with the notification and the timeout when a task runs past its timeout.
+        :type on_timeout: Optional[Callable[[INotification, float], None]]
+        :raises ValueError: If `workers` or `capacity` is less than 1, or `policy` is unknown.
+        """
+        if workers < 1:
+            raise ValueError(f"CommandQueue workers must be at least 1, got {workers!r}")
+        if capacity < 1:
+            raise ValueError(f"CommandQueue capacity must be at least 1, got {capacity!r}")
+        if policy not in (CommandQueue.BLOCK, CommandQueue.DROP, CommandQueue.REJECT):
+            raise ValueError(f"Unknown command queue policy: {policy!r}")
+        self.policy: str = policy
+        self.ordered: bool = ordered
+        self.on_failure: Callable[[INotification, BaseException], None] = on_failure
+        self.on_timeout: Optional[Callable[[INotification, float], None]] = on_timeout
+        self.name: str = name
+        self.local: threading.local = threading.local()
+        size = max(1, capacity // workers) if ordered else capacity
+        self.queues: List[TaskQueue] = [TaskQueue(size) for _ in range(workers if ordered else 1)]
+        self.statsLock: threading.Lock = threading.Lock()
+        self.dropped: int = 0
+        self.rejected: int = 0
+        self.failed: int = 0
+        self.timedOut: int = 0
+        self.workersLock: threading.Lock = threading.Lock()
+        self.workers: List[threading.Thread] = []
+        self.workerQueues: Dict[threading.Thread, TaskQueue] = dict()
+        self.running: Dict[threading.Thread, Tuple[Task, float]] = dict()
+        self.retired: Set[threading.Thread] = set()
+        self.watchdog: Optional[threading.Thread] = None
+        self.stopped: bool = False
+        self.started: int = 0
+        with self.workersLock:
+            for index in range(workers):
+                self.start_worker(self.queues[index % len(self.queues)])
+
+    def start_worker(self, tasks: TaskQueue) -> None:
+        """
+        Start a worker thread consuming a queue. Called with the workers lock held.
+
+        :param tasks: The queue to consume.
+        :type tasks: TaskQueue
+        :return: None
+        """
+        worker = threading.Thread(target=self.work, args=(tasks,), name=f"{self.name}-{self.started}", daemon=True)
+        self.started += 1
+        self.workers.append(worker)
+        self.workerQueues[worker] = tasks
+        worker.start()
+
+    def put(self, executor: Callable[[INotification], Any], notification: INotification,
+            lane: Optional[Hashable] = None, timeout: Optional[float] = None, serial: bool = False) -> None:
+        """
+        Queue the execution of the commands for a notification, applying the backpressure policy.
+
+        Called from a worker while the queue is full, with the `CommandQueue.BLOCK`
+        policy, executes the commands at once instead of blocking, or in ordered
+        mode or a serial lane, queues them past the capacity.
+
+        :param executor: The callable executing the commands.
+        :type executor: Callable[[INotification], Any]
+        :param notification: The notification to execute them with.
+        :type notification: INotification
+        :param lane: The key of the lane of the notification, or None for its name (optional).
+        :type lane: Optional[Hashable]
+        :param timeout: The number of seconds the commands may run, or None (optional).
+        :type timeout: Optional[float]
+        :param serial: Whether the tasks of the lane execute one at a time, in order, outside ordered mode (optional).
+        :type serial: bool
+        :return: None
+        :raises queue.Full: If the queue is full and the policy is `CommandQueue.REJECT`.
+        """
+        queues = self.queues
+        if len(queues) > 1:
+            tasks = queues[hash(notification.name if lane is None else lane) % len(queues)]
+        else:
+            tasks = queues[0]
+        if timeout is not None and self.watchdog is None:
+            self.start_watchdog()
+        serial_lane: Optional[Hashable] = None
+        if serial and not self.ordered:
+            serial_lane = notification.name if lane is None else (notification.name, lane)
+        task = (executor, notification, timeout, serial_lane)
+        if self.policy == CommandQueue.BLOCK:
+            if not getattr(self.local, "worker", False):
+                tasks.put(task)
+                return
+            if self.ordered or serial_lane is not None:
+                tasks.put_over(task)
+                return
+            try:
+                tasks.put_nowait(task)
+            except queue.Full:
+                self.execute(executor, notification)
+            return
+        try:
+            tasks.put_nowait(task)
+        except queue.Full:
+            with self.statsLock:
+                if self.policy == CommandQueue.DROP:
+                    self.dropped += 1
+                    return
+                self.rejected += 1
+            raise
+
+    def work(self, tasks: TaskQueue) -> None:
+        """
+        Execute tasks from a queue until a stop sentinel is received.
+
+        :param tasks: The queue to consume.
+        :type tasks: TaskQueue
+        :return: None
+        """
+        worker = threading.current_thread()
+        self.local.worker = True
+        while True:
+            task = tasks.take()
+            if task is None:
+                tasks.task_done()
+                return
+            executor, notification, timeout, lane = task
+            if timeout is not None:
+                with self.workersLock:
+                    self.running[worker] = (task, time.monotonic() + timeout)
+            try:
+                self.execute(executor, notification)
+            finally:
+                if lane is not None:
+                    tasks.release(lane)
+                if timeout is not None:
+                    with self.workersLock:
+                        self.running.pop(worker, None)
+                        retired = worker in self.retired
+                        self.retired.discard(worker)
+                    if retired:
+                        return
+                tasks.task_done()
+
+    def execute(self, executor: Callable[[INotification], Any], notification: INotification) -> None:
+        """
+        Execute a task, counting and reporting its failure.
+
+        An exception raised while reporting the failure is ignored, so that
+        it cannot end the worker.
+
+        :param executor: The callable executing the commands.
+        :type executor: Callable[[INotification], Any]
+        :param notification: The notification to execute them with.
+        :type notification: INotification
+        :return: None
+        """
+        try:
+            executor(notification)
+        except Exception as error:
+            with self.statsLock:
+                self.failed += 1
+            try:
+                self.on_failure(notification, error)
+            except Exception:
+                pass
+
+    def start_watchdog(self) -> None:
+        """
+        Start the thread checking the timeouts of the running tasks, unless already started.
+
+        :return: None
+        """
+        with self.workersLock:
+            if self.watchdog is None and not self.stopped:
+                self.watchdog = threading.Thread(target=self.watch, name=f"{self.name}-watchdog", daemon=True)
+                self.watchdog.start()
+
+    def watch(self) -> None:
+        """
+        Report the tasks running past their timeout, until the queue is stopped.
+
+        The workers running them are retired and replaced, except in ordered mode.
+
+        :return: None
+        """
+        while not self.stopped:
+            time.sleep(CommandQueue.WATCH_INTERVAL)
+            now = time.monotonic()
+            expired: List[Tuple[Optional[TaskQueue], Task]] = []
+            with self.workersLock:
+                for worker, (task, deadline) in list(self.running.items()):
+                    if deadline > now or self.stopped:
+                        continue
+                    del self.running[worker]
+                    if self.ordered:
+                        expired.append((None, task))
+                        continue
+                    self.retired.add(worker)
+                    self.workers.remove(worker)
+                    tasks = self.workerQueues.pop(worker)
+                    self.start_worker(tasks)
+                    expired.append((tasks, task))
+            for retired_tasks, (_, notification, timeout, _) in expired:
+                if retired_tasks is not None:
+                    retired_tasks.task_done()
+                with self.statsLock:
+                    self.timedOut += 1
+                if self.on_timeout is not None and timeout is not None:
+                    try:
+                        self.on_timeout(notification, timeout)
+                    except Exception:
+                        pass
+
+    def join(self) -> None:
+        """
+        Wait until every task queued so far has been executed.
+
+        Also waits for the tasks those put on the other queues of ordered mode.
+
+        :return: None
+        """
+        while True:
+            for tasks in self.queues:
+                tasks.join()
+            if not any(tasks.unfinished_tasks for tasks in self.queues):
+                return
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the workers once they have executed the tasks already queued.
+
+        :param wait: Whether to wait for the workers to finish.
+        :type wait: bool
+        :return: None
+        """
+        with self.workersLock:
+            self.stopped = True
+            workers = list(self.workers)
+        for worker in workers:
+            self.workerQueues[worker].put(None)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the queue.
+
+        :return: The `pending`, `dropped`, `rejected`, `failed` and `timed_out` task counts.
+        :rtype: Dict[str, int]
+        """
+        with self.statsLock:
+            return {"pending": sum(tasks.qsize() for tasks in self.queues), "dropped": self.dropped,
+                    "rejected": self.rejected, "failed": self.failed, "timed_out": self.timedOut}
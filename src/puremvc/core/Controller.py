@@ -4,13 +4,22 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import importlib
+import sys
 import threading
-from typing import Dict, Callable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Callable, Hashable, List, Mapping, Optional, Set, Tuple, Union, cast
 
-from puremvc.interfaces import IController, ICommand, IView, INotification
-from puremvc.patterns.observer import Observer
+from puremvc.interfaces import IController, ICommand, IView, INotification, IObserver
+from puremvc.patterns.observer import Notification, Observer
 from .View import View
 
+if TYPE_CHECKING:
+    import concurrent.futures
+    from asyncio import Future
+    from concurrent.futures import ThreadPoolExecutor
+    from puremvc.patterns.command.CommandMemo import CommandMemo
+    from .CommandQueue import CommandQueue
+
 
 class Controller(IController):
     """
@@ -54,6 +63,39 @@ class Controller(IController):
     """MULTITON_MSG (str): Multiton error message"""
     MULTITON_MSG = "Controller multiton instance for this key is already constructed!"
 
+    """REUSE_SINGLETON (str): Reuse mode executing one shared instance of a command"""
+    REUSE_SINGLETON = "singleton"
+
+    """REUSE_THREAD (str): Reuse mode executing one instance of a command per thread"""
+    REUSE_THREAD = "thread"
+
+    """FAN_OUT_THREADS (str): Fan-out mode executing the commands for a notification on a thread pool"""
+    FAN_OUT_THREADS = "threads"
+
+    """FAN_OUT_ASYNCIO (str): Fan-out mode running the commands for a notification as asyncio tasks"""
+    FAN_OUT_ASYNCIO = "asyncio"
+
+    """FAN_OUT_WORKERS (Optional[int]): Maximum number of fan-out pool threads, or None for the default"""
+    FAN_OUT_WORKERS: Optional[int] = None
+
+    """QUEUE_BLOCK (str): Queue policy blocking the sender until the queue has room"""
+    QUEUE_BLOCK = "block"
+
+    """QUEUE_DROP (str): Queue policy dropping the notification when the queue is full"""
+    QUEUE_DROP = "drop"
+
+    """QUEUE_REJECT (str): Queue policy raising `queue.Full` to the sender when the queue is full"""
+    QUEUE_REJECT = "reject"
+
+    """QUEUE_MSG (str): Queue error message"""
+    QUEUE_MSG = "Controller command queue is already started!"
+
+    """COMMAND_FAILED (str): Notification sent with `(notification, exception)` when an offloaded command raises"""
+    COMMAND_FAILED = "Controller.commandFailed"
+
+    """COMMAND_TIMED_OUT (str): Notification sent with `(notification, timeout)` when an offloaded command times out"""
+    COMMAND_TIMED_OUT = "Controller.commandTimedOut"
+
     def __init__(self, key: str) -> None:
         """
         This `IController` implementation is a Multiton, so you should not
@@ -71,6 +113,25 @@ class Controller(IController):
         Controller.instanceMap[key] = self
         self.commandMap: Dict[str, Callable[[], ICommand]] = dict()
         self.commandMapLock: threading.Lock = threading.Lock()
+        self.commandObserverMap: Dict[str, IObserver] = dict()
+        self.commandPathMap: Dict[str, str] = dict()
+        self.commandReuseMap: Dict[str, str] = dict()
+        self.commandExecutorMap: Dict[str, Callable[[INotification], Any]] = dict()
+        self.commandGuardMap: Dict[str, Callable[[INotification], bool]] = dict()
+        self.commandRejectionMap: Dict[Callable[[INotification], bool], int] = dict()
+        self.commandRejectionLock: threading.Lock = threading.Lock()
+        self.commandListMap: Dict[str, List[Tuple[Callable[[], ICommand], Optional[str],
+                                                  Optional[Callable[[INotification], bool]]]]] = dict()
+        self.commandFanOutMap: Dict[str, str] = dict()
+        self.commandSerialMap: Dict[str, Optional[Callable[[INotification], Hashable]]] = dict()
+        self.commandPool: Optional["ThreadPoolExecutor"] = None
+        self.commandPoolLocal: threading.local = threading.local()
+        self.commandTasks: Set["Future[Any]"] = set()
+        self.commandMemoMap: Dict[type, "CommandMemo"] = dict()
+        self.commandQueue: Optional["CommandQueue"] = None
+        self.commandTimeout: Optional[float] = None
+        self.commandTimeoutMap: Dict[str, float] = dict()
+        self.commandOffloadSet: Set[str] = set()
         self.view: Optional[IView] = None
         self.initialize_controller()
 
@@ -108,27 +169,1034 @@ class Controller(IController):
                 cls.instanceMap[key] = factory(key)
         return cls.instanceMap.get(key)
 
-    def register_command(self, notification_name: str, factory: Callable[[], ICommand]) -> None:
+    def register_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                         reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
         """
         Register a particular `ICommand` class as the handler for a particular
         `INotification`.
 
         If an `ICommand` has already been registered to
         handle `INotification`s with this name, it is no longer
-        used, the new `ICommand` is used instead.
+        used, the new `ICommand` is used instead. Commands added
+        after it with `add_command` are dropped as well.
 
         The Observer for the new ICommand is only created if this is the
         first time an ICommand has been registered for this Notification name.
+        Replacing a command keeps the existing Observer, and its place in the
+        observer list, and only swaps its notification method.
+
+        The factory may also be given as an import path, such as
+        `"app.commands.export:ExportCommand"`, so that the module defining
+        the command, and its dependencies, are only imported when the
+        command is first executed, see `preload_commands`.
+
+        By default, a new instance of the `ICommand` is created for every
+        notification. A stateless command may instead be reused, saving the
+        allocation and `initialize_notifier` call on each execution:
+
+        - `Controller.REUSE_SINGLETON` executes one shared instance, possibly
+          from several threads at once.
+        - `Controller.REUSE_THREAD` executes one instance per thread.
+
+        A command is stateless when its `execute` keeps its intermediate
+        values in locals, and does not assign attributes on `self` or keep
+        a reference to the notification. To check a command before reusing
+        it, execute one instance twice in a test, with `vars(command)`
+        compared before and after each execution.
+
+        A guard is a cheap test evaluated against the notification before
+        the command is constructed. Notifications failing it are skipped
+        without calling the factory, and counted, see `guard_rejections`.
+        A command beginning with `if not <condition>: return` can move its
+        condition into a guard.
 
         :param notification_name: The name of the notification.
-        :param factory: Callable that returns an instance of ICommand.
+        :param factory: Callable that returns an instance of ICommand, or its `module:attribute` import path.
+        :param reuse: `Controller.REUSE_SINGLETON` or `Controller.REUSE_THREAD` to reuse instances (optional).
+        :param guard: A test notifications must pass for the command to be executed (optional).
         :return: None.
+        :raises ValueError: If `reuse` is not one of the reuse modes.
         """
+        self.register_commands({notification_name: factory}, reuse, guard)
+
+    def register_commands(self, commands: Mapping[str, Union[Callable[[], ICommand], str]],
+                          reuse: Optional[str] = None,
+                          guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register several `ICommand` classes, each as the handler for a
+        particular `INotification`.
+
+        All registrations are applied under a single acquisition of the
+        command map lock, and the Observers for new registrations are
+        registered with the `View` in one pass, see `register_command`.
+
+        :param commands: Callables that return an instance of ICommand, or their import paths, by notification name.
+        :type commands: Mapping[str, Union[Callable[[], ICommand], str]]
+        :param reuse: `Controller.REUSE_SINGLETON` or `Controller.REUSE_THREAD` to reuse instances (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the commands to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises ValueError: If `reuse` is not one of the reuse modes.
+        """
+        self._check_reuse(reuse)
+        registrations: List[Tuple[str, IObserver]] = []
         with self.commandMapLock:
-            if self.commandMap.get(notification_name) is None:
+            for notification_name, command in commands.items():
+                if type(notification_name) is str:
+                    notification_name = sys.intern(notification_name)
+                if isinstance(command, str):
+                    factory = self._import_factory(notification_name, command)
+                    self.commandPathMap[notification_name] = command
+                else:
+                    factory = command
+                    self.commandPathMap.pop(notification_name, None)
+                self.commandMap[notification_name] = factory
+                if reuse is None:
+                    self.commandReuseMap.pop(notification_name, None)
+                else:
+                    self.commandReuseMap[notification_name] = reuse
+                self._drop_guards(notification_name, guard)
+                if guard is not None:
+                    self.commandGuardMap[notification_name] = guard
+                route = self._command_route(notification_name)
                 if self.view:
-                    self.view.register_observer(notification_name, Observer(self.execute_command, self))
-            self.commandMap[notification_name] = factory
+                    observer = self.commandObserverMap.get(notification_name)
+                    if observer is None:
+                        observer = Observer(route, self)
+                        self.commandObserverMap[notification_name] = observer
+                        registrations.append((notification_name, observer))
+                    else:
+                        observer.notify_method = route
+                        self.view.invalidate_route(notification_name)
+            if self.view and registrations:
+                self.view.register_observers(registrations)
+
+    def add_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                    reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Add an `ICommand` to those handling a particular `INotification`.
+
+        The commands registered for a name are executed in the order they
+        were added, after the one registered with `register_command`, or
+        concurrently, see `set_fan_out`. This replaces a `MacroCommand`
+        written only to run independent commands on the same notification.
+        If no command is registered for the name yet, this is the same as
+        `register_command`.
+
+        :param notification_name: The name of the notification.
+        :type notification_name: str
+        :param factory: Callable that returns an instance of ICommand, or its `module:attribute` import path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `Controller.REUSE_SINGLETON` or `Controller.REUSE_THREAD` to reuse instances (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises ValueError: If `reuse` is not one of the reuse modes.
+        """
+        self._check_reuse(reuse)
+        with self.commandMapLock:
+            if notification_name in self.commandMap:
+                if isinstance(factory, str):
+                    factory = self._path_factory(factory)
+                self.commandListMap.setdefault(notification_name, []).append((factory, reuse, guard))
+                self._reroute(notification_name)
+                return
+        self.register_command(notification_name, factory, reuse, guard)
+
+    def set_fan_out(self, notification_name: str, fan_out: Optional[str]) -> None:
+        """
+        Set how the commands for a particular `INotification` are executed.
+
+        By default, they are executed one after the other on the thread
+        sending the notification. With a fan-out mode, they overlap:
+
+        - `Controller.FAN_OUT_THREADS` executes the first command on the
+          sending thread and the others on a thread pool shared by the
+          core, and waits for all of them, re-raising the first failure.
+          Commands already running on the pool execute their own fan-outs
+          in order, so nested notifications cannot exhaust the pool.
+        - `Controller.FAN_OUT_ASYNCIO` executes each command in order, and
+          runs the awaitables returned by coroutine `execute` methods as
+          concurrent asyncio tasks. If an event loop is running in the
+          sending thread, the tasks are scheduled on it and the
+          notification returns at once, and their exceptions, which can
+          no longer reach the sender, are sent in a
+          `Controller.COMMAND_FAILED` notification; otherwise they are run
+          to completion in a new event loop, and the first failure is
+          re-raised.
+
+        The mode is kept when the commands for the name are replaced, and
+        dropped when they are removed.
+
+        :param notification_name: The name of the notification.
+        :type notification_name: str
+        :param fan_out: `Controller.FAN_OUT_THREADS`, `Controller.FAN_OUT_ASYNCIO`, or None to execute in order.
+        :type fan_out: Optional[str]
+        :return: None
+        :raises ValueError: If `fan_out` is not one of the fan-out modes.
+        """
+        if fan_out not in (None, Controller.FAN_OUT_THREADS, Controller.FAN_OUT_ASYNCIO):
+            raise ValueError(f"Unknown command fan-out mode: {fan_out!r}")
+        with self.commandMapLock:
+            if fan_out is None:
+                self.commandFanOutMap.pop(notification_name, None)
+            else:
+                self.commandFanOutMap[notification_name] = fan_out
+            if notification_name in self.commandMap:
+                self._reroute(notification_name)
+
+    def guard_rejections(self, guard: Callable[[INotification], bool]) -> int:
+        """
+        Get the number of notifications a command guard has skipped.
+
+        A guard shared by several registrations counts the notifications
+        skipped for all of them. The count is dropped once no registration
+        uses the guard any more.
+
+        :param guard: A guard given to `register_command` or `add_command`.
+        :type guard: Callable[[INotification], bool]
+        :return: The rejection count, or 0 for an unknown guard.
+        :rtype: int
+        """
+        with self.commandRejectionLock:
+            return self.commandRejectionMap.get(guard, 0)
+
+    def command_memo(self, command_class: type, size: int, ttl: Optional[float]) -> "CommandMemo":
+        """
+        Get the outcome cache of a `MemoizedCommand` class, creating it on first use.
+
+        :param command_class: The `MemoizedCommand` subclass.
+        :type command_class: type
+        :param size: The maximum number of entries of a new cache.
+        :type size: int
+        :param ttl: The number of seconds an entry of a new cache stays valid, or None.
+        :type ttl: Optional[float]
+        :return: The cache of the class in this core.
+        :rtype: CommandMemo
+        """
+        memo = self.commandMemoMap.get(command_class)
+        if memo is None:
+            from puremvc.patterns.command.CommandMemo import CommandMemo
+
+            with self.commandMapLock:
+                memo = self.commandMemoMap.get(command_class)
+                if memo is None:
+                    memo = self.commandMemoMap[command_class] = CommandMemo(size, ttl)
+        return memo
+
+    def memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the statistics of the outcome caches of the `MemoizedCommands` executed in this core.
+
+        :return: The `hits`, `misses`, `evictions`, `expirations` and `entries` of each cache,
+            by qualified class name.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        with self.commandMapLock:
+            memos = list(self.commandMemoMap.items())
+        return {f"{cls.__module__}.{cls.__qualname__}": memo.stats() for cls, memo in memos}
+
+    def start_queue(self, workers: int = 4, capacity: int = 1024, policy: str = QUEUE_BLOCK,
+                    ordered: bool = False) -> None:
+        """
+        Switch to queued mode, where commands execute on worker threads.
+
+        In queued mode, a notification for a command is put in a bounded
+        queue and the sender returns at once, while a pool of worker
+        threads executes the queued commands. This absorbs bursts without
+        stalling the sender, up to the capacity of the queue. When the
+        queue is full, the policy decides what happens to the sender:
+
+        - `Controller.QUEUE_BLOCK` blocks it until a worker frees a slot.
+        - `Controller.QUEUE_DROP` drops the notification for the commands.
+        - `Controller.QUEUE_REJECT` raises `queue.Full`.
+
+        By default, the commands for different notifications of the same
+        name may run at the same time, on different workers. If `ordered`
+        is True, they run one at a time, in the order they were sent.
+
+        An exception raised by a queued command cannot reach its sender, so
+        it is counted, and sent in a `Controller.COMMAND_FAILED`
+        notification with the original notification and the exception as
+        its body. Observers are still notified on the sending thread, only
+        commands are queued.
+
+        :param workers: The number of worker threads.
+        :type workers: int
+        :param capacity: The maximum number of queued notifications, split between the workers if `ordered`.
+        :type capacity: int
+        :param policy: `Controller.QUEUE_BLOCK`, `Controller.QUEUE_DROP` or `Controller.QUEUE_REJECT`.
+        :type policy: str
+        :param ordered: Whether the commands for a notification name execute one at a time, in order.
+        :type ordered: bool
+        :return: None
+        :raises ValueError: If `workers` or `capacity` is less than 1, or `policy` is unknown.
+        :raises Exception: If the queue is already started.
+        """
+        from .CommandQueue import CommandQueue
+
+        with self.commandMapLock:
+            if self.commandQueue is not None:
+                raise Exception(Controller.QUEUE_MSG)
+            self.commandQueue = CommandQueue(f"{self.multitonKey}-queue", workers, capacity, policy, ordered,
+                                             self._command_failed, self._command_timed_out)
+            for notification_name in self.commandMap:
+                self._reroute(notification_name)
+
+    def stop_queue(self, wait: bool = True) -> None:
+        """
+        Switch back to executing commands on the sending thread.
+
+        The commands already queued are still executed by the workers,
+        which then stop.
+
+        :param wait: Whether to wait for the queued commands to be executed.
+        :type wait: bool
+        :return: None
+        """
+        with self.commandMapLock:
+            command_queue, self.commandQueue = self.commandQueue, None
+            if command_queue is None:
+                return
+            for notification_name in self.commandMap:
+                self._reroute(notification_name)
+        command_queue.stop(wait)
+
+    def join_queue(self) -> None:
+        """
+        Wait until every command queued so far has been executed.
+
+        :return: None
+        """
+        command_queue = self.commandQueue
+        if command_queue is not None:
+            command_queue.join()
+
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the command queue.
+
+        :return: The `pending`, `dropped`, `rejected`, `failed` and `timed_out` counts, or {} outside queued mode.
+        :rtype: Dict[str, int]
+        """
+        command_queue = self.commandQueue
+        return command_queue.stats() if command_queue is not None else {}
+
+    def set_timeout(self, notification_name: Optional[str], timeout: Optional[float]) -> None:
+        """
+        Set how long the commands for a notification may run when offloaded.
+
+        Applies to the modes executing commands away from the sending
+        thread: queued mode, and the thread and asyncio fan-outs. A
+        command running past its timeout is reported in a
+        `Controller.COMMAND_TIMED_OUT` notification, with the original
+        notification and the timeout as its body, and:
+
+        - In queued mode, its worker is retired and replaced, so the queue
+          keeps its throughput. The command itself cannot be stopped, and
+          the worker exits once it returns. The commands sent after it in
+          its serial lane still wait for it to complete. In an ordered
+          queue, the worker keeps running it instead, so the commands
+          queued after it still wait as well.
+          A queued fan-out is only timed by the fan-out.
+        - In a thread fan-out, all the commands run on the pool, and the
+          sender waits at most the timeout. Commands that have not started
+          are cancelled, and the pool is replaced by a new one.
+        - In an asyncio fan-out, the task is cancelled.
+
+        Commands executed on the sending thread are not timed.
+
+        :param notification_name: The name of the notification, or None to set the default for all names.
+        :type notification_name: Optional[str]
+        :param timeout: The number of seconds the commands may run, or None for no timeout.
+        :type timeout: Optional[float]
+        :return: None
+        :raises ValueError: If `timeout` is not positive.
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"Command timeout must be positive, got {timeout!r}")
+        with self.commandMapLock:
+            if notification_name is None:
+                self.commandTimeout = timeout
+                names = list(self.commandMap)
+            else:
+                if timeout is None:
+                    self.commandTimeoutMap.pop(notification_name, None)
+                else:
+                    self.commandTimeoutMap[notification_name] = timeout
+                names = [notification_name] if notification_name in self.commandMap else []
+            for name in names:
+                self._reroute(name)
+
+    def offloads_commands(self) -> bool:
+        """
+        Check whether any command may still be running, with its notification,
+        after the notification returns to its sender.
+
+        True in queued mode, and when a name uses the asyncio fan-out, or
+        the thread fan-out with a timeout, see `Facade.dispatch`.
+
+        :return: True if some commands are executed away from the sending thread.
+        :rtype: bool
+        """
+        return bool(self.commandOffloadSet)
+
+    def _command_timed_out(self, notification: INotification, timeout: float) -> None:
+        """
+        Report a command running past its timeout on a worker thread or as a task.
+
+        :param notification: The notification the command was executed with.
+        :type notification: INotification
+        :param timeout: The timeout of the command.
+        :type timeout: float
+        :return: None
+        """
+        if self.view:
+            self.view.notify_observers(Notification(Controller.COMMAND_TIMED_OUT, (notification, timeout)))
+
+    def _command_failed(self, notification: INotification, error: BaseException) -> None:
+        """
+        Report an exception raised by a command executed on a worker thread, or as an asyncio task.
+
+        :param notification: The notification the command was executed with.
+        :type notification: INotification
+        :param error: The exception raised.
+        :type error: BaseException
+        :return: None
+        """
+        if self.view:
+            self.view.notify_observers(Notification(Controller.COMMAND_FAILED, (notification, error)))
+
+    def set_serial(self, notification_name: str, serial: bool = True,
+                   key: Optional[Callable[[INotification], Hashable]] = None) -> None:
+        """
+        Set whether the commands for a particular `INotification` may overlap.
+
+        Commands are executed on the thread sending the notification, so
+        notifications sent from several threads may execute the same
+        commands at the same time. A serial name has execution lanes
+        instead: the commands for a lane never overlap, and those sent from
+        one thread execute in the order they were sent, while different
+        lanes, and other names, execute in parallel. By default, a name is
+        a single lane. With a key, such as an account id extracted from the
+        body, each key is a lane of its own.
+
+        A thread may send a notification for its own lane from a command,
+        which then executes at once, nested in the current command. Idle
+        key lanes are discarded, so a key may take any number of values.
+
+        In queued mode, each lane is a FIFO queue instead: with `ordered`
+        workers, the notifications for a lane are queued to a single
+        worker, and otherwise, the next notification for a lane waits in
+        the queue until the current one has executed, while the workers
+        execute other notifications. A notification sent for its own lane
+        from a command is queued after it.
+
+        The setting is kept when the commands for the name are replaced, and
+        dropped when they are removed.
+
+        :param notification_name: The name of the notification.
+        :type notification_name: str
+        :param serial: Whether the commands for the name execute in lanes.
+        :type serial: bool
+        :param key: Extracts the lane of a notification, or None for one lane per name (optional).
+        :type key: Optional[Callable[[INotification], Hashable]]
+        :return: None
+        """
+        with self.commandMapLock:
+            if serial:
+                self.commandSerialMap[notification_name] = key
+            else:
+                self.commandSerialMap.pop(notification_name, None)
+            if notification_name in self.commandMap:
+                self._reroute(notification_name)
+
+    def preload_commands(self) -> threading.Thread:
+        """
+        Import the commands registered by import path in a background thread.
+
+        Lets a process start without importing its command modules, and
+        then warm them up while it waits for its first notifications. A
+        command that fails to import is left to raise when it is first
+        executed.
+
+        :return: The started daemon thread, which may be joined.
+        :rtype: threading.Thread
+        """
+        def preload() -> None:
+            with self.commandMapLock:
+                pending = list(self.commandPathMap)
+            for notification_name in pending:
+                with self.commandMapLock:
+                    factory = self.commandMap.get(notification_name)
+                    path = self.commandPathMap.get(notification_name)
+                if factory is None or path is None:
+                    continue
+                try:
+                    self._bind_command(notification_name, factory, self._resolve_path(path))
+                except (ImportError, AttributeError):
+                    continue
+
+        thread = threading.Thread(target=preload, name=f"{self.multitonKey}-preload-commands", daemon=True)
+        thread.start()
+        return thread
+
+    def _import_factory(self, notification_name: str, path: str) -> Callable[[], ICommand]:
+        """
+        Build a factory importing a command class on its first call.
+
+        Once imported, the command class replaces this factory in the
+        `commandMap` and in the route of the notification, so later
+        executions construct it directly.
+
+        :param notification_name: The name of the notification the command handles.
+        :type notification_name: str
+        :param path: The `module:attribute` import path of the command class or factory.
+        :type path: str
+        :return: A factory importing, binding and then calling the command factory.
+        :rtype: Callable[[], ICommand]
+        """
+        def factory() -> ICommand:
+            resolved = self._resolve_path(path)
+            self._bind_command(notification_name, factory, resolved)
+            return resolved()
+
+        return factory
+
+    def _path_factory(self, path: str) -> Callable[[], ICommand]:
+        """
+        Build a factory importing a command class on its first call, for a command added with `add_command`.
+
+        :param path: The `module:attribute` import path of the command class or factory.
+        :type path: str
+        :return: A factory importing once and then calling the command factory.
+        :rtype: Callable[[], ICommand]
+        """
+        resolved: Optional[Callable[[], ICommand]] = None
+
+        def factory() -> ICommand:
+            nonlocal resolved
+            if resolved is None:
+                resolved = self._resolve_path(path)
+            return resolved()
+
+        return factory
+
+    def _bind_command(self, notification_name: str, factory: Callable[[], ICommand],
+                      resolved: Callable[[], ICommand]) -> None:
+        """
+        Replace an importing factory with the command factory it resolved to.
+
+        Does nothing if the command was replaced or removed meanwhile.
+
+        :param notification_name: The name of the notification the command handles.
+        :type notification_name: str
+        :param factory: The importing factory registered for the notification.
+        :type factory: Callable[[], ICommand]
+        :param resolved: The imported command class or factory.
+        :type resolved: Callable[[], ICommand]
+        :return: None
+        """
+        with self.commandMapLock:
+            if self.commandMap.get(notification_name) is not factory:
+                return
+            self.commandMap[notification_name] = resolved
+            del self.commandPathMap[notification_name]
+            self._reroute(notification_name)
+
+    @staticmethod
+    def _resolve_path(path: str) -> Callable[[], ICommand]:
+        """
+        Import the command class or factory at an import path.
+
+        :param path: A `module:attribute` path, where the attribute may be dotted,
+            or a dotted `module.attribute` path.
+        :type path: str
+        :return: The command class or factory.
+        :rtype: Callable[[], ICommand]
+        :raises ImportError: If the module cannot be imported.
+        :raises AttributeError: If the module has no such attribute.
+        """
+        module_name, _, attribute = path.partition(":") if ":" in path else path.rpartition(".")
+        target: Any = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            target = getattr(target, name)
+        return cast(Callable[[], ICommand], target)
+
+    @staticmethod
+    def _check_reuse(reuse: Optional[str]) -> None:
+        """
+        Check a command reuse mode.
+
+        :param reuse: The reuse mode, or None.
+        :type reuse: Optional[str]
+        :return: None
+        :raises ValueError: If `reuse` is not one of the reuse modes.
+        """
+        if reuse not in (None, Controller.REUSE_SINGLETON, Controller.REUSE_THREAD):
+            raise ValueError(f"Unknown command reuse mode: {reuse!r}")
+
+    def _drop_guards(self, notification_name: str,
+                     keep: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Drop the guards of the commands registered for a notification name, along with the commands
+        added with `add_command`, and the rejection counts of the guards no other registration uses.
+        Called with the command map lock held.
+
+        :param notification_name: The name of the notification.
+        :type notification_name: str
+        :param keep: A guard about to be registered again, whose count is kept (optional).
+        :type keep: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        dropped = [self.commandGuardMap.pop(notification_name, None)]
+        dropped.extend(guard for _, _, guard in self.commandListMap.pop(notification_name, ()))
+        guards = {guard for guard in dropped if guard is not None and guard is not keep}
+        if not guards:
+            return
+        guards.difference_update(self.commandGuardMap.values())
+        for commands in self.commandListMap.values():
+            guards.difference_update(guard for _, _, guard in commands)
+        with self.commandRejectionLock:
+            for guard in guards:
+                self.commandRejectionMap.pop(guard, None)
+
+    def _reroute(self, notification_name: str) -> None:
+        """
+        Rebuild the route of a registered notification name after its commands changed.
+        Called with the command map lock held.
+
+        :param notification_name: The name of the notification.
+        :type notification_name: str
+        :return: None
+        """
+        route = self._command_route(notification_name)
+        observer = self.commandObserverMap.get(notification_name)
+        if observer is not None and self.view:
+            observer.notify_method = route
+            self.view.invalidate_route(notification_name)
+
+    def _command_route(self, notification_name: str) -> Callable[[INotification], Any]:
+        """
+        Build the executor for the commands registered for a notification name,
+        and the callable the `View` invokes for it. Called with the command map lock held.
+
+        The executor is stored in the `commandExecutorMap` and returned, so
+        dispatch does not look the notification name up a second time.
+        Subclasses that override `execute_command` are routed through it
+        instead, so the override still sees every notification, except for
+        commands registered for a pattern: the override receives the
+        concrete name, which it could not find them by, so they are routed
+        to their executor directly.
+
+        :param notification_name: The name of the notification the commands handle.
+        :type notification_name: str
+        :return: The callable to register with the `View`.
+        :rtype: Callable[[INotification], Any]
+        """
+        executors = [self._command_executor(self.commandMap[notification_name],
+                                            self.commandReuseMap.get(notification_name),
+                                            self.commandGuardMap.get(notification_name))]
+        for factory, reuse, guard in self.commandListMap.get(notification_name, ()):
+            executors.append(self._command_executor(factory, reuse, guard))
+
+        fan_out = self.commandFanOutMap.get(notification_name)
+        timeout = self.commandTimeoutMap.get(notification_name, self.commandTimeout)
+        if fan_out == Controller.FAN_OUT_THREADS and (len(executors) > 1 or timeout is not None):
+            executor = self._fan_out_threads(executors, timeout)
+        elif fan_out == Controller.FAN_OUT_ASYNCIO:
+            executor = self._fan_out_asyncio(executors, timeout)
+        elif len(executors) > 1:
+            executor = self._fan_out_sequence(executors)
+        else:
+            executor = executors[0]
+
+        lane = self.commandSerialMap.get(notification_name)
+        serial = notification_name in self.commandSerialMap
+        command_queue = self.commandQueue
+        if command_queue is not None:
+            # The thread and asyncio fan-outs apply the timeout themselves
+            queued_timeout = None if fan_out in (Controller.FAN_OUT_THREADS, Controller.FAN_OUT_ASYNCIO) else timeout
+            executor = self._queued(command_queue, executor, lane, queued_timeout, serial)
+        elif serial:
+            executor = self._serial(executor, lane)
+
+        if (command_queue is not None or fan_out == Controller.FAN_OUT_ASYNCIO
+                or (fan_out == Controller.FAN_OUT_THREADS and timeout is not None)):
+            self.commandOffloadSet.add(notification_name)
+        else:
+            self.commandOffloadSet.discard(notification_name)
+
+        self.commandExecutorMap[notification_name] = executor
+        if type(self).execute_command is not Controller.execute_command and not View._is_pattern(notification_name):
+            return self.execute_command
+        return executor
+
+    def _command_executor(self, factory: Callable[[], ICommand], reuse: Optional[str],
+                          guard: Optional[Callable[[INotification], bool]] = None) -> Callable[[INotification], Any]:
+        """
+        Build the callable executing one command registration.
+        Called with the command map lock held.
+
+        The callable closes over the factory itself, and creates a new
+        command for each notification, or reuses one as requested by the
+        reuse mode of the registration. It returns the result of the
+        command's `execute`, which is an awaitable for a coroutine method.
+        With a guard, notifications failing it are counted in the
+        `commandRejectionMap` and skipped before the command is created.
+
+        :param factory: Callable that returns an instance of ICommand.
+        :type factory: Callable[[], ICommand]
+        :param reuse: The reuse mode of the registration, or None.
+        :type reuse: Optional[str]
+        :param guard: The guard of the registration, or None.
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: The callable executing the command.
+        :rtype: Callable[[INotification], Any]
+        """
+        executor = self._reuse_executor(factory, reuse)
+        if guard is None:
+            return executor
+
+        rejections = self.commandRejectionMap
+        rejections_lock = self.commandRejectionLock
+        with rejections_lock:
+            rejections.setdefault(guard, 0)
+
+        def execute_guarded(notification: INotification) -> Any:
+            if guard(notification):
+                return executor(notification)
+            with rejections_lock:
+                if guard in rejections:
+                    rejections[guard] += 1
+            return None
+
+        return execute_guarded
+
+    def _reuse_executor(self, factory: Callable[[], ICommand], reuse: Optional[str]) -> Callable[[INotification], Any]:
+        """
+        Build the callable creating or reusing a command, as requested by a reuse mode, and executing it.
+
+        :param factory: Callable that returns an instance of ICommand.
+        :type factory: Callable[[], ICommand]
+        :param reuse: The reuse mode, or None.
+        :type reuse: Optional[str]
+        :return: The callable executing the command.
+        :rtype: Callable[[INotification], Any]
+        """
+        key = self.multitonKey
+
+        def create() -> Any:
+            command = factory()
+            command.initialize_notifier(key)
+            return command
+
+        if reuse == Controller.REUSE_SINGLETON:
+            lock = threading.Lock()
+            shared: Any = None
+
+            def execute_shared(notification: INotification) -> Any:
+                nonlocal shared
+                command = shared
+                if command is None:
+                    with lock:
+                        command = shared = shared or create()
+                return command.execute(notification)
+
+            return execute_shared
+
+        if reuse == Controller.REUSE_THREAD:
+            local = threading.local()
+
+            def execute_local(notification: INotification) -> Any:
+                try:
+                    command = local.command
+                except AttributeError:
+                    command = local.command = create()
+                return command.execute(notification)
+
+            return execute_local
+
+        def execute(notification: INotification) -> Any:
+            command: Any = factory()
+            command.initialize_notifier(key)
+            return command.execute(notification)
+
+        return execute
+
+    @staticmethod
+    def _fan_out_sequence(executors: List[Callable[[INotification], Any]]) -> Callable[[INotification], None]:
+        """
+        Build the callable executing several commands in order.
+
+        :param executors: The callables executing each command.
+        :type executors: List[Callable[[INotification], Any]]
+        :return: The callable executing the commands.
+        :rtype: Callable[[INotification], None]
+        """
+        def execute_sequence(notification: INotification) -> None:
+            for executor in executors:
+                executor(notification)
+
+        return execute_sequence
+
+    def _fan_out_threads(self, executors: List[Callable[[INotification], Any]],
+                         timeout: Optional[float] = None) -> Callable[[INotification], None]:
+        """
+        Build the callable executing several commands concurrently on the thread pool of the core.
+
+        :param executors: The callables executing each command.
+        :type executors: List[Callable[[INotification], Any]]
+        :param timeout: The number of seconds to wait for the commands, or None to wait for them all.
+        :type timeout: Optional[float]
+        :return: The callable executing the commands.
+        :rtype: Callable[[INotification], None]
+        """
+        from concurrent.futures import wait
+
+        first, rest = executors[0], executors[1:]
+        local = self.commandPoolLocal
+
+        if timeout is not None:
+            def execute_threads_timed(notification: INotification) -> None:
+                if getattr(local, "worker", False):
+                    for executor in executors:
+                        executor(notification)
+                    return
+                futures, pools = self._submit(executors, notification)
+                done, pending = wait(futures, timeout)
+                if pending:
+                    for future in pending:
+                        future.cancel()
+                    for pool in pools:
+                        self._recycle_pool(pool)
+                    for _ in pending:
+                        self._command_timed_out(notification, timeout)
+                for future in futures:
+                    if future in done:
+                        future.result()
+
+            return execute_threads_timed
+
+        def execute_threads(notification: INotification) -> None:
+            if getattr(local, "worker", False):
+                for executor in executors:
+                    executor(notification)
+                return
+            futures, _ = self._submit(rest, notification)
+            try:
+                first(notification)
+            finally:
+                wait(futures)
+            for future in futures:
+                future.result()
+
+        return execute_threads
+
+    def _fan_out_asyncio(self, executors: List[Callable[[INotification], Any]],
+                         timeout: Optional[float] = None) -> Callable[[INotification], None]:
+        """
+        Build the callable executing several commands and running their awaitables as asyncio tasks.
+
+        :param executors: The callables executing each command.
+        :type executors: List[Callable[[INotification], Any]]
+        :param timeout: The number of seconds each task may run before it is cancelled, or None.
+        :type timeout: Optional[float]
+        :return: The callable executing the commands.
+        :rtype: Callable[[INotification], None]
+        """
+        import asyncio
+        import inspect
+
+        tasks = self.commandTasks
+
+        async def run(awaitable: Any, notification: INotification) -> None:
+            if timeout is None:
+                await awaitable
+                return
+            try:
+                await asyncio.wait_for(awaitable, timeout)
+            except asyncio.TimeoutError:
+                self._command_timed_out(notification, timeout)
+
+        async def gather(awaitables: List[Any], notification: INotification) -> None:
+            await asyncio.gather(*(run(awaitable, notification) for awaitable in awaitables))
+
+        def execute_tasks(notification: INotification) -> None:
+            awaitables = [result for result in (executor(notification) for executor in executors)
+                          if inspect.isawaitable(result)]
+            if not awaitables:
+                return
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(gather(awaitables, notification))
+                return
+
+            def report(task: "Future[Any]") -> None:
+                tasks.discard(task)
+                error = None if task.cancelled() else task.exception()
+                if error is not None:
+                    self._command_failed(notification, error)
+
+            for awaitable in awaitables:
+                task = asyncio.ensure_future(run(awaitable, notification))
+                tasks.add(task)
+                task.add_done_callback(report)
+
+        return execute_tasks
+
+    @staticmethod
+    def _serial(executor: Callable[[INotification], Any],
+                key: Optional[Callable[[INotification], Hashable]]) -> Callable[[INotification], Any]:
+        """
+        Build the callable executing the commands for a notification in its lane.
+
+        Each lane is a reentrant lock. Key lanes are created on demand and
+        discarded once no thread is using them.
+
+        :param executor: The callable executing the commands.
+        :type executor: Callable[[INotification], Any]
+        :param key: Extracts the lane of a notification, or None for a single lane.
+        :type key: Optional[Callable[[INotification], Hashable]]
+        :return: The callable executing the commands in their lane.
+        :rtype: Callable[[INotification], Any]
+        """
+        if key is None:
+            lock = threading.RLock()
+
+            def execute_serial(notification: INotification) -> Any:
+                with lock:
+                    return executor(notification)
+
+            return execute_serial
+
+        lanes: Dict[Hashable, List[Any]] = dict()
+        lanes_lock = threading.Lock()
+
+        def execute_lane(notification: INotification) -> Any:
+            lane = key(notification)
+            with lanes_lock:
+                entry = lanes.get(lane)
+                if entry is None:
+                    entry = lanes[lane] = [threading.RLock(), 0]
+                entry[1] += 1
+            try:
+                with entry[0]:
+                    return executor(notification)
+            finally:
+                with lanes_lock:
+                    entry[1] -= 1
+                    if not entry[1]:
+                        del lanes[lane]
+
+        return execute_lane
+
+    @staticmethod
+    def _queued(command_queue: "CommandQueue", executor: Callable[[INotification], Any],
+                key: Optional[Callable[[INotification], Hashable]] = None,
+                timeout: Optional[float] = None, serial: bool = False) -> Callable[[INotification], None]:
+        """
+        Build the callable queueing the execution of the commands for a notification.
+
+        :param command_queue: The command queue.
+        :type command_queue: CommandQueue
+        :param executor: The callable executing the commands.
+        :type executor: Callable[[INotification], Any]
+        :param key: Extracts the lane of a notification, or None to queue by notification name.
+        :type key: Optional[Callable[[INotification], Hashable]]
+        :param timeout: The number of seconds the commands may run, or None.
+        :type timeout: Optional[float]
+        :param serial: Whether the commands execute in FIFO lanes.
+        :type serial: bool
+        :return: The callable queueing the commands.
+        :rtype: Callable[[INotification], None]
+        """
+        put = command_queue.put
+        if key is None:
+            def execute_queued(notification: INotification) -> None:
+                put(executor, notification, None, timeout, serial)
+
+            return execute_queued
+
+        def execute_queued_lane(notification: INotification) -> None:
+            put(executor, notification, key(notification), timeout, serial)
+
+        return execute_queued_lane
+
+    def _recycle_pool(self, pool: "ThreadPoolExecutor") -> None:
+        """
+        Replace the thread pool of the core after a command timed out on it.
+
+        The threads of the old pool exit once their commands return, and
+        the next fan-out creates a new pool.
+
+        :param pool: The pool a command timed out on.
+        :type pool: ThreadPoolExecutor
+        :return: None
+        """
+        with self.commandMapLock:
+            if self.commandPool is pool:
+                self.commandPool = None
+        pool.shutdown(wait=False)
+
+    def _submit(self, executors: List[Callable[[INotification], Any]], notification: INotification
+                ) -> Tuple[List["concurrent.futures.Future[Any]"], List["ThreadPoolExecutor"]]:
+        """
+        Submit the execution of commands to the thread pool of the core.
+
+        Another sender may recycle the pool after a timeout, see
+        `_recycle_pool`, once this one has got it. The commands not yet
+        submitted then go to the new pool.
+
+        :param executors: The callables executing each command.
+        :type executors: List[Callable[[INotification], Any]]
+        :param notification: The notification to execute them with.
+        :type notification: INotification
+        :return: The futures of the commands, and the pools they were submitted to.
+        :rtype: Tuple[List[concurrent.futures.Future], List[ThreadPoolExecutor]]
+        :raises RuntimeError: If the pool was shut down without being replaced.
+        """
+        futures = []
+        pools = []
+        pool = self._command_pool()
+        for executor in executors:
+            while True:
+                try:
+                    futures.append(pool.submit(executor, notification))
+                    break
+                except RuntimeError:
+                    if self.commandPool is pool:
+                        raise
+                    pool = self._command_pool()
+            if pool not in pools:
+                pools.append(pool)
+        return futures, pools
+
+    def _command_pool(self) -> "ThreadPoolExecutor":
+        """
+        Return the thread pool of the core, creating it on first use.
+
+        :return: The thread pool.
+        :rtype: ThreadPoolExecutor
+        """
+        pool = self.commandPool
+        if pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            local = self.commandPoolLocal
+
+            def initializer() -> None:
+                local.worker = True
+
+            with self.commandMapLock:
+                pool = self.commandPool
+                if pool is None:
+                    pool = self.commandPool = ThreadPoolExecutor(Controller.FAN_OUT_WORKERS,
+                                                                 f"{self.multitonKey}-command", initializer)
+        return pool
 
     def execute_command(self, notification: INotification) -> None:
         """
@@ -139,12 +1207,10 @@ class Controller(IController):
         :return: None
         """
         with self.commandMapLock:
-            factory = self.commandMap.get(notification.name)
-        if factory is None: return
+            executor = self.commandExecutorMap.get(notification.name)
+        if executor is None: return
 
-        command = factory()
-        command.initialize_notifier(self.multitonKey)
-        command.execute(notification)
+        executor(notification)
 
     def has_command(self, notification_name: str) -> bool:
         """
@@ -170,6 +1236,15 @@ class Controller(IController):
             if notification_name in self.commandMap:
                 if self.view:
                     self.view.remove_observer(notification_name, self)
+                self.commandObserverMap.pop(notification_name, None)
+                self.commandPathMap.pop(notification_name, None)
+                self.commandReuseMap.pop(notification_name, None)
+                self.commandExecutorMap.pop(notification_name, None)
+                self._drop_guards(notification_name)
+                self.commandFanOutMap.pop(notification_name, None)
+                self.commandSerialMap.pop(notification_name, None)
+                self.commandTimeoutMap.pop(notification_name, None)
+                self.commandOffloadSet.discard(notification_name)
                 del self.commandMap[notification_name]
 
     @classmethod
@@ -182,4 +1257,10 @@ class Controller(IController):
         :return: None
         """
         with cls.instanceMapLock:
-            del cls.instanceMap[key]
+            controller = cls.instanceMap.pop(key)
+        pool = getattr(controller, "commandPool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        command_queue = getattr(controller, "commandQueue", None)
+        if command_queue is not None:
+            command_queue.stop(wait=False)
@@ -5,7 +5,7 @@
 # Your reuse is governed by the BSD 3-Clause License
 
 import threading
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterable, Optional
 
 from puremvc.interfaces import IModel, IProxy
 
@@ -21,6 +21,7 @@ class Model(IModel):
 
     - Maintain a cache of `IProxy` instances.
     - Provide methods for registering, retrieving, and removing `IProxy` instances.
+    - Construct `IProxy` instances registered by factory on first retrieval.
 
     Your application must register `IProxy` instances with the `Model`.
     Typically, you use an `ICommand` to create and register `IProxy`
@@ -56,6 +57,8 @@ class Model(IModel):
         Model.instanceMap[key] = self
         self.proxyMap: Dict[str, IProxy] = dict()
         self.proxyMapLock: threading.Lock = threading.Lock()
+        self.proxyFactoryMap: Dict[str, Callable[[], IProxy]] = dict()
+        self.proxyFactoryLock: threading.RLock = threading.RLock()
         self.initialize_model()
 
     def initialize_model(self) -> None:
@@ -95,10 +98,50 @@ class Model(IModel):
         :type proxy: IProxy
         :return: None
         """
-        proxy.initialize_notifier(self.multitonKey)
+        self.register_proxies((proxy,))
+
+    def register_proxies(self, proxies: Iterable[IProxy]) -> None:
+        """
+        Register several `IProxy` instances with the `Model`.
+
+        The proxies are added to the proxy map under a single lock
+        acquisition, then each proxy's `on_register` is called, in order.
+
+        :param proxies: The `IProxy` instances to be held by the `Model`.
+        :type proxies: Iterable[IProxy]
+        :return: None
+        """
+        proxies = list(proxies)
+        for proxy in proxies:
+            proxy.initialize_notifier(self.multitonKey)
         with self.proxyMapLock:
-            self.proxyMap[proxy.proxy_name] = proxy
-        proxy.on_register()
+            for proxy in proxies:
+                self.proxyMap[proxy.proxy_name] = proxy
+                self.proxyFactoryMap.pop(proxy.proxy_name, None)
+        for proxy in proxies:
+            proxy.on_register()
+
+    def register_proxy_factory(self, proxy_name: str, factory: Callable[[], IProxy]) -> None:
+        """
+        Register a factory for an `IProxy` to be constructed on first use.
+
+        The `IProxy` is constructed, has its notifier initialized and is
+        sent `on_register` the first time it is retrieved, so a core only
+        pays for the proxies it uses. Concurrent first retrievals construct
+        it once, the others wait for and receive the same instance.
+
+        `has_proxy` reports a pending factory as registered, and
+        `remove_proxy` discards it without constructing the proxy.
+
+        :param proxy_name: The name the `IProxy` will be retrieved by.
+        :type proxy_name: str
+        :param factory: Callable that returns the `IProxy` instance.
+        :type factory: Callable[[], IProxy]
+        :return: None
+        """
+        with self.proxyMapLock:
+            self.proxyMap.pop(proxy_name, None)
+            self.proxyFactoryMap[proxy_name] = factory
 
     def retrieve_proxy(self, proxy_name: str) -> Optional[IProxy]:
         """
@@ -110,7 +153,40 @@ class Model(IModel):
         :rtype: Optional[IProxy]
         """
         with self.proxyMapLock:
-            return self.proxyMap.get(proxy_name)
+            proxy = self.proxyMap.get(proxy_name)
+            if proxy is not None or proxy_name not in self.proxyFactoryMap:
+                return proxy
+        return self._construct_proxy(proxy_name)
+
+    def _construct_proxy(self, proxy_name: str) -> Optional[IProxy]:
+        """
+        Construct and register an `IProxy` from its pending factory.
+
+        Constructions are serialized, and the maps are checked again once
+        the construction lock is held, so a proxy constructed meanwhile by
+        another thread is returned instead of being constructed twice.
+
+        :param proxy_name: The name of the proxy.
+        :type proxy_name: str
+        :return: The constructed `IProxy`, or the one registered meanwhile.
+        :rtype: Optional[IProxy]
+        """
+        with self.proxyFactoryLock:
+            with self.proxyMapLock:
+                proxy = self.proxyMap.get(proxy_name)
+                factory = self.proxyFactoryMap.get(proxy_name)
+            if proxy is not None or factory is None:
+                return proxy
+
+            proxy = factory()
+            proxy.initialize_notifier(self.multitonKey)
+            with self.proxyMapLock:
+                if self.proxyFactoryMap.get(proxy_name) is not factory:
+                    return self.proxyMap.get(proxy_name)
+                del self.proxyFactoryMap[proxy_name]
+                self.proxyMap[proxy_name] = proxy
+        proxy.on_register()
+        return proxy
 
     def has_proxy(self, proxy_name: str) -> bool:
         """
@@ -122,7 +198,7 @@ class Model(IModel):
         :rtype: bool
         """
         with self.proxyMapLock:
-            return self.proxyMap.get(proxy_name) is not None
+            return self.proxyMap.get(proxy_name) is not None or proxy_name in self.proxyFactoryMap
 
     def remove_proxy(self, proxy_name: str) -> Optional[IProxy]:
         """
@@ -134,6 +210,7 @@ class Model(IModel):
         :rtype: Optional[IProxy]
         """
         with self.proxyMapLock:
+            self.proxyFactoryMap.pop(proxy_name, None)
             proxy = self.proxyMap.get(proxy_name)
             if proxy:
                 del self.proxyMap[proxy_name]
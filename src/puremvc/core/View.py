@@ -4,12 +4,18 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import itertools
+import sys
 import threading
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Iterable, Optional, Sequence, Tuple, Union
 
 from puremvc.interfaces import IView, IMediator, IObserver, INotification
 from puremvc.patterns.observer import Observer
 
+Route = Tuple[Callable[[INotification], None], ...]
+Observers = Union[IObserver, List[IObserver]]
+Interest = Union[str, Tuple[str, str]]
+
 
 class View(IView):
     """
@@ -31,6 +37,12 @@ class View(IView):
 
     Notifying the `IObservers` of a given `INotification` when it broadcast.
 
+    Observers may be registered for a name pattern instead of an exact
+    name. Patterns are split into segments on `.`, where a `*` segment
+    matches exactly one segment and a `#` segment matches zero or more,
+    so `order.*` matches `order.created`, and `order.#` matches `order`,
+    `order.created` and `order.item.created`.
+
     See Also
     --------
     :class:`puremvc.patterns.mediator.Mediator`
@@ -43,6 +55,18 @@ class View(IView):
     """MULTITON_MSG (str): Multiton error message"""
     MULTITON_MSG = "View multiton instance for this key is already constructed!"
 
+    """SEPARATOR (str): Separator between the segments of a notification name"""
+    SEPARATOR = "."
+
+    """WILDCARD_ONE (str): Pattern segment matching exactly one name segment"""
+    WILDCARD_ONE = "*"
+
+    """WILDCARD_MANY (str): Pattern segment matching zero or more name segments"""
+    WILDCARD_MANY = "#"
+
+    """TRANSIENT_ROUTES (int): Maximum number of cached routes for names without observers of their own"""
+    TRANSIENT_ROUTES = 1024
+
     def __init__(self, key: str) -> None:
         """
         Constructor.
@@ -61,8 +85,15 @@ class View(IView):
         View.instanceMap[key] = self
         self.mediatorMap: Dict[str, IMediator] = dict()
         self.mediatorMapLock: threading.Lock = threading.Lock()
-        self.observerMap: Dict[str, List[IObserver]] = dict()
+        self.mediatorInterests: Dict[str, List[str]] = dict()
+        self.mediatorFactoryMap: Dict[str, Tuple[Callable[[], IMediator], List[Tuple[str, IObserver]]]] = dict()
+        self.mediatorFactoryLock: threading.RLock = threading.RLock()
+        self.observerMap: Dict[str, Observers] = dict()
         self.observerMapLock: threading.Lock = threading.Lock()
+        self.routeMap: Dict[str, Union[Callable[[INotification], None], Route]] = dict()
+        self.transientRoutes: Dict[str, None] = dict()
+        self.patternTrie: Dict[Optional[str], Any] = dict()
+        self.patternCounter = itertools.count()
         self.initialize_view()
 
     @classmethod
@@ -96,17 +127,72 @@ class View(IView):
         """
         Register an `IObserver` to be notified of `INotifications` with a given name.
 
+        The name is interned, so notifications sent with the canonical name
+        object (any string literal, or a dynamically built name passed
+        through `sys.intern` once) are matched by identity during dispatch.
+
+        The name may be a pattern containing `*` or `#` segments, in which
+        case the observer is notified of every matching notification.
+
+        The first observer for a name is stored on its own, and is only
+        promoted to a list when a second observer registers, since most
+        names are observed by a single command or mediator.
+
+        The observer list is kept sorted by descending priority. The
+        observer is placed after those with the same or a higher priority,
+        found by binary search, so equal priorities keep registration order.
+
         :param notification_name: The name of the notification to register the observer for.
         :type notification_name: str
         :param observer: The observer object to register.
         :type observer: IObserver
         :return: None
         """
+        self.register_observers(((notification_name, observer),))
+
+    def register_observers(self, registrations: Iterable[Tuple[str, IObserver]]) -> None:
+        """
+        Register several `IObservers`, each for a given notification name.
+
+        All registrations are applied under a single acquisition of the
+        observer map lock, and the routes they affect are invalidated once,
+        see `register_observer`.
+
+        :param registrations: The `(notification_name, observer)` pairs to register, in order.
+        :type registrations: Iterable[Tuple[str, IObserver]]
+        :return: None
+        """
+        registrations = [(sys.intern(name) if type(name) is str else name, observer)
+                         for name, observer in registrations]
         with self.observerMapLock:
-            if notification_name in self.observerMap:
-                self.observerMap[notification_name].append(observer)
+            has_pattern = False
+            for notification_name, observer in registrations:
+                is_pattern = self._is_pattern(notification_name)
+                has_pattern = has_pattern or is_pattern
+                entry = self.observerMap.get(notification_name)
+                if entry is None:
+                    self.observerMap[notification_name] = observer
+                    if is_pattern:
+                        self._insert_pattern(notification_name)
+                else:
+                    observers = entry if isinstance(entry, list) else [entry]
+                    if observers[-1].priority >= observer.priority:
+                        observers.append(observer)
+                    else:
+                        low, high = 0, len(observers)
+                        while low < high:
+                            middle = (low + high) // 2
+                            if observers[middle].priority < observer.priority:
+                                high = middle
+                            else:
+                                low = middle + 1
+                        observers.insert(low, observer)
+                    self.observerMap[notification_name] = observers
+            if has_pattern:
+                self._clear_routes()
             else:
-                self.observerMap[notification_name] = [observer]
+                for notification_name, _ in registrations:
+                    self.routeMap.pop(notification_name, None)
 
     def notify_observers(self, notification: INotification) -> None:
         """
@@ -116,20 +202,314 @@ class View(IView):
         list are notified and are passed a reference to the `INotification` in
         the order in which they were registered.
 
+        Dispatch goes through the compiled route for the notification name,
+        so a notification costs one dictionary lookup followed by a direct
+        call to each observer's final callable, or a single call when the
+        name has one observer. The route is an immutable snapshot, so
+        observers may be added or removed while it is running.
+
+        Observers restricted to a notification type are only notified of
+        notifications carrying that type, while unrestricted observers are
+        notified of every type.
+
         :param notification: The notification to be sent to the observers.
         :type notification: INotification
         :return: None
         """
-        # Get a reference to the observer list for this notification name
+        route = self.routeMap.get(notification.name)
+        if route is None:
+            route = self._compile_route(notification.name)
+        if isinstance(route, tuple):
+            for notify in route:
+                notify(notification)
+        else:
+            route(notification)
+
+    def invalidate_route(self, notification_name: str) -> None:
+        """
+        Discard the compiled route for a given notification name.
+
+        The route is rebuilt from the observer list on the next dispatch.
+        Call this after mutating an `IObserver` that is already registered,
+        for example after replacing its `notify_method`. Invalidating a
+        pattern discards the routes of every name.
+
+        :param notification_name: The name of the notification whose route is stale.
+        :type notification_name: str
+        :return: None
+        """
+        with self.observerMapLock:
+            if self._is_pattern(notification_name):
+                self._clear_routes()
+            else:
+                self.routeMap.pop(notification_name, None)
+
+    def _clear_routes(self) -> None:
+        """
+        Discard the compiled routes of every name. Called with the observer map lock held.
+
+        :return: None
+        """
+        self.routeMap.clear()
+        self.transientRoutes.clear()
+
+    def _compile_route(self, notification_name: str) -> Union[Callable[[INotification], None], Route]:
+        """
+        Build and cache the route for a notification name.
+
+        A route is a flat tuple of the final callables to invoke, in
+        observer order, or the callable itself when there is exactly one.
+        Plain `Observer` instances contribute their `notify_method`
+        directly, skipping the `notify_observer` hop.
+
+        Observers that may expire are wrapped so that, once they do, the
+        dispatch that expired them removes them in constant time, see
+        `_expiring_route`. Expired observers still listed, such as weak
+        observers whose interested object was collected between two
+        dispatches, are pruned by the next compilation.
+
+        Observers are ordered by descending priority. Within a priority,
+        observers registered for the exact name come first, followed by
+        those of each matching pattern, in pattern registration order.
+
+        If any of the observers is restricted to a notification type, the
+        route is instead a callable selecting the tuple for the type of
+        each notification, see `_typed_route`.
+
+        Names may be built dynamically, so the routes of names without
+        observers of their own, which are empty or only reach pattern
+        observers, are kept in a bounded cache: past `TRANSIENT_ROUTES`
+        of them, the oldest is discarded, and compiled again if needed.
+
+        :param notification_name: The name of the notification to compile a route for.
+        :type notification_name: str
+        :return: The compiled route.
+        :rtype: Union[Callable[[INotification], None], Route]
+        """
         with self.observerMapLock:
-            # Copy observers (observers[:]) from reference array to a working array,
-            observers = list(self.observerMap.get(notification.name) or [])
+            transient = notification_name not in self.observerMap
+            if not transient and type(notification_name) is str:
+                notification_name = sys.intern(notification_name)
+            sources = [notification_name]
+            sources.extend(pattern for pattern in self._match_patterns(notification_name) if pattern != notification_name)
+            observers: List[Tuple[str, IObserver]] = []
+            for source in sources:
+                if any(observer.expired for observer in self._observers(source)):
+                    self._prune_observers(source)
+                observers.extend((source, observer) for observer in self._observers(source))
+            if len(sources) > 1:
+                observers.sort(key=lambda entry: -entry[1].priority)
+
+            entries: List[Tuple[Optional[str], Callable[[INotification], None]]] = []
+            for source, observer in observers:
+                if (type(observer).notify_observer is not Observer.notify_observer
+                        or observer.max_calls is not None or observer.weak):
+                    entries.append((observer.notify_type, self._expiring_route(source, observer)))
+                elif observer.predicate is not None:
+                    entries.append((observer.notify_type, observer.notify_observer))
+                elif observer.notify_method is not None:
+                    entries.append((observer.notify_type, observer.notify_method))
+
+            route: Union[Callable[[INotification], None], Route] = tuple(notify for _, notify in entries)
+            if any(note_type is not None for note_type, _ in entries):
+                route = self._typed_route(entries)
+            elif len(entries) == 1:
+                route = entries[0][1]
+            self.routeMap[notification_name] = route
+            if transient:
+                self.transientRoutes[notification_name] = None
+                if len(self.transientRoutes) > View.TRANSIENT_ROUTES:
+                    evicted = next(iter(self.transientRoutes))
+                    del self.transientRoutes[evicted]
+                    self.routeMap.pop(evicted, None)
+            else:
+                self.transientRoutes.pop(notification_name, None)
+            return route
+
+    @staticmethod
+    def _typed_route(entries: List[Tuple[Optional[str], Callable[[INotification], None]]]) \
+            -> Callable[[INotification], None]:
+        """
+        Build a route for entries of which some are restricted to a notification type.
+
+        Holds a tuple per notification type, holding the entries restricted
+        to that type along with the unrestricted ones, in order, and a tuple
+        of the unrestricted entries only for the other types.
+
+        :param entries: The notification type and callable of each route entry, in order.
+        :type entries: List[Tuple[Optional[str], Callable[[INotification], None]]]
+        :return: A callable notifying the entries matching the type of each notification.
+        :rtype: Callable[[INotification], None]
+        """
+        untyped = tuple(notify for note_type, notify in entries if note_type is None)
+        typed = {note_type: tuple(notify for entry_type, notify in entries if entry_type in (None, note_type))
+                 for note_type, _ in entries if note_type is not None}
+
+        def notify(notification: INotification) -> None:
+            for entry in typed.get(notification.type, untyped):
+                entry(notification)
+
+        return notify
+
+    def _expiring_route(self, source: str, observer: IObserver) -> Callable[[INotification], None]:
+        """
+        Wrap an observer that may expire into a route entry.
+
+        Once the observer expires, the entry removes it in constant time,
+        without scanning an observer list or invalidating other names:
 
-        # since the reference array may change during the notification loo
-        # Safe iteration, create a shallow copy of observers or use an empty list if observers is None or falsy.
-        for observer in observers:
-            # Notify Observers from the working array
+        - An observer registered alone for its name or pattern, such as a
+          one-shot response waiter, is deleted from the observer map, along
+          with its pattern.
+        - The route of the notification being dispatched is dropped. Its
+          next dispatch compiles a new one, pruning the expired observer
+          from a list it shares with others.
+
+        The routes of other names matching the same pattern still call the
+        expired entry, which ignores the notification and drops their route
+        in turn.
+
+        :param source: The name or pattern the observer is registered for.
+        :type source: str
+        :param observer: The observer to wrap.
+        :type observer: IObserver
+        :return: A callable notifying the observer, and removing it once it expires.
+        :rtype: Callable[[INotification], None]
+        """
+        is_pattern = self._is_pattern(source)
+
+        def notify(notification: INotification) -> None:
             observer.notify_observer(notification)
+            if observer.expired:
+                with self.observerMapLock:
+                    if self.observerMap.get(source) is observer:
+                        del self.observerMap[source]
+                        if is_pattern:
+                            self._remove_pattern(source)
+                    self.routeMap.pop(notification.name, None)
+
+        return notify
+
+    def _observers(self, source: str) -> List[IObserver]:
+        """
+        Return the observers registered for a name or pattern as a list.
+        Called with the observer map lock held.
+
+        :param source: The name or pattern to look up.
+        :type source: str
+        :return: The registered observers, in priority order.
+        :rtype: List[IObserver]
+        """
+        entry = self.observerMap.get(source)
+        if entry is None:
+            return []
+        return entry if isinstance(entry, list) else [entry]
+
+    def _prune_observers(self, source: str) -> None:
+        """
+        Remove expired observers from an observer list. Called with the observer map lock held.
+
+        :param source: The name or pattern of the observer list to prune.
+        :type source: str
+        :return: None
+        """
+        observers = [observer for observer in self._observers(source) if not observer.expired]
+        if observers:
+            self.observerMap[source] = observers if len(observers) > 1 else observers[0]
+        else:
+            del self.observerMap[source]
+            if self._is_pattern(source):
+                self._remove_pattern(source)
+                self._clear_routes()
+
+    @classmethod
+    def _is_pattern(cls, notification_name: str) -> bool:
+        """
+        Check whether a notification name contains wildcard segments.
+
+        :param notification_name: The notification name to check.
+        :type notification_name: str
+        :return: True if any segment is a wildcard, False otherwise.
+        :rtype: bool
+        """
+        if cls.WILDCARD_ONE not in notification_name and cls.WILDCARD_MANY not in notification_name:
+            return False
+        segments = notification_name.split(cls.SEPARATOR)
+        return cls.WILDCARD_ONE in segments or cls.WILDCARD_MANY in segments
+
+    def _insert_pattern(self, pattern: str) -> None:
+        """
+        Add a pattern to the segment trie. Called with the observer map lock held.
+
+        :param pattern: The pattern to add.
+        :type pattern: str
+        :return: None
+        """
+        node = self.patternTrie
+        for segment in pattern.split(self.SEPARATOR):
+            node = node.setdefault(segment, dict())
+        node[None] = (next(self.patternCounter), pattern)
+
+    def _remove_pattern(self, pattern: str) -> None:
+        """
+        Remove a pattern from the segment trie, pruning empty branches.
+        Called with the observer map lock held.
+
+        :param pattern: The pattern to remove.
+        :type pattern: str
+        :return: None
+        """
+        path: List[Tuple[Optional[str], Dict[Optional[str], Any]]] = [(None, self.patternTrie)]
+        for segment in pattern.split(self.SEPARATOR):
+            path.append((segment, path[-1][1][segment]))
+        del path[-1][1][None]
+        for (segment, node), (_, parent) in zip(reversed(path[1:]), reversed(path[:-1])):
+            if node:
+                break
+            del parent[segment]
+
+    def _match_patterns(self, notification_name: str) -> List[str]:
+        """
+        Find the registered patterns matching a notification name.
+        Called with the observer map lock held.
+
+        :param notification_name: The concrete notification name.
+        :type notification_name: str
+        :return: The matching patterns, in registration order.
+        :rtype: List[str]
+        """
+        if not self.patternTrie:
+            return []
+        matches: Dict[str, int] = dict()
+        self._match_node(self.patternTrie, notification_name.split(self.SEPARATOR), 0, matches)
+        return sorted(matches, key=matches.__getitem__)
+
+    @classmethod
+    def _match_node(cls, node: Dict[Optional[str], Any], segments: List[str], index: int,
+                    matches: Dict[str, int]) -> None:
+        """
+        Collect the patterns below a trie node matching `segments[index:]`.
+
+        :param node: The trie node to match from.
+        :param segments: The segments of the concrete notification name.
+        :param index: The index of the first segment left to match.
+        :param matches: Collects each matching pattern with its registration order.
+        :return: None
+        """
+        if index == len(segments):
+            if None in node:
+                order, pattern = node[None]
+                matches[pattern] = order
+        else:
+            for key in (segments[index], cls.WILDCARD_ONE):
+                child = node.get(key)
+                if child is not None:
+                    cls._match_node(child, segments, index + 1, matches)
+
+        child = node.get(cls.WILDCARD_MANY)
+        if child is not None:
+            for rest in range(index, len(segments) + 1):
+                cls._match_node(child, segments, rest, matches)
 
     def remove_observer(self, notification_name: str, notify_context: Any) -> None:
         """
@@ -142,16 +522,25 @@ class View(IView):
         :return: None
         """
         with self.observerMapLock:
-            observers = self.observerMap.get(notification_name)
-            if observers is None: return
+            observers = self._observers(notification_name)
+            if not observers: return
 
             for i, observer in enumerate(observers):
                 if observer.compare_notify_context(notify_context):
                     observers.pop(i)
                     break
 
+            is_pattern = self._is_pattern(notification_name)
             if len(observers) == 0:
                 del self.observerMap[notification_name]
+                if is_pattern:
+                    self._remove_pattern(notification_name)
+            elif len(observers) == 1:
+                self.observerMap[notification_name] = observers[0]
+            if is_pattern:
+                self._clear_routes()
+            else:
+                self.routeMap.pop(notification_name, None)
 
     def register_mediator(self, mediator: IMediator) -> None:
         """
@@ -167,26 +556,323 @@ class View(IView):
         and registering it as an `Observer` for all `INotifications` the
         `IMediator` is interested in.
 
+        Interests given as `(name, type)` tuples, and interests guarded by a
+        predicate from `list_notification_predicates`, get their own
+        `Observer`, restricted to that notification type and predicate.
+
+        The names registered are recorded, so that `remove_mediator` does
+        not need to ask the `IMediator` for its interests again.
+
         :param mediator: The mediator to register.
         :type mediator: IMediator
         :return: None
         """
-        # Do not allow re-registration (you must to removeMediator first)
-        if self.has_mediator(mediator.mediator_name):
-            return
+        self.register_mediators((mediator,))
+
+    def register_mediators(self, mediators: Iterable[IMediator]) -> None:
+        """
+        Register several `IMediator` instances with the `View`.
+
+        The mediators are added to the mediator map under a single lock
+        acquisition, and the observers for all of their interests are
+        registered in one pass, see `register_observers`. Each mediator's
+        `on_register` is then called, in order.
 
-        mediator.initialize_notifier(self.multitonKey)
+        Mediators whose name is already registered, or registered earlier
+        in the batch, are skipped, and left untouched.
 
+        :param mediators: The mediators to register.
+        :type mediators: Iterable[IMediator]
+        :return: None
+        """
+        candidates: Dict[str, IMediator] = dict()
         with self.mediatorMapLock:
-            self.mediatorMap[mediator.mediator_name] = mediator
+            for mediator in mediators:
+                # Do not allow re-registration (you must to removeMediator first)
+                name = mediator.mediator_name
+                if name in self.mediatorMap or name in self.mediatorFactoryMap or name in candidates:
+                    continue
+                candidates[name] = mediator
 
-        observer = Observer(mediator.handle_notification, mediator)
+        for mediator in candidates.values():
+            mediator.initialize_notifier(self.multitonKey)
 
-        interests = mediator.list_notification_interests()
+        registered: List[IMediator] = []
+        with self.mediatorMapLock:
+            for name, mediator in candidates.items():
+                if name in self.mediatorMap or name in self.mediatorFactoryMap:
+                    continue
+                self.mediatorMap[name] = mediator
+                registered.append(mediator)
+
+        registrations: List[Tuple[str, IObserver]] = []
+        interests: Dict[str, List[str]] = dict()
+        for mediator in registered:
+            observer = Observer(mediator.handle_notification, mediator, priority=mediator.priority)
+            predicates = mediator.list_notification_predicates()
+            pairs = [self._interest_observer(mediator, interest, predicates.get(self._interest_name(interest)),
+                                             observer)
+                     for interest in mediator.list_notification_interests()]
+            registrations.extend(pairs)
+            interests[mediator.mediator_name] = [name for name, _ in pairs]
+        self.register_observers(registrations)
+
+        with self.mediatorMapLock:
+            self.mediatorInterests.update(interests)
+
+        for mediator in registered:
+            mediator.on_register()
+
+    def add_interest(self, mediator_name: str, interest: Union[str, Tuple[str, str]],
+                     predicate: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register a registered `IMediator` for an additional interest.
+
+        The interest takes the same forms as those returned by
+        `list_notification_interests`, and is removed along with the
+        mediator's other interests by `remove_mediator`.
+
+        A mediator still pending as a factory, see
+        `register_mediator_factory`, is not constructed: the interest is
+        added to those of the factory.
+
+        :param mediator_name: The name of the registered mediator.
+        :type mediator_name: str
+        :param interest: A notification name or pattern, or a `(name, type)` tuple.
+        :type interest: Union[str, Tuple[str, str]]
+        :param predicate: An optional predicate guarding the interest.
+        :type predicate: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        with self.mediatorFactoryLock:
+            with self.mediatorMapLock:
+                mediator = self.mediatorMap.get(mediator_name)
+                pending = self.mediatorFactoryMap.get(mediator_name)
+            if mediator is not None:
+                name, observer = self._interest_observer(mediator, interest, predicate)
+            elif pending is not None:
+                name, note_type = interest if isinstance(interest, tuple) else (interest, None)
+                name = sys.intern(name)
+                observer = self._factory_observer(mediator_name, pending[0], note_type)
+                observer.predicate = predicate
+                pending[1].append((name, observer))
+            else:
+                return
+
+            self.register_observer(name, observer)
+            with self.mediatorMapLock:
+                self.mediatorInterests.setdefault(mediator_name, []).append(name)
+
+    def remove_interest(self, mediator_name: str, notification_name: str) -> None:
+        """
+        Remove an interest of a registered `IMediator`.
+
+        Removes every observer the mediator has registered for the
+        notification name or pattern, whatever its type or predicate. A
+        mediator still pending as a factory is not constructed.
+
+        :param mediator_name: The name of the registered mediator.
+        :type mediator_name: str
+        :param notification_name: The notification name or pattern to stop observing.
+        :type notification_name: str
+        :return: None
+        """
+        with self.mediatorFactoryLock:
+            with self.mediatorMapLock:
+                mediator = self.mediatorMap.get(mediator_name)
+                pending = self.mediatorFactoryMap.get(mediator_name)
+                names = self.mediatorInterests.get(mediator_name)
+                if names is None: return
+                context: Any
+                if mediator is not None:
+                    context = mediator
+                elif pending is not None:
+                    context = pending[0]
+                    pending[1][:] = [(name, observer) for name, observer in pending[1] if name != notification_name]
+                else:
+                    return
+                count = names.count(notification_name)
+                self.mediatorInterests[mediator_name] = [name for name in names if name != notification_name]
+
+            for _ in range(count):
+                self.remove_observer(notification_name, context)
+
+    def register_mediator_factory(self, mediator_name: str, interests: Sequence[Interest],
+                                  factory: Callable[[], IMediator]) -> None:
+        """
+        Register a factory for an `IMediator` to be constructed on first use.
+
+        Observers for the declared interests, which take the same forms as
+        those returned by `list_notification_interests`, are registered
+        immediately, but the `IMediator` (and its view component) is only
+        constructed when the first matching notification arrives, or when
+        it is retrieved with `retrieve_mediator`. It then has its notifier
+        initialized, is registered under `mediator_name`, is sent
+        `on_register`, and the notification is delivered to it.
+
+        Once constructed, the observers call its `handle_notification`
+        directly, guarded by its `list_notification_predicates`, unless
+        given a predicate by `add_interest`. They keep
+        the default priority, since the mediator class is not known when
+        they are registered.
+
+        `has_mediator` reports a pending factory as registered, and
+        `remove_mediator` discards it without constructing the mediator.
+
+        :param mediator_name: The name the `IMediator` will be retrieved by.
+        :type mediator_name: str
+        :param interests: The notification names, patterns or `(name, type)` tuples to observe.
+        :type interests: Sequence[Union[str, Tuple[str, str]]]
+        :param factory: Callable that returns the `IMediator` instance.
+        :type factory: Callable[[], IMediator]
+        :return: None
+        """
+        observers: List[Tuple[str, IObserver]] = []
         for interest in interests:
-            self.register_observer(interest, observer)
+            name, note_type = interest if isinstance(interest, tuple) else (interest, None)
+            observers.append((sys.intern(name), self._factory_observer(mediator_name, factory, note_type)))
 
+        with self.mediatorMapLock:
+            # Do not allow re-registration (you must to removeMediator first)
+            if mediator_name in self.mediatorMap or mediator_name in self.mediatorFactoryMap:
+                return
+            self.mediatorFactoryMap[mediator_name] = (factory, observers)
+            self.mediatorInterests[mediator_name] = [name for name, _ in observers]
+        self.register_observers(observers)
+
+    def _factory_observer(self, mediator_name: str, factory: Callable[[], IMediator],
+                          note_type: Optional[str]) -> IObserver:
+        """
+        Build an observer constructing a lazily registered `IMediator` when first notified.
+
+        The observer uses the factory as its notify context until the
+        mediator is constructed, and is then pointed at the mediator.
+
+        :param mediator_name: The name the `IMediator` is registered under.
+        :type mediator_name: str
+        :param factory: Callable that returns the `IMediator` instance.
+        :type factory: Callable[[], IMediator]
+        :param note_type: The notification type the interest is restricted to, if any.
+        :type note_type: Optional[str]
+        :return: The observer to register for the interest.
+        :rtype: IObserver
+        """
+        observer = Observer(None, factory, note_type)
+
+        def construct(notification: INotification) -> None:
+            if self._construct_mediator(mediator_name) is not None:
+                observer.notify_observer(notification)
+
+        observer.notify_method = construct
+        return observer
+
+    def _construct_mediator(self, mediator_name: str) -> Optional[IMediator]:
+        """
+        Construct and register an `IMediator` from its pending factory.
+
+        Constructions are serialized, and the maps are checked again once
+        the construction lock is held, so a mediator constructed meanwhile
+        by another thread is returned instead of being constructed twice.
+
+        The observers registered for the factory are pointed at the
+        mediator in place, so that no notification is missed or delivered
+        twice while their routes are recompiled.
+
+        :param mediator_name: The name of the mediator.
+        :type mediator_name: str
+        :return: The constructed `IMediator`, or the one registered meanwhile.
+        :rtype: Optional[IMediator]
+        """
+        with self.mediatorFactoryLock:
+            with self.mediatorMapLock:
+                mediator = self.mediatorMap.get(mediator_name)
+                pending = self.mediatorFactoryMap.get(mediator_name)
+            if mediator is not None or pending is None:
+                return mediator
+
+            factory, observers = pending
+            mediator = factory()
+            mediator.initialize_notifier(self.multitonKey)
+            predicates = mediator.list_notification_predicates()
+            with self.mediatorMapLock:
+                if self.mediatorFactoryMap.get(mediator_name) is not pending:
+                    return self.mediatorMap.get(mediator_name)
+                del self.mediatorFactoryMap[mediator_name]
+                self.mediatorMap[mediator_name] = mediator
+                for name, observer in observers:
+                    if observer.predicate is None:
+                        observer.predicate = predicates.get(name)
+                    observer.notify_context = mediator
+                    observer.notify_method = mediator.handle_notification
+
+        for name, _ in observers:
+            self.invalidate_route(name)
         mediator.on_register()
+        return mediator
+
+    @staticmethod
+    def _interest_name(interest: Union[str, Tuple[str, str]]) -> str:
+        """
+        Return the notification name of a mediator interest.
+
+        :param interest: A notification name or pattern, or a `(name, type)` tuple.
+        :type interest: Union[str, Tuple[str, str]]
+        :return: The notification name or pattern.
+        :rtype: str
+        """
+        return interest[0] if isinstance(interest, tuple) else interest
+
+    @staticmethod
+    def _interest_observer(mediator: IMediator, interest: Union[str, Tuple[str, str]],
+                           predicate: Optional[Callable[[INotification], bool]],
+                           observer: Optional[IObserver] = None) -> Tuple[str, IObserver]:
+        """
+        Build the observer for one interest of an `IMediator`.
+
+        :param mediator: The mediator to notify.
+        :type mediator: IMediator
+        :param interest: A notification name or pattern, or a `(name, type)` tuple.
+        :type interest: Union[str, Tuple[str, str]]
+        :param predicate: An optional predicate guarding the interest.
+        :type predicate: Optional[Callable[[INotification], bool]]
+        :param observer: An unrestricted observer shared by the mediator's other interests (optional).
+        :type observer: Optional[IObserver]
+        :return: The interned notification name or pattern, and the observer to register for it.
+        :rtype: Tuple[str, IObserver]
+        """
+        name, note_type = interest if isinstance(interest, tuple) else (interest, None)
+        if note_type is None and predicate is None and observer is not None:
+            return sys.intern(name), observer
+        return sys.intern(name), Observer(mediator.handle_notification, mediator, note_type, predicate,
+                                          mediator.priority)
+
+    def interest_rejections(self, mediator_name: str) -> Dict[str, int]:
+        """
+        Get the number of notifications the predicates of an `IMediator` have rejected.
+
+        Counts the predicates from `list_notification_predicates` and
+        `add_interest`, for each notification name or pattern, including
+        those of a mediator still pending as a factory.
+
+        :param mediator_name: The name of the registered mediator.
+        :type mediator_name: str
+        :return: The rejection count of each interest with a predicate.
+        :rtype: Dict[str, int]
+        """
+        with self.mediatorMapLock:
+            mediator = self.mediatorMap.get(mediator_name)
+            pending = self.mediatorFactoryMap.get(mediator_name)
+            names = list(dict.fromkeys(self.mediatorInterests.get(mediator_name, ())))
+        context = mediator if mediator is not None else pending[0] if pending is not None else None
+        rejections: Dict[str, int] = dict()
+        if context is None:
+            return rejections
+        with self.observerMapLock:
+            for name in names:
+                for observer in self._observers(name):
+                    if observer.predicate is not None and observer.compare_notify_context(context):
+                        rejections[name] = rejections.get(name, 0) + observer.rejections
+        return rejections
 
     def retrieve_mediator(self, mediator_name: str) -> Optional[IMediator]:
         """
@@ -198,7 +884,10 @@ class View(IView):
         :rtype: Optional[IMediator]
         """
         with self.mediatorMapLock:
-            return self.mediatorMap.get(mediator_name)
+            mediator = self.mediatorMap.get(mediator_name)
+            if mediator is not None or mediator_name not in self.mediatorFactoryMap:
+                return mediator
+        return self._construct_mediator(mediator_name)
 
     def has_mediator(self, mediator_name: str) -> bool:
         """
@@ -210,7 +899,7 @@ class View(IView):
         :rtype: bool
         """
         with self.mediatorMapLock:
-            return self.mediatorMap.get(mediator_name) is not None
+            return self.mediatorMap.get(mediator_name) is not None or mediator_name in self.mediatorFactoryMap
 
     def remove_mediator(self, mediator_name: str) -> Optional[IMediator]:
         """
@@ -223,10 +912,15 @@ class View(IView):
         """
         with self.mediatorMapLock:
             mediator = self.mediatorMap.get(mediator_name)
+            pending = self.mediatorFactoryMap.pop(mediator_name, None)
+            names = self.mediatorInterests.pop(mediator_name, [])
 
+        if pending is not None:
+            for name in names:
+                self.remove_observer(name, pending[0])
         if not mediator: return None
-        for interest in mediator.list_notification_interests():
-            self.remove_observer(interest, mediator)
+        for name in names:
+            self.remove_observer(name, mediator)
 
         del self.mediatorMap[mediator_name]
 
@@ -1,3 +1,11 @@
-from .Controller import Controller
-from .Model import Model
-from .View import View
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .CommandQueue import CommandQueue
+    from .Controller import Controller
+    from .Model import Model
+    from .View import View
+
+lazy_exports(__name__, ["CommandQueue", "Controller", "Model", "View"])
@@ -4,8 +4,9 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Dict, Hashable, Mapping, Optional, Union
 
 from .ICommand import ICommand
 from .INotification import INotification
@@ -34,18 +35,204 @@ class IController(ABC):
     """
 
     @abstractmethod
-    def register_command(self, notification_name: str, factory: Callable[[], ICommand]) -> None:
+    def register_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                         reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
         """
         Register a particular `ICommand` class as the handler for a particular `INotification`.
 
         :param notification_name: The name of the `INotification`
         :type notification_name: str
-        :param factory: A factory function that returns an instance of ICommand.
-        :type factory: Callable[[], ICommand]
+        :param factory: A factory function that returns an instance of ICommand, or its `module:attribute` path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
         :return: None
         """
         pass
 
+    def register_commands(self, commands: Mapping[str, Union[Callable[[], ICommand], str]],
+                          reuse: Optional[str] = None,
+                          guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register several `ICommand` classes, each as the handler for a particular `INotification`.
+
+        Registers each command with `register_command` by default.
+
+        :param commands: Factory functions that return an instance of ICommand, or their paths, by name.
+        :type commands: Mapping[str, Union[Callable[[], ICommand], str]]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        for notification_name, factory in commands.items():
+            self.register_command(notification_name, factory, reuse, guard)
+
+    def add_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                    reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Add an `ICommand` to those handling a particular `INotification`.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param factory: A factory function that returns an instance of ICommand, or its `module:attribute` path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support several commands per notification.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support several commands per notification")
+
+    def set_fan_out(self, notification_name: str, fan_out: Optional[str]) -> None:
+        """
+        Set whether the `ICommands` handling a particular `INotification` run in order,
+        on a thread pool (`"threads"`) or as asyncio tasks (`"asyncio"`).
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param fan_out: `"threads"`, `"asyncio"`, or None to execute in order.
+        :type fan_out: Optional[str]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support command fan-out.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support command fan-out")
+
+    def guard_rejections(self, guard: Callable[[INotification], bool]) -> int:
+        """
+        Get the number of notifications a command guard has skipped.
+
+        Returns 0 by default.
+
+        :param guard: A guard given to `register_command` or `add_command`.
+        :type guard: Callable[[INotification], bool]
+        :return: The rejection count.
+        :rtype: int
+        """
+        return 0
+
+    def memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the hit, miss and eviction statistics of the `MemoizedCommand` outcome caches.
+
+        Returns no statistics by default.
+
+        :return: The statistics of each cache, by qualified class name.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return {}
+
+    def start_queue(self, workers: int = 4, capacity: int = 1024, policy: str = "block",
+                    ordered: bool = False) -> None:
+        """
+        Switch to queued mode, where commands execute on a pool of worker threads.
+
+        :param workers: The number of worker threads.
+        :type workers: int
+        :param capacity: The maximum number of queued notifications.
+        :type capacity: int
+        :param policy: `"block"`, `"drop"` or `"reject"`, applied when the queue is full.
+        :type policy: str
+        :param ordered: Whether the commands for a notification name execute one at a time, in order.
+        :type ordered: bool
+        :return: None
+        :raises NotImplementedError: If the implementation does not support a command queue.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support a command queue")
+
+    def stop_queue(self, wait: bool = True) -> None:
+        """
+        Switch back to executing commands on the sending thread.
+
+        Does nothing by default, for implementations without a command queue.
+
+        :param wait: Whether to wait for the queued commands to be executed.
+        :type wait: bool
+        :return: None
+        """
+        pass
+
+    def join_queue(self) -> None:
+        """
+        Wait until every command queued so far has been executed.
+
+        Returns at once by default, for implementations without a command queue.
+
+        :return: None
+        """
+        pass
+
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Get the `pending`, `dropped`, `rejected`, `failed` and `timed_out` counts of the command queue.
+
+        Returns no statistics by default.
+
+        :return: The statistics, or an empty dict outside queued mode.
+        :rtype: Dict[str, int]
+        """
+        return {}
+
+    def set_serial(self, notification_name: str, serial: bool = True,
+                   key: Optional[Callable[[INotification], Hashable]] = None) -> None:
+        """
+        Set whether the `ICommands` for a particular `INotification` execute in serial lanes,
+        one lane per name, or per key extracted from the notification.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param serial: Whether the commands for the name execute in lanes.
+        :type serial: bool
+        :param key: Extracts the lane of a notification, or None for one lane per name (optional).
+        :type key: Optional[Callable[[INotification], Hashable]]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support serial command lanes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support serial command lanes")
+
+    def set_timeout(self, notification_name: Optional[str], timeout: Optional[float]) -> None:
+        """
+        Set how long the `ICommands` for a particular `INotification` may run when offloaded.
+
+        :param notification_name: The name of the `INotification`, or None to set the default for all names.
+        :type notification_name: Optional[str]
+        :param timeout: The number of seconds the commands may run, or None for no timeout.
+        :type timeout: Optional[float]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support command timeouts.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support command timeouts")
+
+    def preload_commands(self) -> threading.Thread:
+        """
+        Import the `ICommands` registered by import path in a background thread.
+
+        Starts a thread with nothing to import by default.
+
+        :return: The started thread.
+        :rtype: threading.Thread
+        """
+        thread = threading.Thread(target=lambda: None, daemon=True)
+        thread.start()
+        return thread
+
+    def offloads_commands(self) -> bool:
+        """
+        Check whether any `ICommand` may still be running, with its `INotification`,
+        after the notification returns to its sender.
+
+        Implementations that always execute commands on the sending thread keep this default.
+
+        :return: True if some commands are executed away from the sending thread.
+        :rtype: bool
+        """
+        return False
+
     @abstractmethod
     def execute_command(self, notification: INotification) -> None:
         """
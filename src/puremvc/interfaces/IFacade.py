@@ -4,8 +4,9 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Callable, Optional
+from typing import Callable, Dict, Hashable, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
 from .ICommand import ICommand
 from .IMediator import IMediator
@@ -42,6 +43,33 @@ class IFacade(INotifier, ABC):
         """
         pass
 
+    def register_proxies(self, proxies: Iterable[IProxy]) -> None:
+        """
+        Register several `IProxy` instances with the `Model`.
+
+        Registers each proxy with `register_proxy` by default.
+
+        :param proxies: The `IProxy` instances to be registered, in order.
+        :type proxies: Iterable[IProxy]
+        :return: None
+        """
+        for proxy in proxies:
+            self.register_proxy(proxy)
+
+    def register_proxy_factory(self, proxy_name: str, factory: Callable[[], IProxy]) -> None:
+        """
+        Register a factory for an `IProxy` to be constructed by the `Model` on first retrieval.
+
+        Constructs and registers the `IProxy` at once by default.
+
+        :param proxy_name: The name the `IProxy` will be retrieved by.
+        :type proxy_name: str
+        :param factory: A factory function that returns the `IProxy` instance.
+        :type factory: Callable[[], IProxy]
+        :return: None
+        """
+        self.register_proxy(factory())
+
     @abstractmethod
     def retrieve_proxy(self, proxy_name: str) -> Optional[IProxy]:
         """
@@ -78,18 +106,193 @@ class IFacade(INotifier, ABC):
         pass
 
     @abstractmethod
-    def register_command(self, notification_name: str, factory: Callable[[], ICommand]) -> None:
+    def register_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                         reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
         """
         Register an `ICommand` with the `Controller`.
 
         :param notification_name: The name of the `INotification` to associate the `ICommand` with.
         :type notification_name: str
-        :param factory: A callable factory function that creates an instance of `ICommand`.
-        :type factory: Callable[[], ICommand]
+        :param factory: A callable factory function that creates an instance of `ICommand`, or its import path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        pass
+
+    def register_commands(self, commands: Mapping[str, Union[Callable[[], ICommand], str]],
+                          reuse: Optional[str] = None,
+                          guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register several `ICommand` classes, each as the handler for a particular `INotification`
+        with the `Controller`.
+
+        Registers each command with `register_command` by default.
+
+        :param commands: Factory functions that return an instance of ICommand, or their paths, by name.
+        :type commands: Mapping[str, Union[Callable[[], ICommand], str]]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        for notification_name, factory in commands.items():
+            self.register_command(notification_name, factory, reuse, guard)
+
+    def add_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                    reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Add an `ICommand` to those handling a particular `INotification` in the `Controller`.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param factory: A factory function that returns an instance of ICommand, or its `module:attribute` path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support several commands per notification.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support several commands per notification")
+
+    def set_fan_out(self, notification_name: str, fan_out: Optional[str]) -> None:
+        """
+        Set whether the `ICommands` handling a particular `INotification` run in order,
+        on a thread pool (`"threads"`) or as asyncio tasks (`"asyncio"`) in the `Controller`.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param fan_out: `"threads"`, `"asyncio"`, or None to execute in order.
+        :type fan_out: Optional[str]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support command fan-out.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support command fan-out")
+
+    def guard_rejections(self, guard: Callable[[INotification], bool]) -> int:
+        """
+        Get the number of notifications a command guard has skipped in the `Controller`.
+
+        Returns 0 by default.
+
+        :param guard: A guard given to `register_command` or `add_command`.
+        :type guard: Callable[[INotification], bool]
+        :return: The rejection count.
+        :rtype: int
+        """
+        return 0
+
+    def memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the hit, miss and eviction statistics of the `MemoizedCommand` outcome caches of the `Controller`.
+
+        Returns no statistics by default.
+
+        :return: The statistics of each cache, by qualified class name.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return {}
+
+    def start_queue(self, workers: int = 4, capacity: int = 1024, policy: str = "block",
+                    ordered: bool = False) -> None:
+        """
+        Switch the `Controller` to queued mode, where commands execute on a pool of worker threads.
+
+        :param workers: The number of worker threads.
+        :type workers: int
+        :param capacity: The maximum number of queued notifications.
+        :type capacity: int
+        :param policy: `"block"`, `"drop"` or `"reject"`, applied when the queue is full.
+        :type policy: str
+        :param ordered: Whether the commands for a notification name execute one at a time, in order.
+        :type ordered: bool
+        :return: None
+        :raises NotImplementedError: If the implementation does not support a command queue.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support a command queue")
+
+    def stop_queue(self, wait: bool = True) -> None:
+        """
+        Switch the `Controller` back to executing commands on the sending thread.
+
+        Does nothing by default, for implementations without a command queue.
+
+        :param wait: Whether to wait for the queued commands to be executed.
+        :type wait: bool
         :return: None
         """
         pass
 
+    def join_queue(self) -> None:
+        """
+        Wait until every command queued so far by the `Controller` has been executed.
+
+        Returns at once by default, for implementations without a command queue.
+
+        :return: None
+        """
+        pass
+
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Get the `pending`, `dropped`, `rejected`, `failed` and `timed_out` counts of the `Controller` command queue.
+
+        Returns no statistics by default.
+
+        :return: The statistics, or an empty dict outside queued mode.
+        :rtype: Dict[str, int]
+        """
+        return {}
+
+    def set_serial(self, notification_name: str, serial: bool = True,
+                   key: Optional[Callable[[INotification], Hashable]] = None) -> None:
+        """
+        Set whether the `ICommands` for a particular `INotification` execute in serial lanes in the `Controller`,
+        one lane per name, or per key extracted from the notification.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param serial: Whether the commands for the name execute in lanes.
+        :type serial: bool
+        :param key: Extracts the lane of a notification, or None for one lane per name (optional).
+        :type key: Optional[Callable[[INotification], Hashable]]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support serial command lanes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support serial command lanes")
+
+    def set_timeout(self, notification_name: Optional[str], timeout: Optional[float]) -> None:
+        """
+        Set how long the `ICommands` for a particular `INotification` may run when offloaded by the `Controller`.
+
+        :param notification_name: The name of the `INotification`, or None to set the default for all names.
+        :type notification_name: Optional[str]
+        :param timeout: The number of seconds the commands may run, or None for no timeout.
+        :type timeout: Optional[float]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support command timeouts.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support command timeouts")
+
+    def preload_commands(self) -> Optional[threading.Thread]:
+        """
+        Have the `Controller` import the `ICommands` registered by import path in a background thread.
+
+        Starts a thread with nothing to import by default.
+
+        :return: The started thread.
+        :rtype: Optional[threading.Thread]
+        """
+        thread = threading.Thread(target=lambda: None, daemon=True)
+        thread.start()
+        return thread
+
     @abstractmethod
     def has_command(self, notification_name: str) -> bool:
         """
@@ -123,6 +326,76 @@ class IFacade(INotifier, ABC):
         """
         pass
 
+    def register_mediators(self, mediators: Iterable[IMediator]) -> None:
+        """
+        Register several `IMediator` instances with the `View`.
+
+        Registers each mediator with `register_mediator` by default.
+
+        :param mediators: The `IMediator` instances to be registered, in order.
+        :type mediators: Iterable[IMediator]
+        :return: None
+        """
+        for mediator in mediators:
+            self.register_mediator(mediator)
+
+    def register_mediator_factory(self, mediator_name: str, interests: Sequence[Union[str, Tuple[str, str]]],
+                                  factory: Callable[[], IMediator]) -> None:
+        """
+        Register a factory for an `IMediator` to be constructed by the `View` on first use.
+
+        Constructs and registers the `IMediator` at once by default.
+
+        :param mediator_name: The name the `IMediator` will be retrieved by.
+        :type mediator_name: str
+        :param interests: The notification names, patterns or `(name, type)` tuples to observe.
+        :type interests: Sequence[Union[str, Tuple[str, str]]]
+        :param factory: A factory function that returns the `IMediator` instance.
+        :type factory: Callable[[], IMediator]
+        :return: None
+        """
+        self.register_mediator(factory())
+
+    def add_interest(self, mediator_name: str, interest: Union[str, Tuple[str, str]],
+                     predicate: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register a registered `IMediator` for an additional interest.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :param interest: A notification name or pattern, or a `(name, type)` tuple.
+        :type interest: Union[str, Tuple[str, str]]
+        :param predicate: An optional predicate guarding the interest.
+        :type predicate: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support adding mediator interests.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support adding mediator interests")
+
+    def remove_interest(self, mediator_name: str, notification_name: str) -> None:
+        """
+        Remove an interest of a registered `IMediator`.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :param notification_name: The notification name or pattern to stop observing.
+        :type notification_name: str
+        :return: None
+        :raises NotImplementedError: If the implementation does not support removing mediator interests.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support removing mediator interests")
+
+    def interest_rejections(self, mediator_name: str) -> Dict[str, int]:
+        """
+        Get the number of notifications the predicates of an `IMediator` have rejected in the `View`.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :return: The rejection count of each notification name or pattern with a predicate.
+        :rtype: Dict[str, int]
+        """
+        return {}
+
     @abstractmethod
     def retrieve_mediator(self, mediator_name: str) -> Optional[IMediator]:
         """
@@ -166,3 +439,17 @@ class IFacade(INotifier, ABC):
         :return: None
         """
         pass
+
+    def dispatch(self, notification: INotification) -> None:
+        """
+        Notify `Observers` of a caller-owned, reusable `INotification`.
+
+        Observers must not retain the notification beyond the call that delivered it.
+
+        Sends the notification with `send_notification` by default.
+
+        :param notification: The reusable `INotification` to have the `View` notify `Observers` of.
+        :type notification: INotification
+        :return: None
+        """
+        self.send_notification(notification.name, notification.body, notification.type)
@@ -5,7 +5,7 @@
 # Your reuse is governed by the BSD 3-Clause License
 
 from abc import abstractmethod
-from typing import Any, List
+from typing import Any, Callable, Dict, Sequence, Tuple, Union
 
 from .INotification import INotification
 from .INotifier import INotifier
@@ -43,6 +43,15 @@ class IMediator(INotifier):
     and register it as an Observer for each `INotification` name returned by
     `list_notification_interests`.
 
+    An interest may also be a `(name, type)` tuple, in which case the
+    `IMediator` is only notified of `INotifications` with that name
+    carrying that type.
+
+    The priority and notification predicates were added to this
+    interface after it was first published, so they have defaults, the
+    default priority and no predicates, which existing implementations
+    inherit without change.
+
     See Also
     --------
     :class:`puremvc.interfaces.INotification`
@@ -80,16 +89,35 @@ class IMediator(INotifier):
         """
         pass
 
+    @property
+    def priority(self) -> int:
+        """
+        Get the `IMediator` notification priority.
+
+        :return: The priority of the `IMediator`'s observers; higher priorities are notified first
+        :rtype: int
+        """
+        return 0
+
     @abstractmethod
-    def list_notification_interests(self) -> List[str]:
+    def list_notification_interests(self) -> Sequence[Union[str, Tuple[str, str]]]:
         """
         List `INotification` interests.
 
-        :return: A list containing strings representing the notification interests.
-        :rtype: [str]
+        :return: The notification names of interest, or `(name, type)` tuples.
+        :rtype: Sequence[Union[str, Tuple[str, str]]]
         """
         pass
 
+    def list_notification_predicates(self) -> Dict[str, Callable[[INotification], bool]]:
+        """
+        List predicates guarding `INotification` interests.
+
+        :return: A predicate per notification name; notifications failing it are not handled.
+        :rtype: Dict[str, Callable[[INotification], bool]]
+        """
+        return {}
+
     @abstractmethod
     def handle_notification(self, notification: INotification) -> None:
         """
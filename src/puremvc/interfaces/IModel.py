@@ -5,7 +5,7 @@
 # Your reuse is governed by the BSD 3-Clause License
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from .IProxy import IProxy
 
@@ -34,6 +34,33 @@ class IModel(ABC):
         """
         pass
 
+    def register_proxies(self, proxies: Iterable[IProxy]) -> None:
+        """
+        Register several `IProxy` instances with the `Model`.
+
+        Registers each proxy with `register_proxy` by default.
+
+        :param proxies: The `IProxy` instances to be registered, in order.
+        :type proxies: Iterable[IProxy]
+        :return: None
+        """
+        for proxy in proxies:
+            self.register_proxy(proxy)
+
+    def register_proxy_factory(self, proxy_name: str, factory: Callable[[], IProxy]) -> None:
+        """
+        Register a factory for an `IProxy` to be constructed on first retrieval.
+
+        Constructs and registers the `IProxy` at once by default.
+
+        :param proxy_name: The name the `IProxy` will be retrieved by.
+        :type proxy_name: str
+        :param factory: A factory function that returns the `IProxy` instance.
+        :type factory: Callable[[], IProxy]
+        :return: None
+        """
+        self.register_proxy(factory())
+
     @abstractmethod
     def retrieve_proxy(self, proxy_name: str) -> Optional[IProxy]:
         """
@@ -42,6 +42,8 @@ class INotification(ABC):
     :class:`puremvc.interfaces.IObserver`
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -5,7 +5,7 @@
 # Your reuse is governed by the BSD 3-Clause License
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from .INotification import INotification
 
@@ -44,6 +44,11 @@ class IObserver(ABC):
     in an object implementing the `INotification` interface, such
     as a subclass of `Notification`.
 
+    The notification type filter, predicate, priority, call limit and
+    weak references were added to this interface after it was first
+    published, so they have defaults describing a plain observer, which
+    existing implementations inherit without change.
+
     See Also
     --------
     :class:`puremvc.interfaces.IView`
@@ -51,6 +56,8 @@ class IObserver(ABC):
 
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def notify_method(self) -> Callable[[INotification], None]:
@@ -98,6 +105,104 @@ class IObserver(ABC):
         """
         pass
 
+    @property
+    def notify_type(self) -> Optional[str]:
+        """
+        Get the notification type filter.
+
+        :return: The `INotification` type this observer is restricted to, or None for all types
+        :rtype: Optional[str]
+        """
+        return None
+
+    @notify_type.setter
+    def notify_type(self, value: Optional[str]) -> None:
+        """
+        Set the notification type filter.
+
+        :param value: The `INotification` type to restrict this observer to, or None for all types
+        :type value: Optional[str]
+        :return: None
+        :raises AttributeError: If the implementation does not support a type filter.
+        """
+        raise AttributeError(f"{type(self).__name__} does not support a notification type filter")
+
+    @property
+    def predicate(self) -> Optional[Callable[[INotification], bool]]:
+        """
+        Get the notification predicate.
+
+        :return: The predicate an `INotification` must satisfy to be passed on, or None
+        :rtype: Optional[Callable[[INotification], bool]]
+        """
+        return None
+
+    @predicate.setter
+    def predicate(self, value: Optional[Callable[[INotification], bool]]) -> None:
+        """
+        Set the notification predicate.
+
+        :param value: The predicate an `INotification` must satisfy to be passed on, or None
+        :type value: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises AttributeError: If the implementation does not support a predicate.
+        """
+        raise AttributeError(f"{type(self).__name__} does not support a notification predicate")
+
+    @property
+    def rejections(self) -> int:
+        """
+        Get the number of notifications rejected by the predicate.
+
+        :return: The rejection count
+        :rtype: int
+        """
+        return 0
+
+    @property
+    def priority(self) -> int:
+        """
+        Get the notification priority.
+
+        :return: The priority; observers with a higher priority are notified first
+        :rtype: int
+        """
+        return 0
+
+    @property
+    def max_calls(self) -> Optional[int]:
+        """
+        Get the maximum number of notifications.
+
+        :return: How many notifications this observer handles before expiring, or None for no limit
+        :rtype: Optional[int]
+        """
+        return None
+
+    @property
+    def weak(self) -> bool:
+        """
+        Check whether the interested object is held through weak references.
+
+        :return: True if the observer does not keep the interested object alive
+        :rtype: bool
+        """
+        return False
+
+    @property
+    def expired(self) -> bool:
+        """
+        Check whether the observer has expired.
+
+        An expired observer, one that has used up its `max_calls` or whose
+        weakly held interested object was collected, ignores further
+        notifications and is removed from the observer lists of the `IView`.
+
+        :return: True if the observer will not handle any more notifications
+        :rtype: bool
+        """
+        return False
+
     @abstractmethod
     def notify_observer(self, notification: INotification) -> None:
         """
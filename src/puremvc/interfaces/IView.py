@@ -5,7 +5,7 @@
 # Your reuse is governed by the BSD 3-Clause License
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 from .IMediator import IMediator
 from .INotification import INotification
@@ -48,6 +48,19 @@ class IView(ABC):
         """
         pass
 
+    def register_observers(self, registrations: Iterable[Tuple[str, IObserver]]) -> None:
+        """
+        Register several `IObservers`, each to be notified of `INotifications` with a given name.
+
+        Registers each observer with `register_observer` by default.
+
+        :param registrations: The `(notification_name, observer)` pairs to register, in order.
+        :type registrations: Iterable[Tuple[str, IObserver]]
+        :return: None
+        """
+        for notification_name, observer in registrations:
+            self.register_observer(notification_name, observer)
+
     @abstractmethod
     def notify_observers(self, notification: INotification) -> None:
         """
@@ -63,6 +76,18 @@ class IView(ABC):
         """
         pass
 
+    def invalidate_route(self, notification_name: str) -> None:
+        """
+        Discard any cached dispatch route for a given Notification name.
+
+        Does nothing by default, for implementations that do not cache routes.
+
+        :param notification_name: The name of the `INotification` whose route is stale
+        :type notification_name: str
+        :return: None
+        """
+        pass
+
     @abstractmethod
     def remove_observer(self, notification_name: str, notify_context: Any) -> None:
         """
@@ -97,6 +122,76 @@ class IView(ABC):
           """
         pass
 
+    def register_mediators(self, mediators: Iterable[IMediator]) -> None:
+        """
+        Register several `IMediator` instances with the `View`.
+
+        Registers each mediator with `register_mediator` by default.
+
+        :param mediators: The `IMediator` instances to be registered, in order.
+        :type mediators: Iterable[IMediator]
+        :return: None
+        """
+        for mediator in mediators:
+            self.register_mediator(mediator)
+
+    def register_mediator_factory(self, mediator_name: str, interests: Sequence[Union[str, Tuple[str, str]]],
+                                  factory: Callable[[], IMediator]) -> None:
+        """
+        Register a factory for an `IMediator` to be constructed on first use.
+
+        Constructs and registers the `IMediator` at once by default.
+
+        :param mediator_name: The name the `IMediator` will be retrieved by.
+        :type mediator_name: str
+        :param interests: The notification names, patterns or `(name, type)` tuples to observe.
+        :type interests: Sequence[Union[str, Tuple[str, str]]]
+        :param factory: A factory function that returns the `IMediator` instance.
+        :type factory: Callable[[], IMediator]
+        :return: None
+        """
+        self.register_mediator(factory())
+
+    def add_interest(self, mediator_name: str, interest: Union[str, Tuple[str, str]],
+                     predicate: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register a registered `IMediator` for an additional interest.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :param interest: A notification name or pattern, or a `(name, type)` tuple.
+        :type interest: Union[str, Tuple[str, str]]
+        :param predicate: An optional predicate guarding the interest.
+        :type predicate: Optional[Callable[[INotification], bool]]
+        :return: None
+        :raises NotImplementedError: If the implementation does not support adding mediator interests.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support adding mediator interests")
+
+    def remove_interest(self, mediator_name: str, notification_name: str) -> None:
+        """
+        Remove an interest of a registered `IMediator`.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :param notification_name: The notification name or pattern to stop observing.
+        :type notification_name: str
+        :return: None
+        :raises NotImplementedError: If the implementation does not support removing mediator interests.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support removing mediator interests")
+
+    def interest_rejections(self, mediator_name: str) -> Dict[str, int]:
+        """
+        Get the number of notifications the predicates of an `IMediator` have rejected.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :return: The rejection count of each notification name or pattern with a predicate.
+        :rtype: Dict[str, int]
+        """
+        return {}
+
     @abstractmethod
     def retrieve_mediator(self, mediator_name: str) -> Optional[IMediator]:
         """
@@ -1,10 +1,28 @@
-from .IController import IController
-from .IModel import IModel
-from .IView import IView
-from .ICommand import ICommand
-from .IFacade import IFacade
-from .IMediator import IMediator
-from .INotification import INotification
-from .INotifier import INotifier
-from .IObserver import IObserver
-from .IProxy import IProxy
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .IController import IController
+    from .IModel import IModel
+    from .IView import IView
+    from .ICommand import ICommand
+    from .IFacade import IFacade
+    from .IMediator import IMediator
+    from .INotification import INotification
+    from .INotifier import INotifier
+    from .IObserver import IObserver
+    from .IProxy import IProxy
+
+lazy_exports(__name__, [
+    "IController",
+    "IModel",
+    "IView",
+    "ICommand",
+    "IFacade",
+    "IMediator",
+    "INotification",
+    "INotifier",
+    "IObserver",
+    "IProxy",
+])
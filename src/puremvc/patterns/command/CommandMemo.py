@@ -0,0 +1,124 @@
+# CommandMemo.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class CommandMemo:
+    """
+    A bounded, least recently used cache of command outcomes.
+
+    Maps the key of a notification to the notifications a command sent
+    when it handled it, as `(name, body, type)` tuples. Entries older than
+    the time to live are dropped when they are looked up, and the least
+    recently used entry is evicted once the cache is full.
+
+    The `Controller` keeps one `CommandMemo` per `MemoizedCommand` class,
+    and reports their statistics with `memo_stats`.
+
+    See Also
+    --------
+    :class:`puremvc.patterns.command.MemoizedCommand`
+    """
+
+    """MISS (object): Returned by `get` for a key without a live entry"""
+    MISS = object()
+
+    def __init__(self, size: int = 128, ttl: Optional[float] = None) -> None:
+        """
+        Constructor.
+
+        :param size: The maximum number of entries.
+        :type size: int
+        :param ttl: The number of seconds an entry stays valid, or None to keep entries until evicted.
+        :type ttl: Optional[float]
+        :raises ValueError: If `size` is less than 1, or `ttl` is not positive.
+        """
+        if size < 1:
+            raise ValueError(f"CommandMemo size must be at least 1, got {size!r}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"CommandMemo ttl must be positive, got {ttl!r}")
+        self.size: int = size
+        self.ttl: Optional[float] = ttl
+        self.entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up the outcome cached for a key, and mark it as recently used.
+
+        An unhashable key counts as a miss.
+
+        :param key: The key of the notification.
+        :type key: Hashable
+        :return: The cached outcome, or `CommandMemo.MISS`.
+        :rtype: Any
+        """
+        with self.lock:
+            try:
+                entry = self.entries.get(key)
+            except TypeError:
+                entry = None
+            if entry is not None and self.ttl is not None and entry[1] <= time.monotonic():
+                del self.entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return CommandMemo.MISS
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, outcome: Any) -> None:
+        """
+        Cache the outcome for a key, evicting the least recently used entry if the cache is full.
+
+        An unhashable key is not cached.
+
+        :param key: The key of the notification.
+        :type key: Hashable
+        :param outcome: The outcome to cache.
+        :type outcome: Any
+        :return: None
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self.lock:
+            try:
+                self.entries[key] = (outcome, expires)
+            except TypeError:
+                return
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all entries, keeping the statistics.
+
+        :return: None
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the statistics of the cache.
+
+        :return: The `hits`, `misses`, `evictions`, `expirations` and current `entries`.
+        :rtype: Dict[str, int]
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "expirations": self.expirations, "entries": len(self.entries)}
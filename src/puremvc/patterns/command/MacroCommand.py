@@ -4,7 +4,7 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
-from typing import List, Callable
+from typing import List, Callable, Tuple
 
 from puremvc.interfaces import ICommand, INotification
 from puremvc.patterns.facade import Notifier
@@ -28,6 +28,13 @@ class MacroCommand(Notifier, ICommand):
     calling `add_subcommand` once for each `SubCommand`
     to be executed.
 
+    By default, `initialize_macro_command` runs for every execution, so
+    `SubCommands` may depend on the instance, as closures such as
+    `lambda: SubCommand(self.x)` do. A subclass whose `SubCommands` are
+    the same for every instance may set `COMPILE_PLAN` to True, so they
+    are collected once per class, on first execution, into an immutable
+    plan shared by all its instances and executions.
+
     See Also
     --------
     :class:`puremvc.core.Controller`
@@ -35,6 +42,9 @@ class MacroCommand(Notifier, ICommand):
     :class:`puremvc.patterns.command.SimpleCommand`
     """
 
+    """COMPILE_PLAN (bool): Whether the SubCommands are collected once per class, or on every execution"""
+    COMPILE_PLAN = False
+
     def __init__(self) -> None:
         """
         MacroCommand Constructor.
@@ -79,21 +89,51 @@ class MacroCommand(Notifier, ICommand):
         """
         self._subcommands.append(factory)
 
+    @property
+    def plan(self) -> Tuple[Callable[[], ICommand], ...]:
+        """
+        Get the execution plan of this `MacroCommand`.
+
+        Calls `initialize_macro_command` and returns the `SubCommands` it
+        adds, in order. If `COMPILE_PLAN` is True, they are kept as the plan
+        of the class on first access, and returned from then on without
+        calling it again. `SubCommands` added to the instance before it
+        executes are not part of the plan.
+
+        :return: The `SubCommand` factories, in execution order.
+        :rtype: Tuple[Callable[[], ICommand], ...]
+        """
+        cls = type(self)
+        plan = cls.__dict__.get("_plan")
+        if plan is None:
+            added, self._subcommands = self._subcommands, []
+            self.initialize_macro_command()
+            plan = tuple(self._subcommands)
+            self._subcommands = added
+            if cls.COMPILE_PLAN:
+                setattr(cls, "_plan", plan)
+        return plan
+
     def execute(self, notification: INotification) -> None:
         """
         Execute this `MacroCommand`'s `SubCommands`.
 
         The `SubCommands` will be called in First In/First Out (FIFO)
-        order.
+        order, starting with any added to this instance, followed by the
+        plan of the class. Neither is consumed, so the `MacroCommand` may
+        be executed again.
 
         :param notification: The `INotification` object to be passed to each`SubCommand`.
         :type notification: INotification
         :return: None
         """
-        self.initialize_macro_command()
-        while self._subcommands:
-            factory = self._subcommands.pop(0)
+        plan = self.plan
+        if self._subcommands:
+            plan = (*self._subcommands, *plan)
+        if not plan: return
+        if self.multitonKey is None: raise ValueError("multitonKey must not be None")
+        key = self.multitonKey
+        for factory in plan:
             command = factory()
-            if self.multitonKey is None: raise ValueError("multitonKey must not be None")
-            command.initialize_notifier(self.multitonKey)
+            command.initialize_notifier(key)
             command.execute(notification)
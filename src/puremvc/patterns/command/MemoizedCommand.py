@@ -0,0 +1,114 @@
+# MemoizedCommand.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+from typing import Any, Hashable, List, Optional, Tuple, cast
+
+from puremvc.core import Controller
+from puremvc.interfaces import INotification
+from .SimpleCommand import SimpleCommand
+
+
+class MemoizedCommand(SimpleCommand):
+    """
+    A `SimpleCommand` whose outcome is cached and replayed.
+
+    For commands that are pure functions of the notification, and whose
+    effect is to compute a value and send it onward. The notifications
+    sent while handling a notification are recorded in a bounded LRU
+    cache, keyed by `memo_key`, and sent again for a notification with
+    the same key instead of executing the command.
+
+    Your subclass should override the `compute` method rather than
+    `execute`, and may override `MEMO_SIZE`, `MEMO_TTL` and `memo_key`.
+    The cache is kept by the `Controller` of the core, one per class, and
+    its hit, miss and eviction counts are reported by `memo_stats`.
+
+    See Also
+    --------
+    :class:`puremvc.patterns.command.CommandMemo`
+    :class:`puremvc.core.Controller`
+    """
+
+    """MEMO_SIZE (int): The maximum number of outcomes cached"""
+    MEMO_SIZE = 128
+
+    """MEMO_TTL (Optional[float]): The number of seconds an outcome stays valid, or None"""
+    MEMO_TTL: Optional[float] = None
+
+    def __init__(self) -> None:
+        """
+        MemoizedCommand Constructor.
+        """
+        super().__init__()
+        self._outcome: Optional[List[Tuple[str, Any, Optional[str]]]] = None
+
+    def memo_key(self, notification: INotification) -> Hashable:
+        """
+        Get the cache key of a notification.
+
+        Override to key on part of the body, or to make an unhashable body
+        hashable. Notifications with an unhashable key are not cached.
+
+        :param notification: The notification to handle.
+        :type notification: INotification
+        :return: The `(name, body, type)` of the notification.
+        :rtype: Hashable
+        """
+        return notification.name, notification.body, notification.type
+
+    def compute(self, notification: INotification) -> None:
+        """
+        Handle a notification that has no cached outcome.
+
+        Override to compute the value and send it onward with
+        `send_notification`.
+
+        :param notification: The notification to handle.
+        :type notification: INotification
+        :return: None
+        """
+        return
+
+    def execute(self, notification: INotification) -> None:
+        """
+        Replay the cached outcome of the notification, or compute and cache it.
+
+        :param notification: The notification to handle.
+        :type notification: INotification
+        :return: None
+        """
+        if self.multitonKey is None: raise ValueError("multitonKey must not be None")
+        controller = cast(Controller, Controller.get_instance(self.multitonKey, lambda key: Controller(key)))
+        memo = controller.command_memo(type(self), self.MEMO_SIZE, self.MEMO_TTL)
+        key = self.memo_key(notification)
+        outcome = memo.get(key)
+        if outcome is not memo.MISS:
+            for name, body, note_type in outcome:
+                super().send_notification(name, body, note_type)
+            return
+
+        self._outcome = []
+        try:
+            self.compute(notification)
+            memo.put(key, tuple(self._outcome))
+        finally:
+            self._outcome = None
+
+    def send_notification(self, notification_name: str, body: Any = None, type: Optional[str] = None) -> None:
+        """
+        Create and send an `INotification`, recording it as part of the outcome while computing.
+
+        :param notification_name: The name of the notification to be sent.
+        :type notification_name: str
+        :param body: The body of the notification (optional). Default is None.
+        :type body: Any, optional
+        :param type: The type of the notification (optional). Default is None.
+        :type type: str, optional
+        :return: None
+        """
+        if self._outcome is not None:
+            self._outcome.append((notification_name, body, type))
+        super().send_notification(notification_name, body, type)
@@ -1,2 +1,11 @@
-from .MacroCommand import MacroCommand
-from .SimpleCommand import SimpleCommand
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .CommandMemo import CommandMemo
+    from .MacroCommand import MacroCommand
+    from .MemoizedCommand import MemoizedCommand
+    from .SimpleCommand import SimpleCommand
+
+lazy_exports(__name__, ["CommandMemo", "MacroCommand", "MemoizedCommand", "SimpleCommand"])
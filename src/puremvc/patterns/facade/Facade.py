@@ -4,8 +4,10 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import sys
 import threading
-from typing import Dict, Callable, Any, Optional
+import warnings
+from typing import Dict, Callable, Hashable, Any, Iterable, Mapping, Optional, Sequence, Tuple, Union
 
 from puremvc.core import Controller, Model, View
 from puremvc.interfaces import IFacade, INotification, ICommand, IProxy, IMediator, IController, IModel, IView
@@ -43,6 +45,9 @@ class Facade(IFacade):
     """MULTITON_MSG (str): Multiton error message"""
     MULTITON_MSG = "Facade instance for this Multiton key already constructed!"
 
+    """RETAINED_MSG (str): Dispatched notification retained warning message"""
+    RETAINED_MSG = "Dispatched notification was retained by an observer!"
+
     def __init__(self, key: str) -> None:
         """
         Constructor.
@@ -173,17 +178,171 @@ class Facade(IFacade):
         """
         self.view = View.get_instance(self.multitonKey, lambda k: View(k))
 
-    def register_command(self, notification_name: str, factory: Callable[[], ICommand]) -> None:
+    def register_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                         reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
         """
         Register an `ICommand` with the `Controller` by Notification name.
 
         :param notification_name: The name of the `INotification` to associate the `ICommand` with
         :type notification_name: str
-        :param factory: A factory function that will be used to create instances of the `ICommand`.
-        :type factory: Callable[[], ICommand]
+        :param factory: A factory function that will be used to create instances of the `ICommand`,
+            or its `module:attribute` import path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        if self.controller: self.controller.register_command(notification_name, factory, reuse, guard)
+
+    def register_commands(self, commands: Mapping[str, Union[Callable[[], ICommand], str]],
+                          reuse: Optional[str] = None,
+                          guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register several `ICommands` with the `Controller` by Notification name.
+
+        :param commands: Factory functions that will be used to create instances of the `ICommands`,
+            or their import paths, by name.
+        :type commands: Mapping[str, Union[Callable[[], ICommand], str]]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        if self.controller: self.controller.register_commands(commands, reuse, guard)
+
+    def add_command(self, notification_name: str, factory: Union[Callable[[], ICommand], str],
+                    reuse: Optional[str] = None, guard: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Add an `ICommand` to those the `Controller` executes for a Notification name.
+
+        :param notification_name: The name of the `INotification` to associate the `ICommand` with
+        :type notification_name: str
+        :param factory: A factory function that will be used to create instances of the `ICommand`,
+            or its `module:attribute` import path.
+        :type factory: Union[Callable[[], ICommand], str]
+        :param reuse: `"singleton"` or `"thread"` to reuse instances of a stateless command (optional).
+        :type reuse: Optional[str]
+        :param guard: A test notifications must pass for the command to be executed (optional).
+        :type guard: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        if self.controller: self.controller.add_command(notification_name, factory, reuse, guard)
+
+    def set_fan_out(self, notification_name: str, fan_out: Optional[str]) -> None:
+        """
+        Set how the `Controller` executes the `ICommands` for a Notification name.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param fan_out: `"threads"`, `"asyncio"`, or None to execute in order.
+        :type fan_out: Optional[str]
+        :return: None
+        """
+        if self.controller: self.controller.set_fan_out(notification_name, fan_out)
+
+    def guard_rejections(self, guard: Callable[[INotification], bool]) -> int:
+        """
+        Get the number of notifications a command guard has skipped in the `Controller`.
+
+        :param guard: A guard given to `register_command` or `add_command`.
+        :type guard: Callable[[INotification], bool]
+        :return: The rejection count.
+        :rtype: int
+        """
+        return self.controller.guard_rejections(guard) if self.controller else 0
+
+    def memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the hit, miss and eviction statistics of the `MemoizedCommand` outcome caches of the `Controller`.
+
+        :return: The statistics of each cache, by qualified class name.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return self.controller.memo_stats() if self.controller else {}
+
+    def start_queue(self, workers: int = 4, capacity: int = 1024, policy: str = "block",
+                    ordered: bool = False) -> None:
+        """
+        Switch the `Controller` to queued mode, where commands execute on a pool of worker threads.
+
+        :param workers: The number of worker threads.
+        :type workers: int
+        :param capacity: The maximum number of queued notifications.
+        :type capacity: int
+        :param policy: `"block"`, `"drop"` or `"reject"`, applied when the queue is full.
+        :type policy: str
+        :param ordered: Whether the commands for a notification name execute one at a time, in order.
+        :type ordered: bool
+        :return: None
+        """
+        if self.controller: self.controller.start_queue(workers, capacity, policy, ordered)
+
+    def stop_queue(self, wait: bool = True) -> None:
+        """
+        Switch the `Controller` back to executing commands on the sending thread.
+
+        :param wait: Whether to wait for the queued commands to be executed.
+        :type wait: bool
+        :return: None
+        """
+        if self.controller: self.controller.stop_queue(wait)
+
+    def join_queue(self) -> None:
+        """
+        Wait until every command queued so far by the `Controller` has been executed.
+
+        :return: None
+        """
+        if self.controller: self.controller.join_queue()
+
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Get the `pending`, `dropped`, `rejected`, `failed` and `timed_out` counts of the `Controller` command queue.
+
+        :return: The statistics, or an empty dict outside queued mode.
+        :rtype: Dict[str, int]
+        """
+        return self.controller.queue_stats() if self.controller else {}
+
+    def set_serial(self, notification_name: str, serial: bool = True,
+                   key: Optional[Callable[[INotification], Hashable]] = None) -> None:
+        """
+        Set whether the `ICommands` for a particular `INotification` execute in serial lanes in the `Controller`,
+        one lane per name, or per key extracted from the notification.
+
+        :param notification_name: The name of the `INotification`
+        :type notification_name: str
+        :param serial: Whether the commands for the name execute in lanes.
+        :type serial: bool
+        :param key: Extracts the lane of a notification, or None for one lane per name (optional).
+        :type key: Optional[Callable[[INotification], Hashable]]
+        :return: None
+        """
+        if self.controller: self.controller.set_serial(notification_name, serial, key)
+
+    def set_timeout(self, notification_name: Optional[str], timeout: Optional[float]) -> None:
+        """
+        Set how long the `ICommands` for a particular `INotification` may run when offloaded by the `Controller`.
+
+        :param notification_name: The name of the `INotification`, or None to set the default for all names.
+        :type notification_name: Optional[str]
+        :param timeout: The number of seconds the commands may run, or None for no timeout.
+        :type timeout: Optional[float]
         :return: None
         """
-        if self.controller: self.controller.register_command(notification_name, factory)
+        if self.controller: self.controller.set_timeout(notification_name, timeout)
+
+    def preload_commands(self) -> Optional[threading.Thread]:
+        """
+        Have the `Controller` import the `ICommands` registered by import path in a background thread.
+
+        :return: The started thread.
+        :rtype: Optional[threading.Thread]
+        """
+        return self.controller.preload_commands() if self.controller else None
 
     def has_command(self, notification_name: str) -> bool:
         """
@@ -215,6 +374,28 @@ class Facade(IFacade):
         """
         if self.model: self.model.register_proxy(proxy)
 
+    def register_proxies(self, proxies: Iterable[IProxy]) -> None:
+        """
+        Register several `IProxy` instances with the `Model` by name.
+
+        :param proxies: The `IProxy` instances to be registered with the `Model`, in order.
+        :type proxies: Iterable[IProxy]
+        :return: None.
+        """
+        if self.model: self.model.register_proxies(proxies)
+
+    def register_proxy_factory(self, proxy_name: str, factory: Callable[[], IProxy]) -> None:
+        """
+        Register a factory for an `IProxy` to be constructed by the `Model` on first retrieval.
+
+        :param proxy_name: The name the `IProxy` will be retrieved by.
+        :type proxy_name: str
+        :param factory: A factory function that returns the `IProxy` instance.
+        :type factory: Callable[[], IProxy]
+        :return: None
+        """
+        if self.model: self.model.register_proxy_factory(proxy_name, factory)
+
     def retrieve_proxy(self, proxy_name: str) -> Optional[IProxy]:
         """
         Retrieve an `IProxy` from the `Model` by name.
@@ -257,6 +438,69 @@ class Facade(IFacade):
         """
         if self.view: self.view.register_mediator(mediator)
 
+    def register_mediators(self, mediators: Iterable[IMediator]) -> None:
+        """
+        Register several `IMediator` instances with the `View`.
+
+        :param mediators: The `IMediators` to be registered with the `View`, in order.
+        :type mediators: Iterable[IMediator]
+        :return: None
+        """
+        if self.view: self.view.register_mediators(mediators)
+
+    def register_mediator_factory(self, mediator_name: str, interests: Sequence[Union[str, Tuple[str, str]]],
+                                  factory: Callable[[], IMediator]) -> None:
+        """
+        Register a factory for an `IMediator` to be constructed by the `View` on first use.
+
+        :param mediator_name: The name the `IMediator` will be retrieved by.
+        :type mediator_name: str
+        :param interests: The notification names, patterns or `(name, type)` tuples to observe.
+        :type interests: Sequence[Union[str, Tuple[str, str]]]
+        :param factory: A factory function that returns the `IMediator` instance.
+        :type factory: Callable[[], IMediator]
+        :return: None
+        """
+        if self.view: self.view.register_mediator_factory(mediator_name, interests, factory)
+
+    def add_interest(self, mediator_name: str, interest: Union[str, Tuple[str, str]],
+                     predicate: Optional[Callable[[INotification], bool]] = None) -> None:
+        """
+        Register a registered `IMediator` for an additional interest.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :param interest: A notification name or pattern, or a `(name, type)` tuple.
+        :type interest: Union[str, Tuple[str, str]]
+        :param predicate: An optional predicate guarding the interest.
+        :type predicate: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        if self.view: self.view.add_interest(mediator_name, interest, predicate)
+
+    def remove_interest(self, mediator_name: str, notification_name: str) -> None:
+        """
+        Remove an interest of a registered `IMediator`.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :param notification_name: The notification name or pattern to stop observing.
+        :type notification_name: str
+        :return: None
+        """
+        if self.view: self.view.remove_interest(mediator_name, notification_name)
+
+    def interest_rejections(self, mediator_name: str) -> Dict[str, int]:
+        """
+        Get the number of notifications the predicates of an `IMediator` have rejected in the `View`.
+
+        :param mediator_name: The name of the registered `IMediator`.
+        :type mediator_name: str
+        :return: The rejection count of each notification name or pattern with a predicate.
+        :rtype: Dict[str, int]
+        """
+        return self.view.interest_rejections(mediator_name) if self.view else {}
+
     def retrieve_mediator(self, mediator_name: str) -> Optional[IMediator]:
         """
         Retrieve an `IMediator` from the `View`.
@@ -326,6 +570,48 @@ class Facade(IFacade):
         if self.view:
             self.view.notify_observers(notification)
 
+    def dispatch(self, notification: INotification) -> None:
+        """
+        Notify `Observers` of a caller-owned, reusable `INotification`.
+
+        Intended for tight send loops, where allocating a new
+        notification per send is measurable. The caller creates
+        one notification and swaps its `body` (and `type`) between
+        calls instead of calling `send_notification` each time::
+
+            note = Notification(AppFacade.ROW_LOADED)
+            for row in rows:
+                note.body = row
+                facade.dispatch(note)
+
+        Because the same instance is mutated on the next iteration,
+        observers must not keep a reference to the notification
+        (or hand it to another thread) beyond the call that
+        delivered it; copy the `body` out instead.
+
+        Unless Python runs with `-O`, the reference count of the
+        notification is compared before and after the dispatch, and
+        an observer that retained it is reported with a
+        `RuntimeWarning`, since the observers have already run.
+
+        When the `Controller` executes commands away from the sending
+        thread, see `IController.offloads_commands`, they may still hold
+        the notification once it returns, so a copy is sent instead.
+
+        :param notification: The reusable `INotification` to have the `View` notify `Observers` of.
+        :type notification: INotification
+        :return: None
+        """
+        if self.controller and self.controller.offloads_commands():
+            import copy
+
+            self.notify_observers(copy.copy(notification))
+            return
+        references = sys.getrefcount(notification) if __debug__ else 0
+        self.notify_observers(notification)
+        if __debug__ and sys.getrefcount(notification) > references:
+            warnings.warn(Facade.RETAINED_MSG, RuntimeWarning, stacklevel=2)
+
     def initialize_notifier(self, key: str) -> None:
         """
         Set the Multiton key for this facade instance.
@@ -6,8 +6,8 @@
 
 from typing import Any, Optional
 
+import puremvc.patterns.facade as facade_package
 from puremvc.interfaces import IFacade, INotifier
-from puremvc.patterns.facade.Facade import Facade
 
 
 class Notifier(INotifier):
@@ -100,4 +100,6 @@ class Notifier(INotifier):
         """
         if self.multitonKey is None:
             raise Exception(self.MULTITON_MSG)
-        return Facade.get_instance(self.multitonKey, lambda key: Facade(key))
+        # The Facade, and the core actors it imports, are only loaded by the first notifier to reach it
+        facade = facade_package.Facade
+        return facade.get_instance(self.multitonKey, lambda key: facade(key))
@@ -1,2 +1,9 @@
-from .Facade import Facade
-from .Notifier import Notifier
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .Facade import Facade
+    from .Notifier import Notifier
+
+lazy_exports(__name__, ["Facade", "Notifier"])
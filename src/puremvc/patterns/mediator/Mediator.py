@@ -4,7 +4,7 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 from puremvc.interfaces import IMediator, INotification
 from puremvc.patterns.facade import Notifier
@@ -22,6 +22,9 @@ class Mediator(Notifier, IMediator):
     """NAME (str): The name of the `Mediator`"""
     NAME = "Mediator"
 
+    """PRIORITY (int): The notification priority of the `Mediator`"""
+    PRIORITY = 0
+
     def __init__(self, mediator_name: Optional[str] = None, view_component: Any = None) -> None:
         """
         Constructor
@@ -49,6 +52,20 @@ class Mediator(Notifier, IMediator):
         """
         return self._mediator_name
 
+    @property
+    def priority(self) -> int:
+        """
+        Get the notification priority of the `Mediator`.
+
+        The `View` notifies observers with a higher priority first, so
+        latency-critical mediators can run ahead of others interested in
+        the same notification by overriding `PRIORITY`.
+
+        :return: The priority of the mediator.
+        :rtype: int
+        """
+        return self.PRIORITY
+
     @property
     def view_component(self) -> Any:
         """
@@ -70,16 +87,38 @@ class Mediator(Notifier, IMediator):
         """
         self._view_component = value
 
-    def list_notification_interests(self) -> List[str]:
+    def list_notification_interests(self) -> Sequence[Union[str, Tuple[str, str]]]:
         """
         List the `INotification` names this
         `Mediator` is interested in being notified of.
 
-        :return: List the list of `INotification` names
-        :rtype: List[str]
+        Return a `(name, type)` tuple instead of a name to be notified
+        only of `INotifications` with that name carrying that type::
+
+            def list_notification_interests(self):
+                return [AppFacade.STARTUP, (AppFacade.ORDER, OrderTypes.CANCELLED)]
+
+        :return: List the list of `INotification` names, or `(name, type)` tuples
+        :rtype: Sequence[Union[str, Tuple[str, str]]]
         """
         return []
 
+    def list_notification_predicates(self) -> Dict[str, Callable[[INotification], bool]]:
+        """
+        List the predicates guarding this `Mediator`'s interests.
+
+        The `View` evaluates the predicate for a notification name before
+        calling `handle_notification`, so early returns can be moved out of
+        the handler::
+
+            def list_notification_predicates(self):
+                return {AppFacade.ORDER: lambda note: note.body.total > 0}
+
+        :return: A predicate per `INotification` name
+        :rtype: Dict[str, Callable[[INotification], bool]]
+        """
+        return {}
+
     def handle_notification(self, notification: INotification) -> None:
         """
         Handle `INotification`.
@@ -1 +1,8 @@
-from .Mediator import Mediator
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .Mediator import Mediator
+
+lazy_exports(__name__, ["Mediator"])
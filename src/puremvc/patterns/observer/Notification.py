@@ -38,11 +38,29 @@ class Notification(INotification):
     parent/child relationship to communicate with one another
     using `Notification`.
 
+    Notification names are interned by the `View` and `Controller` when
+    observers and commands are registered. Names that are built
+    dynamically should be built once and passed through `sys.intern`, so
+    that dispatch compares them by identity instead of by content.
+
+    `Notification` instances are allocated on every send, so the class
+    uses `__slots__` instead of an instance dictionary, and `body` and
+    `type` are plain slot attributes rather than properties. The name is
+    read-only.
+
     See Also
     --------
     :class:`puremvc.patterns.observer.Observer`
     """
 
+    __slots__ = ("_name", "body", "type")
+
+    """body (Any): The body of the `Notification` instance"""
+    body: Any
+
+    """type (Optional[str]): The type of the `Notification` instance"""
+    type: Optional[str]
+
     def __init__(self, name: str, body: Any = None, type: Optional[str] = None) -> None:
         """
         Constructor.
@@ -55,8 +73,8 @@ class Notification(INotification):
         :type type: str
         """
         self._name = name
-        self._body = body
-        self._type = type
+        self.body = body
+        self.type = type
 
     @property
     def name(self) -> str:
@@ -68,47 +86,6 @@ class Notification(INotification):
         """
         return self._name
 
-    @property
-    def body(self) -> Any:
-        """
-        This method returns the value of the `_body` attribute.
-
-        :return: The value of the `_body` attribute.
-        :rtype: Any
-        """
-        return self._body
-
-    @body.setter
-    def body(self, body: Any) -> None:
-        """
-        Set the body of the `Notification` instance.
-
-        :param body: The new value for the body.
-        :type body: Any
-        :return: None
-        """
-        self._body = body
-
-    @property
-    def type(self) -> Optional[str]:
-        """
-        Get the body of the `Notification` instance.
-
-        :return: The type of the object.
-        :rtype: Optional[str]
-        """
-        return self._type
-
-    @type.setter
-    def type(self, note_type: str) -> None:
-        """
-        Set the type of the `Notification` instance.
-        :param note_type: The new type for the `Notification` instance.
-        :type note_type: str
-        :return: None
-        """
-        self._type = note_type
-
     def __repr__(self) -> str:
         """
         Get the string representation of the `Notification` instance.
@@ -4,6 +4,9 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import inspect
+import threading
+import weakref
 from typing import Any, Callable, Optional
 
 from puremvc.interfaces import IObserver, INotification
@@ -27,13 +30,52 @@ class Observer(IObserver):
 
     Provide a method for notifying the interested object.
 
+    An `Observer` may be restricted to a single notification type, in
+    which case it is only notified of notifications carrying that type.
+    The `View` indexes observers by type, so filtered notifications never
+    reach the notification method at all.
+
+    An `Observer` may also be given a predicate, a cheap test evaluated
+    against each `INotification` before the notification method is
+    called. Notifications failing the predicate are dropped and counted
+    in `rejections`, under a lock shared by all observers, so that no
+    count is lost under concurrent dispatch.
+
+    The priority of an `Observer` decides its place in the observer list
+    of the `View`: observers with a higher priority are notified first,
+    and observers with equal priorities in the order they were registered.
+    The priority is fixed at construction, since changing it would not
+    reorder the observer lists it is already part of.
+
+    An `Observer` constructed with `max_calls` handles at most that many
+    notifications, which is claimed atomically, so a one-shot observer
+    (`max_calls=1`) runs exactly once even under concurrent dispatch. It
+    then expires, and the `View` drops it from its observer lists.
+
+    A weak `Observer` holds its notification context, and its notification
+    method when that is a bound method, through weak references, so it
+    does not keep the interested object alive. Once the interested object
+    has been collected the observer expires, and the `View` prunes it the
+    next time the notification is dispatched. Plain functions are still
+    held strongly, since nothing else would usually keep them alive.
+
     See Also
     --------
     :class:`puremvc.core.View`
     :class:`puremvc.patterns.observer.Notification`
     """
 
-    def __init__(self, notify_method: Optional[Callable[[INotification], None]] = None, notify_context: object = None) -> None:
+    __slots__ = ("_weak", "_notify_method", "_notify_method_ref", "_notify_context", "_notify_context_ref",
+                 "_notify_type", "_predicate", "_rejections", "_priority", "_max_calls", "_remaining",
+                 "_remaining_lock")
+
+    """_rejections_lock (threading.Lock): Guards the rejection counts of all observers"""
+    _rejections_lock = threading.Lock()
+
+    def __init__(self, notify_method: Optional[Callable[[INotification], None]] = None, notify_context: object = None,
+                 notify_type: Optional[str] = None,
+                 predicate: Optional[Callable[[INotification], bool]] = None, priority: int = 0,
+                 max_calls: Optional[int] = None, weak: bool = False) -> None:
         """
         Constructor.
 
@@ -44,9 +86,32 @@ class Observer(IObserver):
         :type notify_method: Optional[Callable[[INotification], None]]
         :param notify_context: the notification context of the interested object
         :type notify_context: object
+        :param notify_type: the notification type to restrict this observer to, or None for all types
+        :type notify_type: Optional[str]
+        :param predicate: a test notifications must pass to be passed to the notification method
+        :type predicate: Optional[Callable[[INotification], bool]]
+        :param priority: observers with a higher priority are notified first
+        :type priority: int
+        :param max_calls: the number of notifications to handle before expiring, or None for no limit
+        :type max_calls: Optional[int]
+        :param weak: hold the interested object through weak references
+        :type weak: bool
         """
+        self._weak: bool = weak
         self._notify_method: Optional[Callable[[INotification], None]] = notify_method
+        self._notify_method_ref: Optional[weakref.WeakMethod] = None
         self._notify_context: object = notify_context
+        self._notify_context_ref: Optional[weakref.ref] = None
+        if weak:
+            self._set_notify_method(notify_method)
+            self._set_notify_context(notify_context)
+        self._notify_type: Optional[str] = notify_type
+        self._predicate: Optional[Callable[[INotification], bool]] = predicate
+        self._rejections: int = 0
+        self._priority: int = priority
+        self._max_calls: Optional[int] = max_calls
+        self._remaining: Optional[int] = max_calls
+        self._remaining_lock: Optional[threading.Lock] = None if max_calls is None else threading.Lock()
 
     @property
     def notify_method(self) -> Optional[Callable[[INotification], None]]:
@@ -56,6 +121,8 @@ class Observer(IObserver):
         :return: The notify method.
         :rtype: Optional[Callable[[INotification], None]
         """
+        if self._notify_method_ref is not None:
+            return self._notify_method_ref()
         return self._notify_method
 
     @notify_method.setter
@@ -67,7 +134,7 @@ class Observer(IObserver):
         :type value: Callable[[INotification], None]
         :return: None
         """
-        self._notify_method = value
+        self._set_notify_method(value)
 
     @property
     def notify_context(self) -> object:
@@ -77,6 +144,8 @@ class Observer(IObserver):
         :return: The notify context.
         :rtype: object
         """
+        if self._notify_context_ref is not None:
+            return self._notify_context_ref()
         return self._notify_context
 
     @notify_context.setter
@@ -88,18 +157,159 @@ class Observer(IObserver):
         :type value: object
         :return: None
         """
-        self._notify_context = value
+        self._set_notify_context(value)
+
+    def _set_notify_method(self, value: Optional[Callable[[INotification], None]]) -> None:
+        """
+        Store the notification method, weakly if this observer is weak and it is a bound method.
+
+        :param value: The notification method.
+        :type value: Optional[Callable[[INotification], None]]
+        :return: None
+        """
+        if self._weak and inspect.ismethod(value):
+            self._notify_method, self._notify_method_ref = None, weakref.WeakMethod(value)
+        else:
+            self._notify_method, self._notify_method_ref = value, None
+
+    def _set_notify_context(self, value: object) -> None:
+        """
+        Store the notification context, weakly if this observer is weak and the context supports it.
+
+        :param value: The notification context.
+        :type value: object
+        :return: None
+        """
+        self._notify_context, self._notify_context_ref = value, None
+        if self._weak and value is not None:
+            try:
+                self._notify_context, self._notify_context_ref = None, weakref.ref(value)
+            except TypeError:
+                pass
+
+    @property
+    def notify_type(self) -> Optional[str]:
+        """
+        Get the notification type filter.
+
+        :return: The notification type this observer is restricted to, or None.
+        :rtype: Optional[str]
+        """
+        return self._notify_type
+
+    @notify_type.setter
+    def notify_type(self, value: Optional[str]) -> None:
+        """
+        Set the notification type filter.
+
+        :param value: The notification type to restrict this observer to, or None for all types.
+        :type value: Optional[str]
+        :return: None
+        """
+        self._notify_type = value
+
+    @property
+    def predicate(self) -> Optional[Callable[[INotification], bool]]:
+        """
+        Get the notification predicate.
+
+        :return: The predicate notifications must pass, or None.
+        :rtype: Optional[Callable[[INotification], bool]]
+        """
+        return self._predicate
+
+    @predicate.setter
+    def predicate(self, value: Optional[Callable[[INotification], bool]]) -> None:
+        """
+        Set the notification predicate.
+
+        :param value: The predicate notifications must pass, or None to pass all notifications.
+        :type value: Optional[Callable[[INotification], bool]]
+        :return: None
+        """
+        self._predicate = value
+
+    @property
+    def rejections(self) -> int:
+        """
+        Get the number of notifications rejected by the predicate.
+
+        :return: The rejection count.
+        :rtype: int
+        """
+        return self._rejections
+
+    @property
+    def priority(self) -> int:
+        """
+        Get the notification priority.
+
+        :return: The priority of this observer.
+        :rtype: int
+        """
+        return self._priority
+
+    @property
+    def max_calls(self) -> Optional[int]:
+        """
+        Get the maximum number of notifications.
+
+        :return: The number of notifications handled before expiring, or None.
+        :rtype: Optional[int]
+        """
+        return self._max_calls
+
+    @property
+    def weak(self) -> bool:
+        """
+        Check whether the interested object is held through weak references.
+
+        :return: True if the observer is weak.
+        :rtype: bool
+        """
+        return self._weak
+
+    @property
+    def expired(self) -> bool:
+        """
+        Check whether the observer has used up its `max_calls`, or, for a
+        weak observer, whether the interested object has been collected.
+
+        :return: True if the observer will not handle any more notifications.
+        :rtype: bool
+        """
+        if self._remaining == 0:
+            return True
+        if self._notify_method_ref is not None and self._notify_method_ref() is None:
+            return True
+        return self._notify_context_ref is not None and self._notify_context_ref() is None
 
     def notify_observer(self, notification: INotification) -> None:
         """
         Notify the interested object.
 
+        Notifications whose type does not match the type filter, or that
+        fail the predicate, are ignored, as are all notifications once the
+        observer has expired.
+
         :param notification: The `INotification` to pass to the interested
         :type notification: INotification
         :return: None
         """
-        if self._notify_method is not None:
-            self._notify_method(notification)
+        if self._notify_type is not None and notification.type != self._notify_type:
+            return
+        if self._predicate is not None and not self._predicate(notification):
+            with Observer._rejections_lock:
+                self._rejections += 1
+            return
+        if self._remaining_lock is not None:
+            with self._remaining_lock:
+                if not self._remaining:
+                    return
+                self._remaining -= 1
+        method = self._notify_method if self._notify_method_ref is None else self._notify_method_ref()
+        if method is not None:
+            method(notification)
 
     def compare_notify_context(self, obj: object) -> bool:
         """
@@ -110,4 +320,4 @@ class Observer(IObserver):
         :return: True if the given object is equal to the notify context, False otherwise.
         :rtype: bool
         """
-        return obj == self._notify_context
+        return obj == self.notify_context
@@ -1,2 +1,9 @@
-from .Notification import Notification
-from .Observer import Observer
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .Notification import Notification
+    from .Observer import Observer
+
+lazy_exports(__name__, ["Notification", "Observer"])
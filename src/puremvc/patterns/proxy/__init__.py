@@ -1 +1,8 @@
-from .Proxy import Proxy
+from typing import TYPE_CHECKING
+
+from puremvc._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .Proxy import Proxy
+
+lazy_exports(__name__, ["Proxy"])
@@ -0,0 +1,50 @@
+# Import_test.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+import subprocess
+import sys
+import unittest
+
+
+class ImportTest(unittest.TestCase):
+    """Test the lazy loading of the puremvc packages."""
+
+    @staticmethod
+    def loaded_modules(statement: str) -> str:
+        """Run an import statement in a fresh interpreter and return the puremvc modules it loaded."""
+        script = f"{statement}\nimport sys\nprint(' '.join(sorted(m for m in sys.modules if m.startswith('puremvc'))))"
+        return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+
+    def test_import_loads_only_dependencies(self):
+        """Tests that importing a class only loads the modules it depends on"""
+        modules = self.loaded_modules("from puremvc.patterns.observer import Notification").split()
+        self.assertIn("puremvc.patterns.observer.Notification", modules)
+        self.assertIn("puremvc.interfaces.INotification", modules)
+        self.assertNotIn("puremvc.patterns.observer.Observer", modules)
+        self.assertNotIn("puremvc.interfaces.IFacade", modules)
+        self.assertFalse(any(module.startswith("puremvc.core") for module in modules), "Expecting no core module")
+
+        modules = self.loaded_modules("from puremvc.patterns.proxy import Proxy").split()
+        self.assertNotIn("puremvc.patterns.facade.Facade", modules, "Expecting the Facade to load on first use")
+        self.assertFalse(any(module.startswith("puremvc.core") for module in modules), "Expecting no core module")
+
+    def test_submodule_import_does_not_shadow_class(self):
+        """Tests that importing a submodule directly keeps the package attribute bound to the class"""
+        output = self.loaded_modules("import puremvc.core.View\nfrom puremvc.core import View\n"
+                                     "assert isinstance(View, type), View")
+        self.assertIn("puremvc.core.View", output.split())
+
+    def test_star_import(self):
+        """Tests that star imports load every exported class"""
+        from puremvc import interfaces
+        self.assertIn("IFacade", dir(interfaces))
+        namespace = {}
+        exec("from puremvc.interfaces import *", namespace)
+        self.assertTrue(all(isinstance(namespace[name], type) for name in interfaces.__all__))
+
+
+if __name__ == '__main__':
+    unittest.main()
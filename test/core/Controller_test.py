@@ -4,12 +4,16 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import asyncio
+import queue
+import threading
+import time
 import unittest
 
 from puremvc.core import Controller, View
 from puremvc.interfaces import IController, INotification, IView
 from puremvc.patterns.command import SimpleCommand
-from puremvc.patterns.observer import Notification
+from puremvc.patterns.observer import Notification, Observer
 
 
 class ControllerTest(unittest.TestCase):
@@ -153,6 +157,593 @@ class ControllerTest(unittest.TestCase):
         # if the command is executed twice, the value will be 48
         self.assertTrue(vo.result == 48, "Expecting vo.result == 48")
 
+    """
+    Tests replacing a Command that is already registered.
+
+    The replacement must be used for subsequent notifications sent through
+    the View, and the original Command must not be executed anymore.
+    """
+
+    def test_replace_command_via_view(self):
+        controller: IController = Controller.get_instance("ControllerTestKey6", lambda k: Controller(k))
+        controller.register_command("ControllerReplaceTest", lambda: ControllerTestCommand())
+
+        view: IView = View.get_instance("ControllerTestKey6", lambda k: View(k))
+        vo = ControllerTestVO(12)
+        note = Notification("ControllerReplaceTest", vo)
+        view.notify_observers(note)
+        self.assertEqual(vo.result, 24, "Expecting vo.result == 24")
+
+        # ControllerTestCommand2 accumulates, ControllerTestCommand overwrites
+        controller.register_command("ControllerReplaceTest", lambda: ControllerTestCommand2())
+        view.notify_observers(note)
+        self.assertEqual(vo.result, 48, "Expecting vo.result == 48")
+
+    """
+    Tests that a Controller subclass overriding execute_command still
+    receives the notifications dispatched by the View.
+    """
+
+    def test_execute_command_override(self):
+        controller = Controller.get_instance("ControllerTestKey7", lambda k: ControllerTestController(k))
+        controller.register_command("ControllerOverrideTest", lambda: ControllerTestCommand())
+
+        vo = ControllerTestVO(12)
+        view: IView = View.get_instance("ControllerTestKey7", lambda k: View(k))
+        view.notify_observers(Notification("ControllerOverrideTest", vo))
+
+        self.assertEqual(controller.executed, 1, "Expecting controller.executed == 1")
+        self.assertEqual(vo.result, 24, "Expecting vo.result == 24")
+
+        controller.register_command("ControllerOverrideTest.*", lambda: ControllerTestCommand())
+        vo = ControllerTestVO(5)
+        view.notify_observers(Notification("ControllerOverrideTest.created", vo))
+        self.assertEqual(vo.result, 10, "Expecting the pattern Command executed despite the override")
+
+    def test_register_commands(self):
+        """Tests registering several Commands at once, including the replacement of a registered one."""
+        controller: IController = Controller.get_instance("ControllerTestKey8", lambda k: Controller(k))
+        controller.register_command("ControllerBulkTest2", lambda: ControllerTestCommand())
+        controller.register_commands({"ControllerBulkTest1": lambda: ControllerTestCommand(),
+                                      "ControllerBulkTest2": lambda: ControllerTestCommand2()})
+
+        self.assertTrue(controller.has_command("ControllerBulkTest1"))
+        self.assertTrue(controller.has_command("ControllerBulkTest2"))
+
+        view: IView = View.get_instance("ControllerTestKey8", lambda k: View(k))
+        vo = ControllerTestVO(12)
+        view.notify_observers(Notification("ControllerBulkTest1", vo))
+        view.notify_observers(Notification("ControllerBulkTest2", vo))
+        self.assertEqual(vo.result, 48, "Expecting vo.result == 48")
+
+        controller.remove_command("ControllerBulkTest2")
+        view.notify_observers(Notification("ControllerBulkTest2", vo))
+        self.assertEqual(vo.result, 48, "Expecting vo.result == 48")
+
+    def test_register_command_by_path(self):
+        """Tests registering a Command by import path, imported and bound on first execution."""
+        controller: IController = Controller.get_instance("ControllerTestKey9", lambda k: Controller(k))
+        path = f"{ControllerTestCommand.__module__}:{ControllerTestCommand.__qualname__}"
+        controller.register_command("ControllerPathTest", path)
+        controller.register_command("ControllerMissingTest", "puremvc_missing.commands:MissingCommand")
+        self.assertTrue(controller.has_command("ControllerPathTest"))
+
+        view: IView = View.get_instance("ControllerTestKey9", lambda k: View(k))
+        vo = ControllerTestVO(12)
+        view.notify_observers(Notification("ControllerPathTest", vo))
+        self.assertEqual(vo.result, 24, "Expecting vo.result == 24")
+        self.assertIs(controller.commandMap["ControllerPathTest"], ControllerTestCommand,
+                      "Expecting the imported class to replace the path")
+
+        with self.assertRaises(ImportError):
+            view.notify_observers(Notification("ControllerMissingTest"))
+
+    def test_preload_commands(self):
+        """Tests that preload_commands imports and binds the Commands registered by import path."""
+        controller: IController = Controller.get_instance("ControllerTestKey10", lambda k: Controller(k))
+        controller.register_commands({
+            "ControllerPreloadTest": f"{ControllerTestCommand.__module__}:{ControllerTestCommand.__qualname__}",
+            "ControllerMissingTest": "puremvc_missing.commands.MissingCommand"})
+
+        controller.preload_commands().join()
+        self.assertIs(controller.commandMap["ControllerPreloadTest"], ControllerTestCommand)
+        self.assertEqual(list(controller.commandPathMap), ["ControllerMissingTest"],
+                         "Expecting the missing Command to stay pending")
+
+    def test_reuse_command(self):
+        """Tests that reused Commands are constructed once, or once per thread."""
+        controller: IController = Controller.get_instance("ControllerTestKey11", lambda k: Controller(k))
+        created = []
+
+        def factory():
+            command = ControllerTestCommand()
+            created.append(command)
+            return command
+
+        controller.register_command("ControllerFreshTest", factory)
+        controller.register_command("ControllerSingletonTest", factory, Controller.REUSE_SINGLETON)
+        controller.register_command("ControllerThreadTest", factory, Controller.REUSE_THREAD)
+        with self.assertRaises(ValueError):
+            controller.register_command("ControllerInvalidTest", factory, "pool")
+        self.assertFalse(controller.has_command("ControllerInvalidTest"))
+
+        view: IView = View.get_instance("ControllerTestKey11", lambda k: View(k))
+        vo = ControllerTestVO(12)
+        for name in ["ControllerFreshTest", "ControllerSingletonTest", "ControllerThreadTest"]:
+            del created[:]
+            for _ in range(3):
+                view.notify_observers(Notification(name, vo))
+            self.assertEqual(vo.result, 24, "Expecting vo.result == 24")
+            self.assertEqual(len(created), 3 if name == "ControllerFreshTest" else 1)
+            self.assertEqual(created[0].multitonKey, "ControllerTestKey11", "Expecting initialized Command")
+
+        del created[:]
+        thread = threading.Thread(target=lambda: view.notify_observers(Notification("ControllerThreadTest", vo)))
+        thread.start()
+        thread.join()
+        view.notify_observers(Notification("ControllerSingletonTest", vo))
+        self.assertEqual(len(created), 1, "Expecting a new Command for the new thread only")
+
+        controller.register_command("ControllerSingletonTest", factory)
+        view.notify_observers(Notification("ControllerSingletonTest", vo))
+        self.assertEqual(len(created), 2, "Expecting a new Command once reuse is dropped")
+
+    def test_add_command(self):
+        """Tests that several Commands registered for a name execute in order, and are replaced together."""
+        controller: IController = Controller.get_instance("ControllerTestKey12", lambda k: Controller(k))
+        order = []
+        controller.add_command("ControllerAddTest", lambda: ControllerTestRecordCommand(order, "first"))
+        controller.add_command("ControllerAddTest", lambda: ControllerTestRecordCommand(order, "second"))
+        controller.add_command("ControllerAddTest",
+                               f"{ControllerTestCommand.__module__}:{ControllerTestCommand.__qualname__}")
+
+        view: IView = View.get_instance("ControllerTestKey12", lambda k: View(k))
+        vo = ControllerTestVO(12)
+        view.notify_observers(Notification("ControllerAddTest", vo))
+        self.assertEqual(order, ["first", "second"], "Expecting Commands executed in order")
+        self.assertEqual(vo.result, 24, "Expecting vo.result == 24")
+
+        controller.register_command("ControllerAddTest", lambda: ControllerTestRecordCommand(order, "only"))
+        view.notify_observers(Notification("ControllerAddTest", vo))
+        self.assertEqual(order, ["first", "second", "only"], "Expecting the added Commands dropped")
+
+        controller.remove_command("ControllerAddTest")
+        view.notify_observers(Notification("ControllerAddTest", vo))
+        self.assertEqual(len(order), 3)
+
+    def test_fan_out_threads(self):
+        """Tests that the Commands for a name overlap on the thread pool, and failures are re-raised."""
+        controller: IController = Controller.get_instance("ControllerTestKey13", lambda k: Controller(k))
+        barrier = threading.Barrier(3, timeout=5)
+        threads = []
+
+        def factory():
+            return ControllerTestRecordCommand(threads, barrier)
+
+        for _ in range(3):
+            controller.add_command("ControllerThreadsTest", factory)
+        controller.set_fan_out("ControllerThreadsTest", Controller.FAN_OUT_THREADS)
+        with self.assertRaises(ValueError):
+            controller.set_fan_out("ControllerThreadsTest", "processes")
+
+        view: IView = View.get_instance("ControllerTestKey13", lambda k: View(k))
+        view.notify_observers(Notification("ControllerThreadsTest"))
+        self.assertEqual(len(threads), 3, "Expecting all Commands executed before the notification returns")
+        self.assertEqual(len(set(threads)), 3, "Expecting each Command on its own thread")
+        self.assertIn(threading.current_thread().name, threads, "Expecting the first Command on the caller")
+
+        # Another sender recycles the pool after this one got it
+        stale = controller._command_pool()
+        pools = iter([stale])
+        get_pool = controller._command_pool
+        controller._command_pool = lambda: next(pools, None) or get_pool()
+        controller._recycle_pool(stale)
+        threads.clear()
+        view.notify_observers(Notification("ControllerThreadsTest"))
+        self.assertEqual(len(threads), 3, "Expecting the Commands submitted to a new pool")
+        self.assertIsNotNone(controller.commandPool)
+        self.assertIsNot(controller.commandPool, stale)
+        del controller._command_pool
+
+        controller.add_command("ControllerThreadsTest", lambda: ControllerTestRecordCommand([], None))
+        with self.assertRaises(ValueError):
+            view.notify_observers(Notification("ControllerThreadsTest"))
+        Controller.remove_controller("ControllerTestKey13")
+
+    def test_fan_out_asyncio(self):
+        """Tests that coroutine Commands for a name run as concurrent asyncio tasks."""
+        controller: IController = Controller.get_instance("ControllerTestKey14", lambda k: Controller(k))
+        controller.register_command("ControllerAsyncTest", lambda: ControllerTestAsyncCommand())
+        controller.add_command("ControllerAsyncTest", lambda: ControllerTestAsyncCommand())
+        controller.set_fan_out("ControllerAsyncTest", Controller.FAN_OUT_ASYNCIO)
+
+        view: IView = View.get_instance("ControllerTestKey14", lambda k: View(k))
+        vo = ControllerTestVO(12)
+        view.notify_observers(Notification("ControllerAsyncTest", vo))
+        self.assertEqual(vo.result, 48, "Expecting both Commands completed in a new event loop")
+
+        async def send():
+            view.notify_observers(Notification("ControllerAsyncTest", vo))
+            self.assertEqual(vo.result, 48, "Expecting the Commands scheduled on the running loop")
+            await asyncio.sleep(0.01)
+
+        asyncio.run(send())
+        self.assertEqual(vo.result, 96, "Expecting vo.result == 96")
+
+        failures = []
+        view.register_observer(Controller.COMMAND_FAILED, Observer(lambda note: failures.append(note.body), self))
+
+        async def send_failing():
+            view.notify_observers(Notification("ControllerAsyncTest"))
+            await asyncio.gather(*controller.commandTasks, return_exceptions=True)
+
+        asyncio.run(send_failing())
+        self.assertEqual(len(failures), 2, "Expecting both task failures reported")
+        self.assertEqual(failures[0][0].name, "ControllerAsyncTest")
+        self.assertIsInstance(failures[0][1], AttributeError)
+
+    def test_guarded_command(self):
+        """Tests that a guard skips the construction of its Command, and counts the skipped notifications."""
+        controller: IController = Controller.get_instance("ControllerTestKey15", lambda k: Controller(k))
+        created = []
+
+        def factory():
+            created.append(ControllerTestCommand())
+            return created[-1]
+
+        def guard(notification):
+            return notification.body.input > 10
+
+        controller.register_command("ControllerGuardTest", factory, guard=guard)
+        controller.add_command("ControllerGuardTest", lambda: ControllerTestCommand2(), guard=guard)
+
+        view: IView = View.get_instance("ControllerTestKey15", lambda k: View(k))
+        low = ControllerTestVO(5)
+        for _ in range(3):
+            view.notify_observers(Notification("ControllerGuardTest", low))
+        self.assertEqual(low.result, 0, "Expecting no Command executed")
+        self.assertEqual(created, [], "Expecting no Command constructed")
+        self.assertEqual(controller.guard_rejections(guard), 6, "Expecting both registrations counted")
+
+        high = ControllerTestVO(12)
+        view.notify_observers(Notification("ControllerGuardTest", high))
+        self.assertEqual(high.result, 48, "Expecting vo.result == 48")
+        self.assertEqual(len(created), 1)
+        self.assertEqual(controller.guard_rejections(guard), 6)
+
+        controller.register_command("ControllerGuardTest2", lambda: ControllerTestCommand(), guard=guard)
+        controller.remove_command("ControllerGuardTest")
+        self.assertEqual(controller.guard_rejections(guard), 6, "Expecting the count kept for the other name")
+
+        def send():
+            for _ in range(500):
+                view.notify_observers(Notification("ControllerGuardTest2", low))
+
+        threads = [threading.Thread(target=send) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(controller.guard_rejections(guard), 4006, "Expecting no count lost to concurrent dispatch")
+
+        controller.remove_command("ControllerGuardTest2")
+        self.assertEqual(controller.guard_rejections(guard), 0, "Expecting the count dropped with the Commands")
+
+    def test_queued_commands(self):
+        """Tests that queued Commands execute on the workers, in order per name, and report failures."""
+        controller: IController = Controller.get_instance("ControllerTestKey16", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey16", lambda k: View(k))
+        record = []
+        failures = []
+        controller.register_command("ControllerQueueTest", lambda: ControllerTestQueueCommand(record))
+        view.register_observer(Controller.COMMAND_FAILED, Observer(lambda note: failures.append(note.body), self))
+
+        controller.start_queue(workers=3, ordered=True)
+        with self.assertRaises(Exception):
+            controller.start_queue()
+        for i in range(50):
+            view.notify_observers(Notification("ControllerQueueTest", i))
+        view.notify_observers(Notification("ControllerQueueTest", None))
+        controller.join_queue()
+        self.assertEqual([value for value, _ in record], list(range(50)), "Expecting the name executed in order")
+        self.assertEqual(len({thread for _, thread in record}), 1, "Expecting one worker per name")
+        self.assertTrue(record[0][1].startswith("ControllerTestKey16-queue-"), "Expecting a queue worker")
+        self.assertEqual(len(failures), 1, "Expecting the failure reported")
+        self.assertIsInstance(failures[0][1], TypeError)
+        self.assertEqual(controller.queue_stats()["failed"], 1)
+
+        controller.stop_queue()
+        del record[:]
+        view.notify_observers(Notification("ControllerQueueTest", 1))
+        self.assertEqual(record, [(1, threading.current_thread().name)], "Expecting inline execution once stopped")
+        self.assertEqual(controller.queue_stats(), {})
+
+    def test_legacy_controller_implementation(self):
+        """Tests that an IController implementation predating the new members gets their defaults."""
+        controller = ControllerTestLegacyController()
+        controller.register_commands({"ControllerLegacyTest1": ControllerTestCommand,
+                                      "ControllerLegacyTest2": ControllerTestCommand})
+        self.assertTrue(controller.has_command("ControllerLegacyTest1"))
+        self.assertTrue(controller.has_command("ControllerLegacyTest2"))
+        self.assertEqual(controller.queue_stats(), {})
+        self.assertEqual(controller.guard_rejections(bool), 0)
+        self.assertFalse(controller.offloads_commands())
+        controller.join_queue()
+        controller.preload_commands().join()
+        with self.assertRaises(NotImplementedError):
+            controller.start_queue()
+
+    def test_queued_command_resends(self):
+        """Tests that queued Commands sending their own name to a full queue neither deadlock nor die."""
+        controller: IController = Controller.get_instance("ControllerTestKey21", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey21", lambda k: View(k))
+        record = []
+        tracker = ControllerTestOverlapTracker()
+        controller.register_command("ControllerResendTest", lambda: ControllerTestResendCommand(view, record, tracker))
+        controller.register_command("ControllerFanTest", lambda: ControllerTestSendCommand(view, "ControllerLaneTest"))
+        controller.register_command("ControllerLaneTest", lambda: ControllerTestTrackedCommand(record, tracker))
+        view.register_observer(Controller.COMMAND_FAILED, Observer(lambda note: 1 / 0, self))
+
+        controller.start_queue(workers=2, capacity=2, ordered=True)
+        for _ in range(3):
+            view.notify_observers(Notification("ControllerResendTest", 5))
+        view.notify_observers(Notification("ControllerResendTest", None))
+        joined = threading.Thread(target=controller.join_queue, daemon=True)
+        joined.start()
+        joined.join(5)
+        self.assertFalse(joined.is_alive(), "Expecting the queue to drain")
+        self.assertEqual(len(record), 18, "Expecting every resent notification executed")
+        self.assertEqual(controller.queue_stats()["failed"], 1)
+        self.assertEqual(tracker.max_active, {"ControllerResendTest": 1}, "Expecting one Command at a time")
+
+        record.clear()
+        view.notify_observers(Notification("ControllerFanTest", 5))
+        controller.join_queue()
+        self.assertEqual(record, [1, 2, 3, 4, 5], "Expecting the sent notifications executed in order")
+        self.assertEqual(tracker.max_active["ControllerLaneTest"], 1, "Expecting one Command at a time")
+
+        view.notify_observers(Notification("ControllerResendTest", 0))
+        controller.join_queue()
+        self.assertEqual(len(record), 6, "Expecting the workers alive after a failing failure observer")
+        controller.stop_queue()
+
+    def test_queue_policies(self):
+        """Tests that a full queue drops or rejects notifications as requested."""
+        controller: IController = Controller.get_instance("ControllerTestKey17", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey17", lambda k: View(k))
+        release = threading.Event()
+        started = threading.Event()
+        controller.register_command("ControllerPolicyTest", lambda: ControllerTestBlockingCommand(started, release))
+
+        for policy, expected in [(Controller.QUEUE_DROP, "dropped"), (Controller.QUEUE_REJECT, "rejected")]:
+            started.clear()
+            release.clear()
+            controller.start_queue(workers=1, capacity=1, policy=policy)
+            view.notify_observers(Notification("ControllerPolicyTest"))
+            self.assertTrue(started.wait(5), "Expecting the worker busy")
+            view.notify_observers(Notification("ControllerPolicyTest"))
+            if policy == Controller.QUEUE_REJECT:
+                with self.assertRaises(queue.Full):
+                    view.notify_observers(Notification("ControllerPolicyTest"))
+            else:
+                view.notify_observers(Notification("ControllerPolicyTest"))
+            stats = controller.queue_stats()
+            self.assertEqual(stats[expected], 1)
+            self.assertEqual(stats["pending"], 1)
+            release.set()
+            controller.stop_queue()
+
+        with self.assertRaises(ValueError):
+            controller.start_queue(policy="wait")
+
+    def test_serial_lanes(self):
+        """Tests that serial Commands never overlap within a lane, while different lanes run in parallel."""
+        controller: IController = Controller.get_instance("ControllerTestKey18", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey18", lambda k: View(k))
+        tracker = ControllerTestOverlapTracker()
+        controller.register_command("ControllerSerialTest", lambda: ControllerTestOverlapCommand(tracker))
+        controller.set_serial("ControllerSerialTest")
+
+        def send(name, bodies):
+            threads = [threading.Thread(target=lambda b=body: view.notify_observers(Notification(name, b)))
+                       for body in bodies]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        send("ControllerSerialTest", ["a"] * 4)
+        self.assertEqual(tracker.max_active, {"a": 1}, "Expecting the name executed one at a time")
+
+        barrier = threading.Barrier(2, timeout=5)
+        controller.register_command("ControllerLaneTest", lambda: ControllerTestOverlapCommand(tracker, barrier))
+        controller.set_serial("ControllerLaneTest", key=lambda note: note.body)
+        send("ControllerLaneTest", ["b", "c", "b", "c"])
+        self.assertEqual(tracker.max_active, {"a": 1, "b": 1, "c": 1}, "Expecting each key executed one at a time")
+        self.assertFalse(barrier.broken, "Expecting different keys executed in parallel")
+
+        controller.set_serial("ControllerSerialTest", False)
+        send("ControllerSerialTest", ["d"] * 4)
+        self.assertGreater(tracker.max_active["d"], 1, "Expecting overlapping Commands once not serial")
+
+    def test_queued_serial_lanes(self):
+        """Tests that queued serial Commands execute in order per key, without holding up the workers."""
+        controller: IController = Controller.get_instance("ControllerTestKey24", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey24", lambda k: View(k))
+        record = []
+        tracker = ControllerTestOverlapTracker()
+        controller.register_command("ControllerQueuedSerialTest", lambda: ControllerTestTrackedCommand(record, tracker))
+        controller.set_serial("ControllerQueuedSerialTest", key=lambda note: note.body % 2)
+
+        controller.start_queue(workers=4)
+        for body in range(100):
+            view.notify_observers(Notification("ControllerQueuedSerialTest", body))
+        controller.join_queue()
+        self.assertEqual([body for body in record if body % 2 == 0], list(range(0, 100, 2)), "Expecting key order")
+        self.assertEqual([body for body in record if body % 2 == 1], list(range(1, 100, 2)), "Expecting key order")
+        self.assertLessEqual(tracker.max_active["ControllerQueuedSerialTest"], 2, "Expecting one Command per key")
+
+        started, release = threading.Event(), threading.Event()
+        quick = []
+        controller.register_command("ControllerParkedTest", lambda: ControllerTestLaneCommand(started, release, []))
+        controller.register_command("ControllerQuickTest", lambda: ControllerTestQueueCommand(quick))
+        controller.set_serial("ControllerParkedTest")
+        for _ in range(8):
+            view.notify_observers(Notification("ControllerParkedTest"))
+        view.notify_observers(Notification("ControllerQuickTest", 1))
+        deadline = time.monotonic() + 5
+        while not quick and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(quick), 1, "Expecting other names executed while the lane is busy")
+        self.assertFalse(release.is_set())
+        release.set()
+        controller.join_queue()
+        controller.stop_queue()
+
+    def test_queued_command_timeout(self):
+        """Tests that a queued Command running past its timeout is reported, and its worker replaced."""
+        controller: IController = Controller.get_instance("ControllerTestKey19", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey19", lambda k: View(k))
+        started, release = threading.Event(), threading.Event()
+        timeouts = []
+        record = []
+        controller.register_command("ControllerHungTest", lambda: ControllerTestBlockingCommand(started, release))
+        controller.register_command("ControllerQuickTest", lambda: ControllerTestQueueCommand(record))
+        view.register_observer(Controller.COMMAND_TIMED_OUT, Observer(lambda note: timeouts.append(note.body), self))
+        with self.assertRaises(ValueError):
+            controller.set_timeout(None, 0)
+        controller.set_timeout("ControllerHungTest", 0.1)
+
+        controller.start_queue(workers=1)
+        view.notify_observers(Notification("ControllerHungTest"))
+        view.notify_observers(Notification("ControllerQuickTest", 1))
+        controller.join_queue()
+        self.assertEqual(len(timeouts), 1, "Expecting the timeout reported")
+        self.assertEqual(timeouts[0][0].name, "ControllerHungTest")
+        self.assertEqual(timeouts[0][1], 0.1)
+        self.assertEqual([value for value, _ in record], [1], "Expecting a new worker to execute the next Command")
+        self.assertEqual(controller.queue_stats()["timed_out"], 1)
+
+        release.set()
+        controller.stop_queue()
+
+    def test_queued_timeout_keeps_order(self):
+        """Tests that a queued Command past its timeout in an ordered queue or a serial lane still holds its lane."""
+        controller: IController = Controller.get_instance("ControllerTestKey22", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey22", lambda k: View(k))
+        timeouts = []
+        record = []
+        view.register_observer(Controller.COMMAND_TIMED_OUT, Observer(lambda note: timeouts.append(note.body), self))
+        controller.set_timeout(None, 0.1)
+
+        for ordered in (True, False):
+            started, release = threading.Event(), threading.Event()
+            controller.register_command("ControllerLaneTimeoutTest",
+                                        lambda: ControllerTestLaneCommand(started, release, record))
+            if not ordered:
+                controller.set_serial("ControllerLaneTimeoutTest")
+            controller.start_queue(workers=2, ordered=ordered)
+            view.notify_observers(Notification("ControllerLaneTimeoutTest"))
+            view.notify_observers(Notification("ControllerLaneTimeoutTest", ordered))
+            deadline = time.monotonic() + 5
+            while not timeouts and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(len(timeouts), 1, "Expecting the timeout reported")
+            time.sleep(0.1)
+            self.assertEqual(record, [], "Expecting the next Command still waiting for the lane")
+            release.set()
+            controller.join_queue()
+            self.assertEqual(record, [ordered], "Expecting the next Command executed once the lane is free")
+            self.assertEqual(controller.queue_stats()["timed_out"], 1)
+            controller.stop_queue()
+            controller.remove_command("ControllerLaneTimeoutTest")
+            timeouts.clear()
+            record.clear()
+
+    def test_queued_fan_out_timeout(self):
+        """Tests that a queued thread fan-out past its timeout is reported once per Command."""
+        controller: IController = Controller.get_instance("ControllerTestKey23", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey23", lambda k: View(k))
+        started, release = threading.Event(), threading.Event()
+        timeouts = []
+        view.register_observer(Controller.COMMAND_TIMED_OUT, Observer(lambda note: timeouts.append(note.body), self))
+        controller.set_timeout(None, 0.1)
+        controller.register_command("ControllerQueuedFanOutTest",
+                                    lambda: ControllerTestBlockingCommand(started, release))
+        controller.add_command("ControllerQueuedFanOutTest", lambda: ControllerTestBlockingCommand(started, release))
+        controller.set_fan_out("ControllerQueuedFanOutTest", Controller.FAN_OUT_THREADS)
+
+        controller.start_queue(workers=1)
+        view.notify_observers(Notification("ControllerQueuedFanOutTest"))
+        controller.join_queue()
+        time.sleep(0.2)
+        self.assertEqual(len(timeouts), 2, "Expecting each Command reported once")
+        self.assertEqual(controller.queue_stats()["timed_out"], 0, "Expecting the queue not timing the fan-out")
+        release.set()
+        Controller.remove_controller("ControllerTestKey23")
+
+    def test_fan_out_timeout(self):
+        """Tests that thread and asyncio fan-outs stop waiting for Commands past their timeout."""
+        controller: IController = Controller.get_instance("ControllerTestKey20", lambda k: Controller(k))
+        view: IView = View.get_instance("ControllerTestKey20", lambda k: View(k))
+        started, release = threading.Event(), threading.Event()
+        timeouts = []
+        view.register_observer(Controller.COMMAND_TIMED_OUT, Observer(lambda note: timeouts.append(note.body), self))
+        controller.set_timeout(None, 0.1)
+
+        controller.register_command("ControllerThreadsTimeoutTest",
+                                    lambda: ControllerTestBlockingCommand(started, release))
+        controller.set_fan_out("ControllerThreadsTimeoutTest", Controller.FAN_OUT_THREADS)
+        view.notify_observers(Notification("ControllerThreadsTimeoutTest"))
+        self.assertTrue(started.is_set(), "Expecting the Command started on the pool")
+        self.assertEqual(len(timeouts), 1, "Expecting the timeout reported")
+        self.assertIsNone(controller.commandPool, "Expecting the pool discarded, to be replaced on next use")
+        release.set()
+
+        vo = ControllerTestVO(12)
+        controller.register_command("ControllerAsyncTimeoutTest", lambda: ControllerTestAsyncCommand(10))
+        controller.add_command("ControllerAsyncTimeoutTest", lambda: ControllerTestAsyncCommand())
+        controller.set_fan_out("ControllerAsyncTimeoutTest", Controller.FAN_OUT_ASYNCIO)
+        view.notify_observers(Notification("ControllerAsyncTimeoutTest", vo))
+        self.assertEqual(len(timeouts), 2, "Expecting the slow task cancelled and reported")
+        self.assertEqual(vo.result, 24, "Expecting only the quick task completed")
+        Controller.remove_controller("ControllerTestKey20")
+
+
+class ControllerTestLegacyController(IController):
+    """
+    An IController implementation used by ControllerTest, implementing only the original members.
+    """
+
+    def __init__(self):
+        self.commands = {}
+
+    def register_command(self, notification_name: str, factory, reuse=None, guard=None):
+        self.commands[notification_name] = factory
+
+    def execute_command(self, notification: INotification):
+        self.commands[notification.name]().execute(notification)
+
+    def has_command(self, notification_name: str) -> bool:
+        return notification_name in self.commands
+
+    def remove_command(self, notification_name: str):
+        self.commands.pop(notification_name, None)
+
+
+class ControllerTestController(Controller):
+    """
+    A Controller subclass used by ControllerTest.
+    """
+
+    def __init__(self, key: str):
+        self.executed = 0
+        super().__init__(key)
+
+    def execute_command(self, notification: INotification):
+        self.executed += 1
+        super().execute_command(notification)
+
 
 class ControllerTestCommand(SimpleCommand):
     """
@@ -189,6 +780,237 @@ class ControllerTestCommand2(SimpleCommand):
         vo.result = vo.result + (2 * vo.input)
 
 
+class ControllerTestRecordCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, recording its execution.
+    """
+
+    def __init__(self, record: list, label):
+        super().__init__()
+        self.record = record
+        self.label = label
+
+    def execute(self, notification: INotification):
+        """
+        Record the label, or the name of the executing thread once all threads reach the barrier.
+        Raises a ValueError without a label.
+
+        :param notification:
+        :return:
+        """
+        if self.label is None:
+            raise ValueError("ControllerTestRecordCommand")
+        if isinstance(self.label, threading.Barrier):
+            self.label.wait()
+            self.record.append(threading.current_thread().name)
+        else:
+            self.record.append(self.label)
+
+
+class ControllerTestAsyncCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, with a coroutine execute method.
+    """
+
+    def __init__(self, delay: float = 0):
+        super().__init__()
+        self.delay = delay
+
+    async def execute(self, notification: INotification):
+        """
+        Fabricate a result by adding twice the input after sleeping for the delay
+
+        :param notification: The note carrying the ControllerTestVO
+        :return:
+        """
+        await asyncio.sleep(self.delay)
+        vo: ControllerTestVO = notification.body
+        vo.result = vo.result + (2 * vo.input)
+
+
+class ControllerTestQueueCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, recording the body and the executing thread.
+    """
+
+    def __init__(self, record: list):
+        super().__init__()
+        self.record = record
+
+    def execute(self, notification: INotification):
+        """
+        Record the body and the name of the executing thread. Raises a TypeError without a body.
+
+        :param notification:
+        :return:
+        """
+        self.record.append((notification.body + 0, threading.current_thread().name))
+
+
+class ControllerTestResendCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, sending its own notification again.
+    """
+
+    def __init__(self, view: IView, record: list, tracker: "ControllerTestOverlapTracker"):
+        super().__init__()
+        self.view = view
+        self.record = record
+        self.tracker = tracker
+
+    def execute(self, notification: INotification):
+        """
+        Record the body, and send the notification again with the body decremented, until it reaches 0.
+        Raises a TypeError without a body. Tracks the execution by name.
+
+        :param notification:
+        :return:
+        """
+        self.tracker.enter(notification.name)
+        try:
+            self.record.append(notification.body + 0)
+            time.sleep(0.002)
+            if notification.body > 0:
+                self.view.notify_observers(Notification(notification.name, notification.body - 1))
+        finally:
+            self.tracker.leave(notification.name)
+
+
+class ControllerTestTrackedCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, recording the body and tracking the execution by name.
+    """
+
+    def __init__(self, record: list, tracker: "ControllerTestOverlapTracker"):
+        super().__init__()
+        self.record = record
+        self.tracker = tracker
+
+    def execute(self, notification: INotification):
+        """
+        Record the body while tracking the execution.
+
+        :param notification:
+        :return:
+        """
+        self.tracker.enter(notification.name)
+        self.record.append(notification.body)
+        time.sleep(0.002)
+        self.tracker.leave(notification.name)
+
+
+class ControllerTestSendCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, sending notifications for another name.
+    """
+
+    def __init__(self, view: IView, name: str):
+        super().__init__()
+        self.view = view
+        self.target = name
+
+    def execute(self, notification: INotification):
+        """
+        Send a notification for the other name with each body from 1 to the body.
+
+        :param notification:
+        :return:
+        """
+        for body in range(1, notification.body + 1):
+            self.view.notify_observers(Notification(self.target, body))
+
+
+class ControllerTestBlockingCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, blocking until released.
+    """
+
+    def __init__(self, started: threading.Event, release: threading.Event):
+        super().__init__()
+        self.started = started
+        self.release = release
+
+    def execute(self, notification: INotification):
+        """
+        Signal the start of the execution, and wait for the release.
+
+        :param notification:
+        :return:
+        """
+        self.started.set()
+        self.release.wait(5)
+
+
+class ControllerTestLaneCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, blocking until released without a body.
+    """
+
+    def __init__(self, started: threading.Event, release: threading.Event, record: list):
+        super().__init__()
+        self.started = started
+        self.release = release
+        self.record = record
+
+    def execute(self, notification: INotification):
+        """
+        Record the body, or without a body, signal the start of the execution and wait for the release.
+
+        :param notification:
+        :return:
+        """
+        if notification.body is None:
+            self.started.set()
+            self.release.wait(5)
+        else:
+            self.record.append(notification.body)
+
+
+class ControllerTestOverlapTracker:
+    """
+    A utility class used by ControllerTest, tracking the Commands executing at once for each body.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.max_active = {}
+
+    def enter(self, body: str):
+        with self.lock:
+            self.active[body] = self.active.get(body, 0) + 1
+            self.max_active[body] = max(self.max_active.get(body, 0), self.active[body])
+
+    def leave(self, body: str):
+        with self.lock:
+            self.active[body] -= 1
+
+
+class ControllerTestOverlapCommand(SimpleCommand):
+    """
+    A SimpleCommand subclass used by ControllerTest, recording overlapping executions.
+    """
+
+    def __init__(self, tracker: ControllerTestOverlapTracker, barrier: threading.Barrier = None):
+        super().__init__()
+        self.tracker = tracker
+        self.barrier = barrier
+
+    def execute(self, notification: INotification):
+        """
+        Track the execution while waiting for the barrier, or sleeping briefly.
+
+        :param notification:
+        :return:
+        """
+        self.tracker.enter(notification.body)
+        if self.barrier is not None:
+            self.barrier.wait()
+        else:
+            time.sleep(0.02)
+        self.tracker.leave(notification.body)
+
+
 class ControllerTestVO:
     """
     A utility class used by ControllerTest.
@@ -4,11 +4,13 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import threading
+import time
 import unittest
 from typing import List
 
 from puremvc.core import Model
-from puremvc.interfaces import IModel
+from puremvc.interfaces import IModel, IProxy
 from puremvc.patterns.proxy import Proxy
 
 
@@ -107,6 +109,96 @@ class ModelTest(unittest.TestCase):
         self.assertTrue(proxy.data == ModelTestProxy.ON_REMOVE_CALLED,
                         "Expecting proxy.data == ModelTestProxy.ON_REMOVE_CALLED")
 
+    def test_register_proxies(self):
+        """Tests registering several Proxies at once, with on_register called in order"""
+        model = Model.get_instance("ModelTestKey6", lambda k: Model(k))
+        registered: List[str] = []
+        proxies = [ModelTestOrderProxy(name, registered) for name in ("first", "second", "third")]
+        model.register_proxies(proxies)
+
+        self.assertEqual(registered, ["first", "second", "third"], "Expecting on_register in order")
+        for proxy in proxies:
+            self.assertIs(model.retrieve_proxy(proxy.proxy_name), proxy)
+            self.assertEqual(proxy.multitonKey, "ModelTestKey6", "Expecting the notifier to be initialized")
+
+    def test_register_proxy_factory(self):
+        """Tests that a Proxy registered by factory is constructed and registered on first retrieval"""
+        model = Model.get_instance("ModelTestKey7", lambda k: Model(k))
+        constructed: List[IProxy] = []
+
+        def factory():
+            constructed.append(ModelTestProxy())
+            return constructed[-1]
+
+        model.register_proxy_factory(ModelTestProxy.NAME, factory)
+        self.assertTrue(model.has_proxy(ModelTestProxy.NAME), "Expecting the factory to count as registered")
+        self.assertEqual(constructed, [], "Expecting no construction before retrieval")
+
+        proxy = model.retrieve_proxy(ModelTestProxy.NAME)
+        self.assertIs(proxy, constructed[0])
+        self.assertIs(model.retrieve_proxy(ModelTestProxy.NAME), proxy, "Expecting the same instance")
+        self.assertEqual(proxy.data, ModelTestProxy.ON_REGISTER_CALLED, "Expecting on_register to be called")
+        self.assertEqual(proxy.multitonKey, "ModelTestKey7", "Expecting the notifier to be initialized")
+
+        # a factory removed before first retrieval is never constructed
+        model.remove_proxy(ModelTestProxy.NAME)
+        model.register_proxy_factory(ModelTestProxy.NAME, factory)
+        model.remove_proxy(ModelTestProxy.NAME)
+        self.assertFalse(model.has_proxy(ModelTestProxy.NAME))
+        self.assertIsNone(model.retrieve_proxy(ModelTestProxy.NAME))
+        self.assertEqual(len(constructed), 1, "Expecting a single construction")
+
+    def test_legacy_model_implementation(self):
+        """Tests that an IModel implementation predating the new members gets their defaults."""
+        model = ModelTestLegacyModel()
+        model.register_proxies([Proxy("ModelTestLegacyProxy1"), Proxy("ModelTestLegacyProxy2")])
+        model.register_proxy_factory("ModelTestLegacyProxy3", lambda: Proxy("ModelTestLegacyProxy3"))
+        self.assertEqual(list(model.proxies), ["ModelTestLegacyProxy1", "ModelTestLegacyProxy2",
+                                               "ModelTestLegacyProxy3"], "Expecting every Proxy registered at once")
+
+    def test_register_proxy_factory_concurrent_retrieval(self):
+        """Tests that concurrent first retrievals construct a Proxy registered by factory once"""
+        model = Model.get_instance("ModelTestKey8", lambda k: Model(k))
+        constructed: List[IProxy] = []
+
+        def factory():
+            time.sleep(0.01)
+            constructed.append(ModelTestProxy())
+            return constructed[-1]
+
+        model.register_proxy_factory(ModelTestProxy.NAME, factory)
+        retrieved: List[IProxy] = []
+        threads = [threading.Thread(target=lambda: retrieved.append(model.retrieve_proxy(ModelTestProxy.NAME)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(constructed), 1, "Expecting a single construction")
+        self.assertTrue(all(proxy is constructed[0] for proxy in retrieved), "Expecting the same instance")
+
+
+class ModelTestLegacyModel(IModel):
+    """
+    An IModel implementation used by ModelTest, implementing only the original members.
+    """
+
+    def __init__(self):
+        self.proxies = {}
+
+    def register_proxy(self, proxy: IProxy):
+        self.proxies[proxy.proxy_name] = proxy
+
+    def retrieve_proxy(self, proxy_name: str):
+        return self.proxies.get(proxy_name)
+
+    def remove_proxy(self, proxy_name: str):
+        return self.proxies.pop(proxy_name, None)
+
+    def has_proxy(self, proxy_name: str) -> bool:
+        return proxy_name in self.proxies
+
 
 class ModelTestProxy(Proxy):
     NAME = "ModelTestProxy"
@@ -123,5 +215,14 @@ class ModelTestProxy(Proxy):
         self.data = ModelTestProxy.ON_REMOVE_CALLED
 
 
+class ModelTestOrderProxy(Proxy):
+    def __init__(self, name: str, registered: List[str]):
+        super().__init__(name)
+        self.registered = registered
+
+    def on_register(self):
+        self.registered.append(self.proxy_name)
+
+
 if __name__ == '__main__':
     unittest.main()
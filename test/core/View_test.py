@@ -4,6 +4,9 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import gc
+import sys
+import threading
 import unittest
 
 from puremvc.core import View
@@ -82,6 +85,473 @@ class ViewTest(unittest.TestCase):
         # test assertions
         self.assertTrue(self.viewTestVar == 10, "Expecting viewTestVar = 10")
 
+    def test_invalidate_route(self):
+        """Tests that a mutated observer is picked up once its route is invalidated."""
+        view: IView = View.get_instance("ViewTestKey12", lambda k: View(k))
+
+        observer: IObserver = Observer(self.view_test_method, self)
+        view.register_observer("ViewTestRouteNote", observer)
+        view.notify_observers(Notification("ViewTestRouteNote", 10))
+        self.assertEqual(self.viewTestVar, 10, "Expecting viewTestVar == 10")
+
+        # the compiled route still calls the original method until invalidated
+        observer.notify_method = self.view_test_method2
+        view.invalidate_route("ViewTestRouteNote")
+        view.notify_observers(Notification("ViewTestRouteNote", 10))
+        self.assertEqual(self.viewTestVar, 20, "Expecting viewTestVar == 20")
+
+        view.remove_observer("ViewTestRouteNote", self)
+        self.viewTestVar = 0
+        view.notify_observers(Notification("ViewTestRouteNote", 10))
+        self.assertEqual(self.viewTestVar, 0, "Expecting viewTestVar == 0")
+
+    def test_notification_names_are_interned(self):
+        """Tests that observer names are interned at registration time."""
+        view: View = View.get_instance("ViewTestKey13", lambda k: View(k))
+
+        prefix = "view.test"
+        name = prefix + ".interned.note"
+        view.register_observer(name, Observer(self.view_test_method, self))
+        self.assertIs(next(iter(view.observerMap)), sys.intern(name), "Expecting the interned name")
+
+        # an equal but distinct name object is still dispatched
+        view.notify_observers(Notification("".join([prefix, ".interned.note"]), 10))
+        self.assertEqual(self.viewTestVar, 10, "Expecting viewTestVar == 10")
+
+    def test_pattern_observers(self):
+        """Tests observers registered for `*` and `#` notification name patterns."""
+        view: IView = View.get_instance("ViewTestKey14", lambda k: View(k))
+        received = []
+        view.register_observer("order.*", Observer(lambda n: received.append(("one", n.name)), "one"))
+        view.register_observer("order.#", Observer(lambda n: received.append(("many", n.name)), "many"))
+
+        view.notify_observers(Notification("order"))
+        view.notify_observers(Notification("order.created"))
+        view.notify_observers(Notification("order.item.created"))
+        view.notify_observers(Notification("invoice.created"))
+        self.assertEqual(received, [("many", "order"),
+                                    ("one", "order.created"), ("many", "order.created"),
+                                    ("many", "order.item.created")])
+
+        # a pattern registered after the route was compiled is picked up
+        view.register_observer("#.created", Observer(lambda n: received.append(("created", n.name)), "created"))
+        received.clear()
+        view.notify_observers(Notification("invoice.created"))
+        self.assertEqual(received, [("created", "invoice.created")])
+
+        view.remove_observer("order.*", "one")
+        view.remove_observer("#.created", "created")
+        received.clear()
+        view.notify_observers(Notification("order.created"))
+        self.assertEqual(received, [("many", "order.created")])
+
+    def test_pattern_mediator(self):
+        """Tests a Mediator listening to a family of notifications."""
+        view: IView = View.get_instance("ViewTestKey15", lambda k: View(k))
+        view.register_mediator(ViewTestMediator7(self))
+
+        self.counter = 0
+        view.notify_observers(Notification("view.test.one"))
+        view.notify_observers(Notification("view.test.two"))
+        view.notify_observers(Notification("view.other.one"))
+        self.assertEqual(self.counter, 2, "Expecting counter == 2")
+
+        view.remove_mediator(ViewTestMediator7.NAME)
+        view.notify_observers(Notification("view.test.one"))
+        self.assertEqual(self.counter, 2, "Expecting counter == 2")
+
+    def test_typed_observers(self):
+        """Tests that typed observers only receive notifications of their type."""
+        view: IView = View.get_instance("ViewTestKey16", lambda k: View(k))
+        received = []
+        view.register_observer("ViewTestTyped", Observer(lambda n: received.append("a"), "a", "typeA"))
+        view.register_observer("ViewTestTyped", Observer(lambda n: received.append("any"), "any"))
+        view.register_observer("ViewTestTyped", Observer(lambda n: received.append("b"), "b", "typeB"))
+
+        view.notify_observers(Notification("ViewTestTyped", None, "typeA"))
+        self.assertEqual(received, ["a", "any"])
+
+        received.clear()
+        view.notify_observers(Notification("ViewTestTyped", None, "typeC"))
+        view.notify_observers(Notification("ViewTestTyped"))
+        self.assertEqual(received, ["any", "any"])
+
+        view.remove_observer("ViewTestTyped", "any")
+        received.clear()
+        view.notify_observers(Notification("ViewTestTyped", None, "typeB"))
+        view.notify_observers(Notification("ViewTestTyped"))
+        self.assertEqual(received, ["b"])
+
+    def test_typed_mediator_interests(self):
+        """Tests a Mediator declaring (name, type) interests."""
+        view: IView = View.get_instance("ViewTestKey17", lambda k: View(k))
+        view.register_mediator(ViewTestMediator8(self))
+
+        self.counter = 0
+        view.notify_observers(Notification(ViewTest.NOTE1, None, "typeA"))
+        view.notify_observers(Notification(ViewTest.NOTE1, None, "typeB"))
+        view.notify_observers(Notification(ViewTest.NOTE1, None, "typeC"))
+        view.notify_observers(Notification(ViewTest.NOTE2, None, "typeC"))
+        self.assertEqual(self.counter, 3, "Expecting counter == 3")
+
+        view.remove_mediator(ViewTestMediator8.NAME)
+        view.notify_observers(Notification(ViewTest.NOTE1, None, "typeA"))
+        view.notify_observers(Notification(ViewTest.NOTE2))
+        self.assertEqual(self.counter, 3, "Expecting counter == 3")
+
+    def test_mediator_predicates(self):
+        """Tests that a Mediator's predicates are evaluated before handle_notification."""
+        view: View = View.get_instance("ViewTestKey18", lambda k: View(k))
+        view.register_mediator(ViewTestMediator9(self))
+
+        self.counter = 0
+        view.notify_observers(Notification(ViewTest.NOTE1, 1))
+        view.notify_observers(Notification(ViewTest.NOTE1, 5))
+        view.notify_observers(Notification(ViewTest.NOTE2, 1))
+        self.assertEqual(self.counter, 2, "Expecting counter == 2")
+
+        observer = view.observerMap[ViewTest.NOTE1]
+        self.assertIsInstance(observer, Observer, "Expecting a single unwrapped observer")
+        self.assertEqual(observer.rejections, 1, "Expecting one rejection for NOTE1")
+        self.assertEqual(view.interest_rejections(ViewTestMediator9.NAME), {ViewTest.NOTE1: 1})
+
+        def reject():
+            for _ in range(1000):
+                view.notify_observers(Notification(ViewTest.NOTE1, 0))
+
+        threads = [threading.Thread(target=reject) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(view.interest_rejections(ViewTestMediator9.NAME), {ViewTest.NOTE1: 8001},
+                         "Expecting no rejection lost under concurrent dispatch")
+
+        view.remove_mediator(ViewTestMediator9.NAME)
+        self.assertNotIn(ViewTest.NOTE1, view.observerMap)
+
+    def test_observer_priority(self):
+        """Tests that observers are notified by descending priority, stable within a priority."""
+        view: IView = View.get_instance("ViewTestKey19", lambda k: View(k))
+        received = []
+        for name, priority in (("a", 0), ("b", 5), ("c", 0), ("d", 10), ("e", 5), ("f", -1)):
+            view.register_observer("view.priority", Observer(lambda n, x=name: received.append(x), name,
+                                                             priority=priority))
+
+        view.notify_observers(Notification("view.priority"))
+        self.assertEqual(received, ["d", "b", "e", "a", "c", "f"])
+
+        # pattern observers are merged into the route by priority
+        received.clear()
+        view.register_observer("view.#", Observer(lambda n: received.append("p"), "p", priority=7))
+        view.notify_observers(Notification("view.priority"))
+        self.assertEqual(received, ["d", "p", "b", "e", "a", "c", "f"])
+
+    def test_mediator_priority(self):
+        """Tests that a Mediator's priority places it ahead of earlier registrations."""
+        view: IView = View.get_instance("ViewTestKey20", lambda k: View(k))
+        received = []
+        view.register_observer(ViewTest.NOTE3, Observer(lambda n: received.append("observer"), self))
+        view.register_mediator(ViewTestMediator10(received))
+
+        view.notify_observers(Notification(ViewTest.NOTE3))
+        self.assertEqual(received, [ViewTestMediator10.NAME, "observer"])
+
+    def test_once_observer(self):
+        """Tests that one-shot observers are notified once and removed from the observer list."""
+        view: View = View.get_instance("ViewTestKey21", lambda k: View(k))
+        received = []
+        view.register_observer("ViewTestOnce", Observer(lambda n: received.append("once"), "once", max_calls=1))
+        view.register_observer("ViewTestOnce", Observer(lambda n: received.append("always"), "always"))
+        view.register_observer("view.#", Observer(lambda n: received.append("pattern"), "pattern", max_calls=1))
+
+        view.notify_observers(Notification("ViewTestOnce"))
+        view.notify_observers(Notification("ViewTestOnce"))
+        view.notify_observers(Notification("view.once"))
+        view.notify_observers(Notification("view.once"))
+        self.assertEqual(received, ["once", "always", "always", "pattern"])
+
+        self.assertIsInstance(view.observerMap["ViewTestOnce"], Observer, "Expecting the one-shot observer to be pruned")
+        self.assertNotIn("view.#", view.observerMap, "Expecting the pattern observer to be pruned")
+
+    def test_once_observer_concurrent_dispatch(self):
+        """Tests that a one-shot observer runs exactly once when notified from several threads."""
+        view: IView = View.get_instance("ViewTestKey22", lambda k: View(k))
+        received = []
+        view.register_observer("ViewTestOnceThreads", Observer(received.append, self, max_calls=1))
+
+        threads = [threading.Thread(target=lambda: [view.notify_observers(Notification("ViewTestOnceThreads"))
+                                                    for _ in range(100)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(received), 1, "Expecting exactly one notification")
+        self.assertNotIn("ViewTestOnceThreads", view.observerMap, "Expecting the one-shot observer removed")
+
+    def test_once_observer_removed_on_dispatch(self):
+        """Tests that one-shot response waiters are removed when they fire, with no later dispatch."""
+        view: View = View.get_instance("ViewTestKey33", lambda k: View(k))
+        received = []
+        for index in range(1000):
+            view.register_observer(f"view.response.{index}", Observer(received.append, self, max_calls=1))
+        for index in range(1000):
+            view.notify_observers(Notification(f"view.response.{index}"))
+
+        self.assertEqual(len(received), 1000, "Expecting every waiter notified")
+        self.assertEqual(view.observerMap, {}, "Expecting every waiter removed")
+        self.assertEqual(view.routeMap, {}, "Expecting no stale routes")
+
+        view.register_observer("view.waiter.*", Observer(received.append, self, max_calls=1))
+        view.register_observer("view.other", Observer(received.append, self))
+        view.notify_observers(Notification("view.other"))
+        view.notify_observers(Notification("view.waiter.b"))
+        view.notify_observers(Notification("view.waiter.a"))
+        self.assertEqual(len(received), 1002, "Expecting the pattern waiter notified once")
+        self.assertNotIn("view.waiter.*", view.observerMap, "Expecting the pattern waiter removed")
+        self.assertFalse(view.patternTrie, "Expecting the pattern removed")
+        self.assertIn("view.other", view.routeMap, "Expecting the routes of other names kept")
+
+        waiter = Observer(received.append, self, max_calls=1)
+        view.register_observer("view.other", waiter)
+        view.notify_observers(Notification("view.other"))
+        self.assertIn(waiter, view.observerMap["view.other"], "Expecting a shared list pruned lazily")
+        view.notify_observers(Notification("view.other"))
+        self.assertIsInstance(view.observerMap["view.other"], Observer, "Expecting the waiter pruned by compilation")
+        self.assertEqual(len(received), 1005)
+
+    def test_weak_observer_pruned(self):
+        """Tests that weak observers whose context was collected are pruned during dispatch."""
+        view: View = View.get_instance("ViewTestKey23", lambda k: View(k))
+        mediator = Mediator("ViewTestWeak", self)
+        view.register_observer("ViewTestWeak", Observer(mediator.handle_notification, mediator, weak=True))
+        view.register_observer("ViewTestWeak", Observer(self.view_test_method, self))
+
+        view.notify_observers(Notification("ViewTestWeak", 1))
+        self.assertEqual(len(view.observerMap["ViewTestWeak"]), 2, "Expecting 2 observers")
+
+        del mediator
+        gc.collect()
+        view.notify_observers(Notification("ViewTestWeak", 2))
+        view.notify_observers(Notification("ViewTestWeak", 3))
+        self.assertEqual(self.viewTestVar, 3, "Expecting viewTestVar == 3")
+        self.assertIsInstance(view.observerMap["ViewTestWeak"], Observer, "Expecting the weak observer to be pruned")
+
+    def test_single_observer_unwrapped(self):
+        """Tests that a lone observer is stored and routed unwrapped, and promoted on a second registration."""
+        view: View = View.get_instance("ViewTestKey24", lambda k: View(k))
+        observer = Observer(self.view_test_method, self)
+        view.register_observer("ViewTestSingle", observer)
+        view.notify_observers(Notification("ViewTestSingle", 1))
+        self.assertIs(view.observerMap["ViewTestSingle"], observer, "Expecting the observer itself")
+        self.assertEqual(view.routeMap["ViewTestSingle"], self.view_test_method, "Expecting a single callable route")
+
+        received = []
+        view.register_observer("ViewTestSingle", Observer(received.append, received))
+        view.notify_observers(Notification("ViewTestSingle", 2))
+        self.assertEqual(len(view.observerMap["ViewTestSingle"]), 2, "Expecting a list of 2 observers")
+        self.assertEqual(self.viewTestVar, 2, "Expecting viewTestVar == 2")
+        self.assertEqual(len(received), 1, "Expecting the second observer to be notified")
+
+        view.remove_observer("ViewTestSingle", self)
+        self.assertIsInstance(view.observerMap["ViewTestSingle"], Observer, "Expecting the list to be unwrapped")
+        view.remove_observer("ViewTestSingle", received)
+        self.assertNotIn("ViewTestSingle", view.observerMap)
+
+    def test_remove_mediator_uses_registered_interests(self):
+        """Tests that removing a Mediator removes the interests it was registered with, not its current ones."""
+        view: View = View.get_instance("ViewTestKey25", lambda k: View(k))
+        mediator = ViewTestMediator11([ViewTest.NOTE1, (ViewTest.NOTE2, "typeA")])
+        view.register_mediator(mediator)
+
+        mediator.interests = [ViewTest.NOTE3]
+        view.remove_mediator(ViewTestMediator11.NAME)
+        self.assertEqual(view.observerMap, {}, "Expecting no observers left")
+        self.assertEqual(mediator.calls, 1, "Expecting list_notification_interests to be called once")
+
+    def test_add_and_remove_interest(self):
+        """Tests adding and removing interests of a registered Mediator."""
+        view: View = View.get_instance("ViewTestKey26", lambda k: View(k))
+        mediator = ViewTestMediator11([ViewTest.NOTE1])
+        view.register_mediator(mediator)
+
+        view.add_interest(ViewTestMediator11.NAME, ViewTest.NOTE2)
+        view.add_interest(ViewTestMediator11.NAME, (ViewTest.NOTE3, "typeA"))
+        view.add_interest(ViewTestMediator11.NAME, (ViewTest.NOTE3, "typeB"), lambda note: note.body)
+        for name, note_type, body in ((ViewTest.NOTE1, None, None), (ViewTest.NOTE2, None, None),
+                                      (ViewTest.NOTE3, "typeA", None), (ViewTest.NOTE3, "typeB", False),
+                                      (ViewTest.NOTE3, "typeB", True), (ViewTest.NOTE3, None, None)):
+            view.notify_observers(Notification(name, body, note_type))
+        self.assertEqual(mediator.received, [ViewTest.NOTE1, ViewTest.NOTE2, ViewTest.NOTE3, ViewTest.NOTE3])
+
+        view.remove_interest(ViewTestMediator11.NAME, ViewTest.NOTE3)
+        self.assertNotIn(ViewTest.NOTE3, view.observerMap, "Expecting both NOTE3 observers to be removed")
+
+        view.remove_mediator(ViewTestMediator11.NAME)
+        self.assertEqual(view.observerMap, {}, "Expecting no observers left")
+
+    def test_register_mediators(self):
+        """Tests registering several Mediators at once, with on_register called in order."""
+        view: View = View.get_instance("ViewTestKey27", lambda k: View(k))
+        self.counter = 0
+        duplicate = ViewTestMediator7(self)
+        view.register_mediators([ViewTestMediator7(self), ViewTestMediator9(self), duplicate])
+
+        self.assertIsNone(duplicate.multitonKey, "Expecting the duplicate left uninitialized")
+        self.assertTrue(view.has_mediator(ViewTestMediator7.NAME))
+        self.assertTrue(view.has_mediator(ViewTestMediator9.NAME))
+        self.assertIsInstance(view.observerMap[ViewTest.NOTE1], Observer, "Expecting the duplicate to be skipped")
+
+        view.notify_observers(Notification("view.test.one"))
+        view.notify_observers(Notification(ViewTest.NOTE1, 5))
+        view.notify_observers(Notification(ViewTest.NOTE2))
+        self.assertEqual(self.counter, 3, "Expecting counter == 3")
+
+        view.remove_mediator(ViewTestMediator7.NAME)
+        view.remove_mediator(ViewTestMediator9.NAME)
+        self.assertEqual(view.observerMap, {}, "Expecting no observers left")
+
+    def test_register_mediators_on_register_order(self):
+        """Tests that on_register is called in order, once every Mediator of the batch is registered."""
+        view: View = View.get_instance("ViewTestKey28", lambda k: View(k))
+        registered = []
+        view.register_mediators([ViewTestMediator12("first", view, registered),
+                                 ViewTestMediator12("second", view, registered)])
+        self.assertEqual(registered, [("first", True), ("second", True)])
+
+    def test_register_mediator_factory(self):
+        """Tests that a Mediator registered by factory is constructed on its first notification."""
+        view: View = View.get_instance("ViewTestKey29", lambda k: View(k))
+        constructed = []
+
+        def factory():
+            constructed.append(ViewTestMediator11([]))
+            return constructed[-1]
+
+        view.register_mediator_factory(ViewTestMediator11.NAME, [ViewTest.NOTE1, (ViewTest.NOTE2, "typeA")], factory)
+        self.assertTrue(view.has_mediator(ViewTestMediator11.NAME), "Expecting the factory to count as registered")
+        view.notify_observers(Notification(ViewTest.NOTE2, None, "typeB"))
+        self.assertEqual(constructed, [], "Expecting no construction before a matching notification")
+
+        view.notify_observers(Notification(ViewTest.NOTE1))
+        view.notify_observers(Notification(ViewTest.NOTE2, None, "typeA"))
+        view.notify_observers(Notification(ViewTest.NOTE1))
+        self.assertEqual(len(constructed), 1, "Expecting a single construction")
+        mediator = constructed[0]
+        self.assertIs(view.retrieve_mediator(ViewTestMediator11.NAME), mediator)
+        self.assertEqual(mediator.multitonKey, "ViewTestKey29", "Expecting the notifier to be initialized")
+        self.assertEqual(mediator.received, [ViewTest.NOTE1, ViewTest.NOTE2, ViewTest.NOTE1])
+        self.assertEqual(view.routeMap[ViewTest.NOTE1], mediator.handle_notification,
+                         "Expecting the route to call the mediator directly")
+
+        view.remove_mediator(ViewTestMediator11.NAME)
+        self.assertEqual(view.observerMap, {}, "Expecting no observers left")
+
+    def test_register_mediator_factory_retrieve_and_remove(self):
+        """Tests that a Mediator registered by factory is constructed by retrieval, and not when removed first."""
+        view: View = View.get_instance("ViewTestKey30", lambda k: View(k))
+        constructed = []
+
+        def factory():
+            constructed.append(ViewTestMediator11([]))
+            return constructed[-1]
+
+        view.register_mediator_factory(ViewTestMediator11.NAME, ["view.lazy.*"], factory)
+        self.assertIsNone(view.remove_mediator(ViewTestMediator11.NAME))
+        self.assertFalse(view.has_mediator(ViewTestMediator11.NAME))
+        self.assertEqual(view.observerMap, {}, "Expecting no observers left")
+
+        view.register_mediator_factory(ViewTestMediator11.NAME, ["view.lazy.*"], factory)
+        mediator = view.retrieve_mediator(ViewTestMediator11.NAME)
+        self.assertIs(mediator, constructed[0])
+        view.notify_observers(Notification("view.lazy.one"))
+        self.assertEqual(mediator.received, ["view.lazy.one"])
+        self.assertEqual(len(constructed), 1, "Expecting a single construction")
+
+    def test_mediator_factory_interests(self):
+        """Tests that adding and removing interests of a pending Mediator does not construct it."""
+        view: View = View.get_instance("ViewTestKey34", lambda k: View(k))
+        constructed = []
+
+        def factory():
+            constructed.append(ViewTestMediator11([]))
+            return constructed[-1]
+
+        view.register_mediator_factory(ViewTestMediator11.NAME, [ViewTest.NOTE1], factory)
+        view.add_interest(ViewTestMediator11.NAME, ViewTest.NOTE2, lambda note: note.body)
+        view.add_interest(ViewTestMediator11.NAME, ViewTest.NOTE3)
+        view.remove_interest(ViewTestMediator11.NAME, ViewTest.NOTE1)
+        self.assertEqual(constructed, [], "Expecting no construction while editing interests")
+        self.assertEqual(view.mediatorInterests[ViewTestMediator11.NAME], [ViewTest.NOTE2, ViewTest.NOTE3])
+
+        view.notify_observers(Notification(ViewTest.NOTE1))
+        view.notify_observers(Notification(ViewTest.NOTE2, False))
+        self.assertEqual(constructed, [], "Expecting no construction for a removed or guarded interest")
+        self.assertEqual(view.interest_rejections(ViewTestMediator11.NAME), {ViewTest.NOTE2: 1})
+        view.notify_observers(Notification(ViewTest.NOTE2, True))
+        view.notify_observers(Notification(ViewTest.NOTE2, False))
+        view.notify_observers(Notification(ViewTest.NOTE3))
+        self.assertEqual(len(constructed), 1, "Expecting a single construction")
+        self.assertEqual(constructed[0].received, [ViewTest.NOTE2, ViewTest.NOTE3])
+        self.assertEqual(view.interest_rejections(ViewTestMediator11.NAME), {ViewTest.NOTE2: 2})
+
+        view.remove_mediator(ViewTestMediator11.NAME)
+        self.assertEqual(view.observerMap, {}, "Expecting no observers left")
+
+    def test_transient_routes_bounded(self):
+        """Tests that the routes of names without observers of their own are cached in a bounded cache."""
+        view: View = View.get_instance("ViewTestKey31", lambda k: View(k))
+        received = []
+        view.register_observer("view.dyn.*", Observer(received.append, received))
+        view.register_observer("view.static", Observer(received.append, received))
+        view.notify_observers(Notification("view.static"))
+        for index in range(View.TRANSIENT_ROUTES * 3):
+            view.notify_observers(Notification(f"view.dyn.{index}"))
+            view.notify_observers(Notification(f"view.none.{index}"))
+
+        self.assertEqual(len(received), View.TRANSIENT_ROUTES * 3 + 1, "Expecting every matching notification")
+        self.assertLessEqual(len(view.routeMap), View.TRANSIENT_ROUTES + 1, "Expecting a bounded route cache")
+        self.assertIn("view.static", view.routeMap, "Expecting the route of an observed name to be kept")
+
+    def test_legacy_interface_implementations(self):
+        """Tests that IObserver and IMediator implementations predating the new members still work."""
+        view: View = View.get_instance("ViewTestKey32", lambda k: View(k))
+        observer = ViewTestLegacyObserver()
+        view.register_observer(ViewTest.NOTE1, observer)
+        view.register_observer(ViewTest.NOTE1, Observer(observer.received.append, self, priority=1))
+        mediator = ViewTestLegacyMediator()
+        view.register_mediator(mediator)
+        view.notify_observers(Notification(ViewTest.NOTE1))
+
+        self.assertEqual(len(observer.received), 2, "Expecting both observers notified")
+        self.assertEqual(mediator.received, [ViewTest.NOTE1])
+        self.assertEqual(mediator.multitonKey, "ViewTestKey32")
+        with self.assertRaises(AttributeError):
+            observer.predicate = bool
+
+    def test_legacy_view_implementation(self):
+        """Tests that an IView implementation predating the new members gets their defaults."""
+        legacy = ViewTestLegacyView()
+        received = []
+        legacy.register_observers([(ViewTest.NOTE1, Observer(received.append, self)),
+                                   (ViewTest.NOTE2, Observer(received.append, self))])
+        legacy.invalidate_route(ViewTest.NOTE1)
+        legacy.notify_observers(Notification(ViewTest.NOTE1))
+        legacy.notify_observers(Notification(ViewTest.NOTE2))
+        self.assertEqual([note.name for note in received], [ViewTest.NOTE1, ViewTest.NOTE2])
+
+        legacy.register_mediator_factory("ViewTestLegacyMediator", [ViewTest.NOTE1], ViewTestLegacyMediator)
+        self.assertTrue(legacy.has_mediator("ViewTestLegacyMediator"), "Expecting the Mediator constructed at once")
+        self.assertEqual(legacy.interest_rejections("ViewTestLegacyMediator"), {})
+        with self.assertRaises(NotImplementedError):
+            legacy.add_interest("ViewTestLegacyMediator", ViewTest.NOTE2)
+
+    def view_test_method2(self, note: INotification):
+        """
+        A utility method to test the invalidation of compiled routes
+        """
+        self.viewTestVar = note.body * 2
+
     def view_test_method(self, note: INotification):
         """
         A utility method to test the notification of Observers by the view
@@ -443,5 +913,192 @@ class ViewTestMediator6(Mediator):
         self.view_component.counter += 1
 
 
+class ViewTestMediator7(Mediator):
+    # The Mediator name
+    NAME = "ViewTestMediator7"
+
+    def __init__(self, view: object):
+        super().__init__(ViewTestMediator7.NAME, view)
+
+    def list_notification_interests(self) -> [str]:
+        return ["view.test.*"]
+
+    def handle_notification(self, notification: INotification):
+        self.view_component.counter += 1
+
+
+class ViewTestMediator8(Mediator):
+    # The Mediator name
+    NAME = "ViewTestMediator8"
+
+    def __init__(self, view: object):
+        super().__init__(ViewTestMediator8.NAME, view)
+
+    def list_notification_interests(self):
+        return [(ViewTest.NOTE1, "typeA"), (ViewTest.NOTE1, "typeB"), ViewTest.NOTE2]
+
+    def handle_notification(self, notification: INotification):
+        self.view_component.counter += 1
+
+
+class ViewTestMediator9(Mediator):
+    # The Mediator name
+    NAME = "ViewTestMediator9"
+
+    def __init__(self, view: object):
+        super().__init__(ViewTestMediator9.NAME, view)
+
+    def list_notification_interests(self) -> [str]:
+        return [ViewTest.NOTE1, ViewTest.NOTE2]
+
+    def list_notification_predicates(self):
+        return {ViewTest.NOTE1: lambda note: note.body > 3}
+
+    def handle_notification(self, notification: INotification):
+        self.view_component.counter += 1
+
+
+class ViewTestMediator10(Mediator):
+    # The Mediator name
+    NAME = "ViewTestMediator10"
+    PRIORITY = 10
+
+    def __init__(self, view: object):
+        super().__init__(ViewTestMediator10.NAME, view)
+
+    def list_notification_interests(self) -> [str]:
+        return [ViewTest.NOTE3]
+
+    def handle_notification(self, notification: INotification):
+        self.view_component.append(self.mediator_name)
+
+
+class ViewTestMediator11(Mediator):
+    # The Mediator name
+    NAME = "ViewTestMediator11"
+
+    def __init__(self, interests: list):
+        super().__init__(ViewTestMediator11.NAME)
+        self.interests = interests
+        self.calls = 0
+        self.received = []
+
+    def list_notification_interests(self):
+        self.calls += 1
+        return self.interests
+
+    def handle_notification(self, notification: INotification):
+        self.received.append(notification.name)
+
+
+class ViewTestMediator12(Mediator):
+    def __init__(self, name: str, view: IView, registered: list):
+        super().__init__(name)
+        self.view = view
+        self.registered = registered
+
+    def on_register(self):
+        self.registered.append((self.mediator_name, self.view.has_mediator("second")))
+
+
+class ViewTestLegacyObserver(IObserver):
+    """
+    An IObserver implementation used by ViewTest, implementing only the original members.
+    """
+
+    def __init__(self):
+        self.received = []
+
+    @property
+    def notify_method(self):
+        return self.received.append
+
+    @notify_method.setter
+    def notify_method(self, value):
+        pass
+
+    @property
+    def notify_context(self):
+        return self
+
+    @notify_context.setter
+    def notify_context(self, value):
+        pass
+
+    def notify_observer(self, notification: INotification):
+        self.received.append(notification)
+
+    def compare_notify_context(self, obj) -> bool:
+        return obj is self
+
+
+class ViewTestLegacyView(IView):
+    """
+    An IView implementation used by ViewTest, implementing only the original members.
+    """
+
+    def __init__(self):
+        self.observers = {}
+        self.mediators = {}
+
+    def register_observer(self, notification_name: str, observer: IObserver):
+        self.observers.setdefault(notification_name, []).append(observer)
+
+    def notify_observers(self, notification: INotification):
+        for observer in self.observers.get(notification.name, []):
+            observer.notify_observer(notification)
+
+    def remove_observer(self, notification_name: str, notify_context):
+        pass
+
+    def register_mediator(self, mediator: IMediator):
+        self.mediators[mediator.mediator_name] = mediator
+
+    def retrieve_mediator(self, mediator_name: str):
+        return self.mediators.get(mediator_name)
+
+    def has_mediator(self, mediator_name: str) -> bool:
+        return mediator_name in self.mediators
+
+    def remove_mediator(self, mediator_name: str):
+        return self.mediators.pop(mediator_name, None)
+
+
+class ViewTestLegacyMediator(IMediator):
+    """
+    An IMediator implementation used by ViewTest, implementing only the original members.
+    """
+
+    def __init__(self):
+        self.multitonKey = None
+        self.received = []
+
+    @property
+    def mediator_name(self) -> str:
+        return "ViewTestLegacyMediator"
+
+    @property
+    def view_component(self):
+        return None
+
+    def list_notification_interests(self):
+        return [ViewTest.NOTE1]
+
+    def handle_notification(self, notification: INotification):
+        self.received.append(notification.name)
+
+    def on_register(self):
+        pass
+
+    def on_remove(self):
+        pass
+
+    def initialize_notifier(self, key: str):
+        self.multitonKey = key
+
+    def send_notification(self, notification_name: str, body=None, type=None):
+        pass
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -58,6 +58,49 @@ class MacroCommandTest(unittest.TestCase):
         self.assertTrue(vo.result1 == 10)
         self.assertTrue(vo.result2 == 25)
 
+    def test_macro_command_plan(self):
+        """Tests that the SubCommands are collected once per class, and not consumed by execution"""
+        MacroCommandTestPlanCommand.initialized = 0
+        vo = MacroCommandTestVO(5)
+        note = Notification("MacroCommandTest", vo)
+
+        for _ in range(3):
+            command = MacroCommandTestPlanCommand()
+            command.initialize_notifier("MacroCommandTestKey2")
+            command.execute(note)
+            command.execute(note)
+        self.assertEqual(MacroCommandTestPlanCommand.initialized, 1, "Expecting the plan compiled once")
+        self.assertIsInstance(command.plan, tuple, "Expecting an immutable plan")
+        self.assertEqual(len(command.plan), 2)
+        self.assertTrue(vo.result1 == 10)
+        self.assertTrue(vo.result2 == 25)
+        self.assertNotIn("_plan", MacroCommand.__dict__, "Expecting no plan on the base class")
+
+        command = MacroCommandTestPlanCommand()
+        command.add_subcommand(lambda: MacroCommandTestSub2Command())
+        command.initialize_notifier("MacroCommandTestKey2")
+        command.execute(Notification("MacroCommandTest", MacroCommandTestVO(3)))
+        self.assertEqual(len(command.plan), 2, "Expecting instance SubCommands kept out of the plan")
+
+    def test_macro_command_dynamic_plan(self):
+        """Tests that a MacroCommand is initialized for every execution by default"""
+        MacroCommandTestDynamicCommand.initialized = 0
+        command = MacroCommandTestDynamicCommand()
+        command.initialize_notifier("MacroCommandTestKey3")
+        command.execute(Notification("MacroCommandTest", MacroCommandTestVO(5)))
+        command.execute(Notification("MacroCommandTest", MacroCommandTestVO(5)))
+        self.assertEqual(MacroCommandTestDynamicCommand.initialized, 2)
+        self.assertNotIn("_plan", MacroCommandTestDynamicCommand.__dict__)
+
+    def test_macro_command_instance_subcommands(self):
+        """Tests that SubCommands closing over the instance see the state of each instance by default"""
+        executed = []
+        for tag in ("first", "second"):
+            command = MacroCommandTestInstanceCommand(tag, executed)
+            command.initialize_notifier("MacroCommandTestKey4")
+            command.execute(Notification("MacroCommandTest"))
+        self.assertEqual(executed, ["first", "second"])
+
 
 class MacroCommandTestCommand(MacroCommand):
 
@@ -67,6 +110,53 @@ class MacroCommandTestCommand(MacroCommand):
         self.add_subcommand(lambda: MacroCommandTestSub2Command())
 
 
+class MacroCommandTestPlanCommand(MacroCommandTestCommand):
+    """A MacroCommand subclass counting the initializations of its plan."""
+    COMPILE_PLAN = True
+    initialized = 0
+
+    def initialize_macro_command(self):
+        """Count the initialization and add the 2 SubCommands."""
+        MacroCommandTestPlanCommand.initialized += 1
+        super().initialize_macro_command()
+
+
+class MacroCommandTestDynamicCommand(MacroCommandTestCommand):
+    """A MacroCommand subclass initialized for every execution."""
+    initialized = 0
+
+    def initialize_macro_command(self):
+        """Count the initialization and add the 2 SubCommands."""
+        MacroCommandTestDynamicCommand.initialized += 1
+        super().initialize_macro_command()
+
+
+class MacroCommandTestInstanceCommand(MacroCommand):
+    """A MacroCommand subclass whose SubCommand closes over the instance."""
+
+    def __init__(self, tag: str, executed: list):
+        super().__init__()
+        self.tag = tag
+        self.executed = executed
+
+    def initialize_macro_command(self):
+        """Add a SubCommand recording the tag of this instance."""
+        self.add_subcommand(lambda: MacroCommandTestRecordCommand(self.tag, self.executed))
+
+
+class MacroCommandTestRecordCommand(SimpleCommand):
+    """A SimpleCommand subclass recording a tag, used by MacroCommandTestInstanceCommand."""
+
+    def __init__(self, tag: str, executed: list):
+        super().__init__()
+        self.tag = tag
+        self.executed = executed
+
+    def execute(self, notification: INotification):
+        """Record the tag."""
+        self.executed.append(self.tag)
+
+
 class MacroCommandTestSub1Command(SimpleCommand):
     def execute(self, notification: INotification):
         """
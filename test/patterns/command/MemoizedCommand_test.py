@@ -0,0 +1,86 @@
+# MemoizedCommand_test.py
+# PureMVC Python Multicore
+
+# Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
+# Your reuse is governed by the BSD 3-Clause License
+
+import time
+import unittest
+
+from puremvc.interfaces import INotification
+from puremvc.patterns.command import CommandMemo, MemoizedCommand
+from puremvc.patterns.facade import Facade
+from puremvc.patterns.mediator import Mediator
+
+
+class MemoizedCommandTest(unittest.TestCase):
+    """Test the PureMVC MemoizedCommand class."""
+
+    def test_memoized_command_replays_outcome(self):
+        """Tests that a MemoizedCommand computes once per key, and replays its outcome to the observers"""
+        facade = Facade.get_instance("MemoizedCommandTestKey1", lambda k: Facade(k))
+        mediator = MemoizedCommandTestMediator()
+        facade.register_mediator(mediator)
+        facade.register_command("MemoizedCommandTest", lambda: MemoizedCommandTestCommand())
+        MemoizedCommandTestCommand.computed = 0
+
+        for _ in range(3):
+            facade.send_notification("MemoizedCommandTest", 5)
+        facade.send_notification("MemoizedCommandTest", 6)
+        self.assertEqual(MemoizedCommandTestCommand.computed, 2, "Expecting one computation per body")
+        self.assertEqual(mediator.results, [10, 10, 10, 12], "Expecting the outcome replayed")
+
+        stats = facade.memo_stats()[f"{__name__}.MemoizedCommandTestCommand"]
+        self.assertEqual(stats, {"hits": 2, "misses": 2, "evictions": 0, "expirations": 0, "entries": 2})
+
+        facade.send_notification("MemoizedCommandTest", [1])
+        self.assertEqual(MemoizedCommandTestCommand.computed, 3, "Expecting an unhashable body computed")
+        Facade.remove_core("MemoizedCommandTestKey1")
+
+    def test_command_memo_eviction_and_ttl(self):
+        """Tests that a CommandMemo evicts its least recently used entry, and expires entries after the TTL"""
+        memo = CommandMemo(2)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        self.assertEqual(memo.get("a"), 1)
+        memo.put("c", 3)
+        self.assertIs(memo.get("b"), CommandMemo.MISS, "Expecting the least recently used entry evicted")
+        self.assertEqual(memo.get("a"), 1)
+        self.assertEqual(memo.stats()["evictions"], 1)
+
+        memo = CommandMemo(2, ttl=0.01)
+        memo.put("a", 1)
+        time.sleep(0.02)
+        self.assertIs(memo.get("a"), CommandMemo.MISS, "Expecting the entry expired")
+        self.assertEqual(memo.stats()["expirations"], 1)
+
+        with self.assertRaises(ValueError):
+            CommandMemo(0)
+
+
+class MemoizedCommandTestCommand(MemoizedCommand):
+    """A MemoizedCommand subclass doubling the body."""
+    computed = 0
+
+    def compute(self, notification: INotification):
+        """Send twice the body onward"""
+        MemoizedCommandTestCommand.computed += 1
+        self.send_notification("MemoizedCommandTestResult", notification.body * 2)
+
+
+class MemoizedCommandTestMediator(Mediator):
+    """A Mediator subclass recording the results of MemoizedCommandTestCommand."""
+
+    def __init__(self):
+        super().__init__("MemoizedCommandTestMediator")
+        self.results = []
+
+    def list_notification_interests(self):
+        return ["MemoizedCommandTestResult"]
+
+    def handle_notification(self, notification: INotification):
+        self.results.append(notification.body)
+
+
+if __name__ == '__main__':
+    unittest.main()
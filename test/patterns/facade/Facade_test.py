@@ -5,12 +5,14 @@
 # Your reuse is governed by the BSD 3-Clause License
 
 import unittest
+import warnings
 from typing import List
 
 from puremvc.interfaces import IFacade, INotification, IProxy
 from puremvc.patterns.command import SimpleCommand
 from puremvc.patterns.facade import Facade
 from puremvc.patterns.mediator import Mediator
+from puremvc.patterns.observer import Notification
 from puremvc.patterns.proxy import Proxy
 
 
@@ -214,6 +216,54 @@ class FacadeTest(unittest.TestCase):
         self.assertFalse(Facade.has_core("FacadeTestKey11"),
                          "Expecting facade.has_core('FacadeTestKey11') == false")
 
+    def test_dispatch_reused_notification(self):
+        """Tests dispatching one reused Notification with a different body per send."""
+        facade: IFacade = Facade.get_instance("FacadeTestKey12", lambda k: Facade(k))
+        facade.register_command("FacadeTestNote", lambda: FacadeTestCommand())
+
+        note = Notification("FacadeTestNote")
+        results = []
+        for data in range(5):
+            note.body = FacadeTestVO(data)
+            facade.dispatch(note)
+            results.append(note.body.result)
+
+        # test assertions
+        self.assertEqual([0, 2, 4, 6, 8], results, "Expecting each body to be handled")
+
+    def test_dispatch_retained_notification(self):
+        """Tests that an observer retaining a dispatched Notification is reported."""
+        facade: IFacade = Facade.get_instance("FacadeTestKey13", lambda k: Facade(k))
+        retained = []
+        facade.register_command("FacadeTestNote", lambda: FacadeTestRetainCommand(retained))
+
+        note = Notification("FacadeTestNote")
+        if __debug__:
+            with self.assertWarns(RuntimeWarning) as context:
+                facade.dispatch(note)
+            self.assertEqual(Facade.RETAINED_MSG, str(context.warning))
+        else:
+            facade.dispatch(note)
+        self.assertIs(note, retained[0], "Expecting the command to have retained the notification")
+
+    def test_dispatch_offloaded_commands(self):
+        """Tests that a Notification dispatched to queued Commands is copied, so each keeps its body."""
+        facade: IFacade = Facade.get_instance("FacadeTestKey14", lambda k: Facade(k))
+        retained = []
+        facade.register_command("FacadeTestNote", lambda: FacadeTestRetainCommand(retained))
+        facade.start_queue(workers=1)
+
+        note = Notification("FacadeTestNote")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for data in range(5):
+                note.body = data
+                facade.dispatch(note)
+            facade.join_queue()
+        facade.stop_queue()
+        self.assertEqual([data for data in range(5)], [copy.body for copy in retained], "Expecting each body kept")
+        self.assertNotIn(note, retained, "Expecting copies of the notification")
+
 
 class FacadeTestCommand(SimpleCommand):
     def execute(self, notification: INotification):
@@ -228,6 +278,16 @@ class FacadeTestCommand(SimpleCommand):
         vo.result = 2 * vo.input
 
 
+class FacadeTestRetainCommand(SimpleCommand):
+    def __init__(self, retained: List[INotification]):
+        super().__init__()
+        self.retained = retained
+
+    def execute(self, notification: INotification):
+        """Keep a reference to the notification, breaking the dispatch contract."""
+        self.retained.append(notification)
+
+
 class FacadeTestVO:
     def __init__(self, data: int):
         """
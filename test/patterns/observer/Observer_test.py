@@ -4,6 +4,7 @@
 # Copyright(c) 2025 Saad Shams <saad.shams@puremvc.org>
 # Your reuse is governed by the BSD 3-Clause License
 
+import gc
 import unittest
 
 from puremvc.interfaces import INotification
@@ -71,6 +72,57 @@ class ObserverTest(unittest.TestCase):
         self.assertFalse(observer.compare_notify_context(neg), "observer.compare_notify_context(neg) == False")
         self.assertTrue(observer.compare_notify_context(self), "observer.compare_notify_context(self) == True")
 
+    def test_notify_type(self):
+        """Tests that an observer restricted to a type ignores other types."""
+        observer = Observer(self.observer_test_method, self, "typeA")
+        self.observer_test_var = 0
+
+        observer.notify_observer(Notification("ObserverTestNote", 5, "typeB"))
+        self.assertEqual(self.observer_test_var, 0, "Expecting observer_test_var == 0")
+
+        observer.notify_observer(Notification("ObserverTestNote", 5, "typeA"))
+        self.assertEqual(self.observer_test_var, 5, "Expecting observer_test_var == 5")
+
+    def test_predicate(self):
+        """Tests that notifications failing the predicate are dropped and counted."""
+        observer = Observer(self.observer_test_method, self, predicate=lambda note: note.body > 3)
+        self.observer_test_var = 0
+
+        observer.notify_observer(Notification("ObserverTestNote", 2))
+        self.assertEqual(self.observer_test_var, 0, "Expecting observer_test_var == 0")
+        self.assertEqual(observer.rejections, 1, "Expecting observer.rejections == 1")
+
+        observer.notify_observer(Notification("ObserverTestNote", 5))
+        self.assertEqual(self.observer_test_var, 5, "Expecting observer_test_var == 5")
+        self.assertEqual(observer.rejections, 1, "Expecting observer.rejections == 1")
+
+    def test_max_calls(self):
+        """Tests that an observer expires after handling max_calls notifications."""
+        observer = Observer(self.observer_test_method, self, max_calls=2)
+        self.assertFalse(observer.expired, "Expecting observer.expired == False")
+
+        observer.notify_observer(Notification("ObserverTestNote", 1))
+        observer.notify_observer(Notification("ObserverTestNote", 2))
+        self.assertTrue(observer.expired, "Expecting observer.expired == True")
+
+        observer.notify_observer(Notification("ObserverTestNote", 3))
+        self.assertEqual(self.observer_test_var, 2, "Expecting observer_test_var == 2")
+
+    def test_weak_observer(self):
+        """Tests that a weak observer does not keep its interested object alive."""
+        context = ObserverTestContext()
+        observer = Observer(context.handle, context, weak=True)
+
+        observer.notify_observer(Notification("ObserverTestNote", 5))
+        self.assertEqual(context.received, 5, "Expecting context.received == 5")
+        self.assertTrue(observer.compare_notify_context(context), "Expecting the context to compare equal")
+
+        del context
+        gc.collect()
+        self.assertTrue(observer.expired, "Expecting observer.expired == True")
+        self.assertIsNone(observer.notify_method, "Expecting observer.notify_method is None")
+        self.assertIsNone(observer.notify_context, "Expecting observer.notify_context is None")
+
     def observer_test_method(self, notification: INotification):
         """A function that is used as the observer notification
         method. It multiplies the input number by the
@@ -80,5 +132,15 @@ class ObserverTest(unittest.TestCase):
         self.observer_test_var = notification.body
 
 
+class ObserverTestContext:
+    """An interested object used by ObserverTest."""
+
+    def __init__(self):
+        self.received = None
+
+    def handle(self, notification: INotification):
+        self.received = notification.body
+
+
 if __name__ == "__main__":
     unittest.main()